@@ -16,8 +16,27 @@ Architecture:
 
 from flask import Flask
 from flask_cors import CORS
+from pathlib import Path
 import os
 
+# Set once the data directory tree has been created in this process, so
+# repeated create_app() calls (tests, worker re-creation) skip the mkdirs
+_DATA_DIRS_READY = False
+
+# Uppercase Config attributes, resolved on the first create_app() call and
+# copied into every later app instead of re-running from_object()
+_CONFIG_SNAPSHOT = None
+
+# Blueprints registered by create_app(), with their URL prefixes
+_BLUEPRINT_PREFIXES = (
+    ('main_bp', None),                        # Main routes (index page, etc.)
+    ('raw_data_bp', '/api/raw'),              # Raw Data Tab API endpoints
+    ('cleaning_bp', '/api/cleaning'),         # Cleaning Tab API endpoints
+    ('chunking_bp', '/api/chunking'),         # Chunking Tab API endpoints
+    ('admin_bp', '/api/admin')                # Admin approval endpoints
+)
+
+
 def create_app(config_name=None):
     """
     Application factory function.
@@ -50,33 +69,34 @@ def create_app(config_name=None):
     # Load Configuration
     # -------------------------------------------------------------------------
     # Import and apply configuration settings
-    from .config import Config
-    app.config.from_object(Config)
+    global _CONFIG_SNAPSHOT
+    if _CONFIG_SNAPSHOT is None:
+        from .config import Config
+        _CONFIG_SNAPSHOT = {k: getattr(Config, k) for k in dir(Config) if k.isupper()}
+    app.config.update(_CONFIG_SNAPSHOT)
     
     # -------------------------------------------------------------------------
     # Initialize Extensions
     # -------------------------------------------------------------------------
     # Enable CORS for API access from different origins
     # This is important if the frontend is served from a different domain
-    CORS(app)
+    if app.config.get('ENABLE_CORS', True):
+        CORS(app)
     
     # -------------------------------------------------------------------------
     # Ensure Data Directories Exist
     # -------------------------------------------------------------------------
     # Create the directory structure for storing files locally
-    # before they are pushed to HuggingFace
-    data_dirs = [
-        'data/pending/raw',
-        'data/pending/cleaned', 
-        'data/pending/chunked',
-        'data/approved/raw',
-        'data/approved/cleaned',
-        'data/approved/chunked'
-    ]
-    
-    for dir_path in data_dirs:
-        full_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), dir_path)
-        os.makedirs(full_path, exist_ok=True)
+    # before they are pushed to HuggingFace. Only the six leaf directories
+    # are created; mkdir(parents=True) takes care of data/ and the
+    # pending/approved parents in the same call.
+    global _DATA_DIRS_READY
+    if not _DATA_DIRS_READY:
+        root = os.path.dirname(os.path.dirname(__file__))
+        for state in ('pending', 'approved'):
+            for stage in ('raw', 'cleaned', 'chunked'):
+                Path(root, 'data', state, stage).mkdir(parents=True, exist_ok=True)
+        _DATA_DIRS_READY = True
     
     # -------------------------------------------------------------------------
     # Register Blueprints (Route Modules)
@@ -84,22 +104,15 @@ def create_app(config_name=None):
     # Blueprints allow us to organize routes into separate modules
     # Each tab in the UI has its own blueprint
     
-    from .routes import main_bp, raw_data_bp, cleaning_bp, chunking_bp, admin_bp
-    
-    # Main routes (index page, etc.)
-    app.register_blueprint(main_bp)
-    
-    # Raw Data Tab API endpoints
-    app.register_blueprint(raw_data_bp, url_prefix='/api/raw')
-    
-    # Cleaning Tab API endpoints
-    app.register_blueprint(cleaning_bp, url_prefix='/api/cleaning')
-    
-    # Chunking Tab API endpoints
-    app.register_blueprint(chunking_bp, url_prefix='/api/chunking')
+    # Blueprints are resolved lazily from the routes package, so each route
+    # module is imported right before it is registered
+    from . import routes
     
-    # Admin approval endpoints
-    app.register_blueprint(admin_bp, url_prefix='/api/admin')
+    # With DISABLE_ADMIN the admin module is never even imported
+    for name, url_prefix in _BLUEPRINT_PREFIXES:
+        if name == 'admin_bp' and app.config.get('DISABLE_ADMIN'):
+            continue
+        app.register_blueprint(getattr(routes, name), url_prefix=url_prefix)
     
     # -------------------------------------------------------------------------
     # Return Configured App
@@ -14,10 +14,40 @@ Configuration Categories:
 """
 
 import os
+import sys
+from types import MappingProxyType, SimpleNamespace
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
-load_dotenv()
+# Set SKIP_DOTENV=1 in production, where the environment is provided by the
+# orchestrator. The _DOTENV_LOADED marker is inherited by forked workers and
+# reloader children, which already see the parent's loaded values.
+if os.getenv('SKIP_DOTENV') != '1' and not os.environ.get('_DOTENV_LOADED'):
+    load_dotenv()
+    os.environ['_DOTENV_LOADED'] = '1'
+
+
+# -----------------------------------------------------------------------------
+# Storage Paths
+# -----------------------------------------------------------------------------
+# All data paths are joined exactly once here, when the module is imported,
+# and the Config class below simply references the resulting strings.
+
+_BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_DATA_DIR = os.path.join(_BASE_DIR, 'data')
+
+_PATHS = SimpleNamespace(
+    base=_BASE_DIR,
+    data=_DATA_DIR,
+    pending_raw=os.path.join(_DATA_DIR, 'pending', 'raw'),
+    pending_cleaned=os.path.join(_DATA_DIR, 'pending', 'cleaned'),
+    pending_chunked=os.path.join(_DATA_DIR, 'pending', 'chunked'),
+    approved_raw=os.path.join(_DATA_DIR, 'approved', 'raw'),
+    approved_cleaned=os.path.join(_DATA_DIR, 'approved', 'cleaned'),
+    approved_chunked=os.path.join(_DATA_DIR, 'approved', 'chunked'),
+    state=os.path.join(_DATA_DIR, '.state'),
+    chunk_counters=os.path.join(_DATA_DIR, '.state', 'chunk_counters')
+)
 
 
 class Config:
@@ -41,6 +71,10 @@ class Config:
     # Should be False in production for security
     DEBUG = os.getenv('DEBUG', 'True').lower() == 'true'
     
+    # Enable CORS headers on every response
+    # Can be turned off for API-only deployments behind a gateway
+    ENABLE_CORS = os.getenv('ENABLE_CORS', 'True').lower() == 'true'
+    
     # -------------------------------------------------------------------------
     # HuggingFace Configuration
     # -------------------------------------------------------------------------
@@ -61,18 +95,29 @@ class Config:
     
     # Base directory for all data storage
     # Using absolute path based on project root
-    BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    DATA_DIR = os.path.join(BASE_DIR, 'data')
+    BASE_DIR = _PATHS.base
+    DATA_DIR = _PATHS.data
     
     # Pending files (awaiting admin approval)
-    PENDING_RAW_DIR = os.path.join(DATA_DIR, 'pending', 'raw')
-    PENDING_CLEANED_DIR = os.path.join(DATA_DIR, 'pending', 'cleaned')
-    PENDING_CHUNKED_DIR = os.path.join(DATA_DIR, 'pending', 'chunked')
+    PENDING_RAW_DIR = _PATHS.pending_raw
+    PENDING_CLEANED_DIR = _PATHS.pending_cleaned
+    PENDING_CHUNKED_DIR = _PATHS.pending_chunked
     
     # Approved files (synced with HuggingFace)
-    APPROVED_RAW_DIR = os.path.join(DATA_DIR, 'approved', 'raw')
-    APPROVED_CLEANED_DIR = os.path.join(DATA_DIR, 'approved', 'cleaned')
-    APPROVED_CHUNKED_DIR = os.path.join(DATA_DIR, 'approved', 'chunked')
+    APPROVED_RAW_DIR = _PATHS.approved_raw
+    APPROVED_CLEANED_DIR = _PATHS.approved_cleaned
+    APPROVED_CHUNKED_DIR = _PATHS.approved_chunked
+    
+    # Internal bookkeeping (not data): chunk index counters, push markers
+    STATE_DIR = _PATHS.state
+    
+    # Per-source-file "next chunk index" counters
+    CHUNK_COUNTER_DIR = _PATHS.chunk_counters
+    
+    # Write metadata and chunk files indented for reading by eye
+    # Off by default: the files are machine-read, and compact JSON is
+    # smaller to write, read and parse
+    PRETTY_JSON = os.getenv('PRETTY_JSON', 'False').lower() in ('1', 'true')
     
     # -------------------------------------------------------------------------
     # Admin Configuration
@@ -82,19 +127,25 @@ class Config:
     # IMPORTANT: Change this in production and use proper authentication!
     ADMIN_PASSWORD = os.getenv('ADMIN_PASSWORD', 'admin123')
     
+    # Skip importing and registering the admin blueprint entirely
+    # Useful for collector-only workers that never serve /api/admin
+    DISABLE_ADMIN = os.getenv('DISABLE_ADMIN', 'False').lower() in ('1', 'true')
+    
     # -------------------------------------------------------------------------
     # Supported Languages
     # -------------------------------------------------------------------------
     
     # List of supported languages with their codes
-    SUPPORTED_LANGUAGES = {
+    # Read-only, with interned codes so membership checks hit the identity
+    # fast path; use dict() on it where a plain dict is needed (e.g. JSON)
+    SUPPORTED_LANGUAGES = MappingProxyType({sys.intern(code): name for code, name in {
         'ta': 'Tamil',
         'en': 'English',
         'hi': 'Hindi',
         'te': 'Telugu',
         'ml': 'Malayalam',
         'kn': 'Kannada'
-    }
+    }.items()})
     
     # Default language for new submissions
     DEFAULT_LANGUAGE = 'ta'
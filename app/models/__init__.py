@@ -8,12 +8,15 @@ Models:
     - RawDataSchema: Schema for raw data submissions
     - CleanedDataSchema: Schema for cleaned data
     - ChunkSchema: Schema for chunk objects
+    - new_id: Time-ordered submission IDs
+    - now_iso: Submission/approval timestamps
+    - chunk_id_prefix: Shared part of a source file's chunk IDs
 
 These schemas define the structure and validation rules for data
 flowing through the platform.
 =============================================================================
 """
 
-from .schemas import RawDataSchema, CleanedDataSchema, ChunkSchema
+from .schemas import RawDataSchema, CleanedDataSchema, ChunkSchema, chunk_id_prefix, new_id, now_iso
 
-__all__ = ['RawDataSchema', 'CleanedDataSchema', 'ChunkSchema']
+__all__ = ['RawDataSchema', 'CleanedDataSchema', 'ChunkSchema', 'chunk_id_prefix', 'new_id', 'now_iso']
@@ -17,13 +17,103 @@ Each schema includes:
 =============================================================================
 """
 
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from typing import Optional, List
-from datetime import datetime
+from functools import lru_cache
+import os
+import re
+import sys
+import time
 import uuid
 
+from ..config import Config
 
-@dataclass
+
+# -----------------------------------------------------------------------------
+# Validation Constants
+# -----------------------------------------------------------------------------
+# Built once from Config so schema validation and the frontend config
+# endpoint share a single source of truth, with O(1) membership tests.
+_VALID_LANGUAGES = frozenset(Config.SUPPORTED_LANGUAGES)
+_VALID_CATEGORIES = frozenset(Config.CATEGORIES)
+
+# Minimum lengths enforced by validate()
+_MIN_FILENAME_LENGTH = 3
+_MIN_CONTENT_LENGTH = 50
+_MIN_CHUNK_TEXT_LENGTH = 20
+
+# Filenames: letters, digits, underscores and hyphens, with at least one
+# letter or digit (\w is Unicode-aware, like str.isalnum, so Tamil names pass)
+_FILENAME_RE = re.compile(r'[\w-]*[^\W_][\w-]*')
+
+_FILENAME_LENGTH_ERROR = f'Filename must be at least {_MIN_FILENAME_LENGTH} characters'
+_FILENAME_CHARS_ERROR = 'Filename can only contain letters, numbers, underscores, and hyphens'
+_CONTENT_LENGTH_ERROR = f'Content must be at least {_MIN_CONTENT_LENGTH} characters'
+
+
+def new_id() -> str:
+    """
+    Generate a time-ordered UUID (version 7 layout) for a submission.
+    
+    The first 48 bits are the Unix time in milliseconds, so IDs sort by
+    creation time; the remaining 74 bits are random. The string form is
+    the same as uuid4's, so existing consumers of 'id' are unaffected.
+    
+    Returns:
+        str: Canonical UUID string
+    """
+    ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), 'big')
+    value = (
+        (ms & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76                             # version 7
+        | (rand >> 62 & 0xFFF) << 64            # rand_a (12 bits)
+        | 0b10 << 62                            # RFC 4122 variant
+        | (rand & 0x3FFF_FFFF_FFFF_FFFF)        # rand_b (62 bits)
+    )
+    return str(uuid.UUID(int=value))
+
+
+# (Unix second, its formatted local date and time) for now_iso()
+_now_prefix = (None, '')
+
+
+def now_iso() -> str:
+    """
+    Current local time as an ISO 8601 string, like datetime.now().isoformat().
+    
+    The date-and-time part is formatted once per second and reused, so
+    most calls only append the microseconds. Microseconds are always
+    present, so every timestamp has the same width and sorts as text.
+    
+    Returns:
+        str: Timestamp in the form YYYY-MM-DDTHH:MM:SS.ffffff
+    """
+    global _now_prefix
+    seconds, ns = divmod(time.time_ns(), 1_000_000_000)
+    cached = _now_prefix
+    if cached[0] != seconds:
+        cached = _now_prefix = (seconds, time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(seconds)))
+    return f'{cached[1]}.{ns // 1000:06d}'
+
+
+@lru_cache(maxsize=4096)
+def chunk_id_prefix(language: str, category: str, source_file: str) -> str:
+    """
+    Build the chunk ID prefix shared by every chunk of a source file.
+    
+    Only the chunk index varies between chunks of the same file, so the
+    shortened category/filename part is computed once and reused.
+    
+    Returns:
+        str: Prefix in the form {lang}_{category_short}_{filename_short}_
+    """
+    cat_short = category[:3]
+    file_short = source_file.replace('_', '')[:10]
+    return f"{language}_{cat_short}_{file_short}_"
+
+
+@dataclass(slots=True)
 class RawDataSchema:
     """
     Schema for raw data submissions.
@@ -49,31 +139,46 @@ class RawDataSchema:
     language: str
     source: str
     content: str
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=new_id)
     content_length: int = field(default=0)
-    submitted_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    submitted_at: str = field(default_factory=now_iso)
     submitted_by: str = field(default='collector')
     status: str = field(default='pending')
     approved_at: Optional[str] = field(default=None)
     approved_by: Optional[str] = field(default=None)
     
     def __post_init__(self):
-        """Calculate content length after initialization."""
-        if self.content:
+        """Fill in content length (unless given) and intern the language code."""
+        if self.content_length == 0 and self.content:
             self.content_length = len(self.content)
+        # Only plain strings can be interned; anything else is left for
+        # validate() to report as an invalid language code
+        if type(self.language) is str:
+            self.language = sys.intern(self.language)
     
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
-        return asdict(self)
+        data = self.to_metadata()
+        data['content'] = self.content
+        return data
     
     def to_metadata(self) -> dict:
         """
         Convert to metadata dictionary (without content).
         Used for .meta.json files.
         """
-        data = self.to_dict()
-        del data['content']
-        return data
+        return {
+            'filename': self.filename,
+            'language': self.language,
+            'source': self.source,
+            'id': self.id,
+            'content_length': self.content_length,
+            'submitted_at': self.submitted_at,
+            'submitted_by': self.submitted_by,
+            'status': self.status,
+            'approved_at': self.approved_at,
+            'approved_by': self.approved_by
+        }
     
     @classmethod
     def from_dict(cls, data: dict) -> 'RawDataSchema':
@@ -87,24 +192,27 @@ class RawDataSchema:
         Returns:
             List of error messages (empty if valid)
         """
+        filename = self.filename or ''
+        content = self.content or ''
+        
         errors = []
         
-        if not self.filename or len(self.filename) < 3:
-            errors.append('Filename must be at least 3 characters')
+        if len(filename) < _MIN_FILENAME_LENGTH:
+            errors.append(_FILENAME_LENGTH_ERROR)
         
-        if not self.filename.replace('_', '').replace('-', '').isalnum():
-            errors.append('Filename can only contain letters, numbers, underscores, and hyphens')
+        if not _FILENAME_RE.fullmatch(filename):
+            errors.append(_FILENAME_CHARS_ERROR)
         
-        if not self.content or len(self.content) < 50:
-            errors.append('Content must be at least 50 characters')
+        if len(content) < _MIN_CONTENT_LENGTH:
+            errors.append(_CONTENT_LENGTH_ERROR)
         
-        if self.language not in ['ta', 'en', 'hi', 'te', 'ml', 'kn']:
+        if self.language not in _VALID_LANGUAGES:
             errors.append('Invalid language code')
         
         return errors
 
 
-@dataclass
+@dataclass(slots=True)
 class CleanedDataSchema:
     """
     Schema for cleaned data.
@@ -129,29 +237,45 @@ class CleanedDataSchema:
     content: str
     language: str = field(default='ta')
     source: str = field(default='unknown')
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=new_id)
     original_raw_id: Optional[str] = field(default=None)
     content_length: int = field(default=0)
-    submitted_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    submitted_at: str = field(default_factory=now_iso)
     submitted_by: str = field(default='cleaner')
     status: str = field(default='pending')
     approved_at: Optional[str] = field(default=None)
     approved_by: Optional[str] = field(default=None)
     
     def __post_init__(self):
-        """Calculate content length after initialization."""
-        if self.content:
+        """Fill in content length (unless given) and intern the language code."""
+        if self.content_length == 0 and self.content:
             self.content_length = len(self.content)
+        # Only plain strings can be interned; anything else is left for
+        # validate() to report as an invalid language code
+        if type(self.language) is str:
+            self.language = sys.intern(self.language)
     
     def to_dict(self) -> dict:
         """Convert to dictionary."""
-        return asdict(self)
+        data = self.to_metadata()
+        data['content'] = self.content
+        return data
     
     def to_metadata(self) -> dict:
         """Convert to metadata (without content)."""
-        data = self.to_dict()
-        del data['content']
-        return data
+        return {
+            'filename': self.filename,
+            'language': self.language,
+            'source': self.source,
+            'id': self.id,
+            'original_raw_id': self.original_raw_id,
+            'content_length': self.content_length,
+            'submitted_at': self.submitted_at,
+            'submitted_by': self.submitted_by,
+            'status': self.status,
+            'approved_at': self.approved_at,
+            'approved_by': self.approved_by
+        }
     
     @classmethod
     def from_dict(cls, data: dict) -> 'CleanedDataSchema':
@@ -159,7 +283,7 @@ class CleanedDataSchema:
         return cls(**data)
 
 
-@dataclass
+@dataclass(slots=True)
 class ChunkSchema:
     """
     Schema for content chunks (RAG-ready).
@@ -191,16 +315,20 @@ class ChunkSchema:
     chunk_id: str = field(default='')
     overlap_reference: str = field(default='')
     text_length: int = field(default=0)
-    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    created_at: str = field(default_factory=now_iso)
     created_by: str = field(default='chunker')
     status: str = field(default='pending')
     approved_at: Optional[str] = field(default=None)
     approved_by: Optional[str] = field(default=None)
     
     def __post_init__(self):
-        """Calculate text length and generate chunk_id."""
-        if self.text:
+        """Fill in text length (unless given), intern the language and generate chunk_id."""
+        if self.text_length == 0 and self.text:
             self.text_length = len(self.text)
+        # Only plain strings can be interned; anything else is left for
+        # validate() to report as an invalid language code
+        if type(self.language) is str:
+            self.language = sys.intern(self.language)
         
         if not self.chunk_id:
             self.chunk_id = self._generate_chunk_id()
@@ -212,13 +340,27 @@ class ChunkSchema:
         Format: {lang}_{category_short}_{filename_short}_{index:02d}
         Example: ta_edu_grade10sci_01
         """
-        cat_short = self.category[:3] if len(self.category) > 3 else self.category
-        file_short = self.source_file.replace('_', '')[:10]
-        return f"{self.language}_{cat_short}_{file_short}_{self.chunk_index:02d}"
+        prefix = chunk_id_prefix(self.language, self.category, self.source_file)
+        return f"{prefix}{self.chunk_index:02d}"
     
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
-        return asdict(self)
+        return {
+            'text': self.text,
+            'chunk_index': self.chunk_index,
+            'source_file': self.source_file,
+            'category': self.category,
+            'language': self.language,
+            'source': self.source,
+            'chunk_id': self.chunk_id,
+            'overlap_reference': self.overlap_reference,
+            'text_length': self.text_length,
+            'created_at': self.created_at,
+            'created_by': self.created_by,
+            'status': self.status,
+            'approved_at': self.approved_at,
+            'approved_by': self.approved_by
+        }
     
     @classmethod
     def from_dict(cls, data: dict) -> 'ChunkSchema':
@@ -234,8 +376,8 @@ class ChunkSchema:
         """
         errors = []
         
-        if not self.text or len(self.text) < 20:
-            errors.append('Chunk text must be at least 20 characters')
+        if len(self.text or '') < _MIN_CHUNK_TEXT_LENGTH:
+            errors.append(f'Chunk text must be at least {_MIN_CHUNK_TEXT_LENGTH} characters')
         
         if not self.source_file:
             errors.append('Source file is required')
@@ -243,13 +385,8 @@ class ChunkSchema:
         if self.chunk_index < 1:
             errors.append('Chunk index must be positive')
         
-        valid_categories = [
-            'education', 'literature', 'news', 'science', 
-            'history', 'culture', 'technology', 'health',
-            'legal', 'government', 'religion', 'other'
-        ]
-        if self.category not in valid_categories:
-            errors.append(f'Invalid category. Must be one of: {", ".join(valid_categories)}')
+        if self.category not in _VALID_CATEGORIES:
+            errors.append(f'Invalid category. Must be one of: {", ".join(Config.CATEGORIES)}')
         
         return errors
     
@@ -12,23 +12,40 @@ Blueprints:
     - chunking_bp: Chunking Tab API endpoints
     - admin_bp: Admin approval and management endpoints
 
+Blueprint modules are imported lazily (PEP 562): a route module is only
+loaded the first time its blueprint is accessed, so importing the package
+does not pull in every route module and its dependencies.
+
 Usage:
     from app.routes import main_bp, raw_data_bp, ...
 =============================================================================
 """
 
-# Import all blueprints for easy access from other modules
-from .main import main_bp
-from .raw_data import raw_data_bp
-from .cleaning import cleaning_bp
-from .chunking import chunking_bp
-from .admin import admin_bp
+import importlib
+
+# Map each blueprint name to the module that defines it
+_BLUEPRINTS = {
+    'main_bp': 'app.routes.main',
+    'raw_data_bp': 'app.routes.raw_data',
+    'cleaning_bp': 'app.routes.cleaning',
+    'chunking_bp': 'app.routes.chunking',
+    'admin_bp': 'app.routes.admin'
+}
 
 # Export all blueprints
-__all__ = [
-    'main_bp',
-    'raw_data_bp', 
-    'cleaning_bp',
-    'chunking_bp',
-    'admin_bp'
-]
+__all__ = list(_BLUEPRINTS)
+
+
+def __getattr__(name):
+    """
+    Import a blueprint's module on first access.
+    
+    The resolved blueprint is stored in the package globals so later
+    lookups are plain attribute reads.
+    """
+    if name in _BLUEPRINTS:
+        module = importlib.import_module(_BLUEPRINTS[name])
+        blueprint = getattr(module, name)
+        globals()[name] = blueprint
+        return blueprint
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -22,17 +22,227 @@ Endpoints:
 =============================================================================
 """
 
-from flask import Blueprint, request, jsonify, current_app
+from flask import Blueprint, request, jsonify, current_app, stream_with_context
 import os
-import json
-import shutil
-from datetime import datetime
+from collections import namedtuple
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+
+from ..config import Config
+from ..models.schemas import now_iso
+from ..services.dir_cache import list_dir, stat_signature
+from ..services.json_io import (
+    read_json, read_json_cached, read_json_many, read_text, write_json, write_text,
+    remove_json, json_response, not_modified, to_json_bytes
+)
 
 # -----------------------------------------------------------------------------
 # Create Blueprint
 # -----------------------------------------------------------------------------
 admin_bp = Blueprint('admin', __name__)
 
+# Chunk file name for a chunk index, e.g. 3 -> 'chunk_03.json'
+_chunk_filename = 'chunk_{:02d}.json'.format
+
+# Sort key for chunk dictionaries (C-level itemgetter instead of a lambda)
+_chunk_key = itemgetter('chunk_index')
+
+# Pending and approved directories for the file-based stages
+_STAGE_DIRS = {
+    'raw': (Config.PENDING_RAW_DIR, Config.APPROVED_RAW_DIR),
+    'cleaned': (Config.PENDING_CLEANED_DIR, Config.APPROVED_CLEANED_DIR)
+}
+
+# The four files involved in reviewing one raw/cleaned item
+ItemPaths = namedtuple(
+    'ItemPaths', ['pending_content', 'pending_meta', 'approved_content', 'approved_meta']
+)
+
+
+def _item_paths(stage, filename):
+    """
+    Build the pending/approved content and metadata paths for an item.
+    
+    Args:
+        stage: 'raw' or 'cleaned'
+        filename: Name of the file (without extension)
+    
+    Returns:
+        ItemPaths: Paths of the .txt and .meta.json files in both states
+    """
+    pending_dir, approved_dir = _STAGE_DIRS[stage]
+    return ItemPaths(
+        os.path.join(pending_dir, f'{filename}.txt'),
+        os.path.join(pending_dir, f'{filename}.meta.json'),
+        os.path.join(approved_dir, f'{filename}.txt'),
+        os.path.join(approved_dir, f'{filename}.meta.json')
+    )
+
+
+# -----------------------------------------------------------------------------
+# Helper Function: Approve a JSON File
+# -----------------------------------------------------------------------------
+def _approve_json(pending_path, approved_path, updates):
+    """
+    Move a metadata or chunk file from pending to approved in one pass.
+    
+    The file is read once, updated in memory, written to the approved
+    location and the pending copy is unlinked. The parsed file is taken
+    from the metadata cache when the admin list has already loaded it,
+    so the usual review-then-approve flow skips re-parsing.
+    
+    Args:
+        pending_path: Path of the pending .meta.json / chunk file
+        approved_path: Destination path in the approved directory
+        updates: Fields to set (status, approved_at, ...)
+    
+    Raises:
+        FileNotFoundError: If the pending file does not exist
+    """
+    # Copy: cached values are shared and must not be modified in place
+    data = dict(read_json_cached(pending_path))
+    data.update(updates)
+    write_json(approved_path, data)
+    remove_json(pending_path)
+
+
+def _approvable_stems(pending_dir):
+    """
+    Find the raw/cleaned items in a pending directory that have both files.
+    
+    One scandir pass buckets names by stem, so whether an item's metadata
+    exists is answered from the listing instead of a stat per item.
+    
+    Args:
+        pending_dir: Pending directory for the stage
+    
+    Returns:
+        list: Stems (filenames without extension) with a .txt and .meta.json
+    """
+    stems = {}
+    with os.scandir(pending_dir) as entries:
+        for entry in entries:
+            name = entry.name
+            if name[-10:] == '.meta.json':
+                stems.setdefault(name[:-10], [False, False])[1] = True
+            elif name[-4:] == '.txt' and entry.is_file(follow_symlinks=False):
+                stems.setdefault(name[:-4], [False, False])[0] = True
+    return [stem for stem, (has_txt, has_meta) in stems.items() if has_txt and has_meta]
+
+
+def _approve_content_file(paths, updates):
+    """
+    Approve one raw/cleaned item: move its content and metadata to approved.
+    
+    The approved metadata is prepared before anything moves, so a missing
+    or unreadable metadata file leaves the item pending. If writing the
+    approved metadata fails, the content is moved back.
+    
+    Args:
+        paths: ItemPaths of the item
+        updates: Approval fields to set on the metadata
+    
+    Raises:
+        FileNotFoundError: If the pending content or metadata file does not exist
+    """
+    # Copy: cached values are shared and must not be modified in place
+    metadata = dict(read_json_cached(paths.pending_meta))
+    metadata.update(updates)
+    
+    # Move content (pending and approved share a filesystem)
+    os.replace(paths.pending_content, paths.approved_content)
+    
+    try:
+        write_json(paths.approved_meta, metadata)
+    except Exception:
+        os.replace(paths.approved_content, paths.pending_content)
+        raise
+    
+    try:
+        remove_json(paths.pending_meta)
+    except FileNotFoundError:
+        pass
+
+
+def _remove_dir_if_empty(path):
+    """
+    Remove a chunk folder once its last chunk is gone.
+    
+    rmdir itself refuses non-empty (or missing) directories, so a single
+    syscall replaces the exists + listdir + rmdir sequence.
+    
+    Args:
+        path: Directory to remove
+    """
+    try:
+        os.rmdir(path)
+    except OSError:
+        pass
+
+
+def _json_paths(directory, suffix):
+    """
+    List the JSON files in a directory from its cached listing.
+    
+    Args:
+        directory: Directory to scan (missing directories give [])
+        suffix: File name suffix, e.g. '.meta.json'
+    
+    Returns:
+        list: Full paths of matching regular files
+    """
+    # Slice comparison against a precomputed length is cheaper than
+    # str.endswith() in this per-entry loop
+    cut = -len(suffix)
+    return [os.path.join(directory, name) for name in list_dir(directory).files if name[cut:] == suffix]
+
+
+def _chunk_summaries(folder):
+    """
+    Summarize the chunks in a pending chunk folder from file names alone.
+    
+    Chunk files are named chunk_NN.json, so the index is read from the
+    name and no chunk file is opened or parsed.
+    
+    Args:
+        folder: Chunk folder of one source file
+    
+    Returns:
+        list: {chunk_index, name} dicts sorted by chunk_index
+    """
+    summaries = []
+    for name in list_dir(folder).files:
+        if name[:6] != 'chunk_' or name[-5:] != '.json':
+            continue
+        try:
+            chunk_index = int(name[6:-5])
+        except ValueError:
+            continue
+        summaries.append({'chunk_index': chunk_index, 'name': name})
+    summaries.sort(key=_chunk_key)
+    return summaries
+
+
+def _run_parallel(func, items):
+    """
+    Apply func to every item on a bounded thread pool.
+    
+    Each item is independent file I/O, so the threads overlap the
+    syscalls of different items.
+    
+    Args:
+        func: Function taking a single item
+        items: List of items
+    
+    Returns:
+        list: Results in item order
+    """
+    if len(items) <= 1:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(32, len(items))) as executor:
+        return list(executor.map(func, items))
+
 
 # -----------------------------------------------------------------------------
 # GET /api/admin/pending - Get All Pending Items
@@ -44,63 +254,29 @@ def get_all_pending():
     
     This gives admin a consolidated view of everything that needs review.
     
+    Chunks are listed as summaries ({chunk_index, name}) taken from their
+    file names; the full chunk is loaded by /item when it is opened.
+    
+    The directories are listed up front, then the response is streamed:
+    each stage's files are parsed and serialized item by item as the
+    body is sent, so the full payload is never built in memory. Totals
+    come last, once every item has been counted.
+    
     Returns:
         JSON: Object with pending counts and items for each stage
     """
     try:
-        from ..config import Config
-        
-        pending = {
-            'raw': [],
-            'cleaned': [],
-            'chunked': {}
+        # List everything first so directory errors still produce a 500.
+        # Listings come from the directory cache, so directories that have
+        # not changed since the last poll cost one stat() each.
+        meta_paths = {
+            'raw': _json_paths(Config.PENDING_RAW_DIR, '.meta.json'),
+            'cleaned': _json_paths(Config.PENDING_CLEANED_DIR, '.meta.json')
         }
-        
-        # Get pending raw files
-        if os.path.exists(Config.PENDING_RAW_DIR):
-            for filename in os.listdir(Config.PENDING_RAW_DIR):
-                if filename.endswith('.meta.json'):
-                    meta_path = os.path.join(Config.PENDING_RAW_DIR, filename)
-                    with open(meta_path, 'r', encoding='utf-8') as f:
-                        pending['raw'].append(json.load(f))
-        
-        # Get pending cleaned files
-        if os.path.exists(Config.PENDING_CLEANED_DIR):
-            for filename in os.listdir(Config.PENDING_CLEANED_DIR):
-                if filename.endswith('.meta.json'):
-                    meta_path = os.path.join(Config.PENDING_CLEANED_DIR, filename)
-                    with open(meta_path, 'r', encoding='utf-8') as f:
-                        pending['cleaned'].append(json.load(f))
-        
-        # Get pending chunks
-        if os.path.exists(Config.PENDING_CHUNKED_DIR):
-            for folder_name in os.listdir(Config.PENDING_CHUNKED_DIR):
-                folder_path = os.path.join(Config.PENDING_CHUNKED_DIR, folder_name)
-                if os.path.isdir(folder_path):
-                    chunks = []
-                    for chunk_file in os.listdir(folder_path):
-                        if chunk_file.endswith('.json'):
-                            chunk_path = os.path.join(folder_path, chunk_file)
-                            with open(chunk_path, 'r', encoding='utf-8') as f:
-                                chunks.append(json.load(f))
-                    if chunks:
-                        chunks.sort(key=lambda x: x.get('chunk_index', 0))
-                        pending['chunked'][folder_name] = chunks
-        
-        # Calculate totals
-        totals = {
-            'raw': len(pending['raw']),
-            'cleaned': len(pending['cleaned']),
-            'chunked': sum(len(c) for c in pending['chunked'].values()),
-            'total': len(pending['raw']) + len(pending['cleaned']) + 
-                     sum(len(c) for c in pending['chunked'].values())
-        }
-        
-        return jsonify({
-            'success': True,
-            'pending': pending,
-            'totals': totals
-        })
+        chunk_folders = [
+            (name, _chunk_summaries(os.path.join(Config.PENDING_CHUNKED_DIR, name)))
+            for name in list_dir(Config.PENDING_CHUNKED_DIR).dirs
+        ]
         
     except Exception as e:
         current_app.logger.error(f'Error getting pending items: {str(e)}')
@@ -108,6 +284,252 @@ def get_all_pending():
             'success': False,
             'error': 'Failed to get pending items'
         }), 500
+    
+    def generate():
+        # Files are loaded concurrently per directory; unchanged ones come
+        # from the in-memory metadata cache
+        totals = {'raw': 0, 'cleaned': 0, 'chunked': 0}
+        try:
+            yield b'{"success":true,"pending":{'
+            
+            for stage in ('raw', 'cleaned'):
+                yield b'"' + stage.encode() + b'":['
+                for i, metadata in enumerate(read_json_many(meta_paths[stage], cached=True)):
+                    yield (b',' if i else b'') + to_json_bytes(metadata)
+                    totals[stage] += 1
+                yield b'],'
+            
+            yield b'"chunked":{'
+            first = True
+            for folder_name, chunks in chunk_folders:
+                if not chunks:
+                    continue
+                yield (b'' if first else b',') + to_json_bytes(folder_name) + b':' + to_json_bytes(chunks)
+                first = False
+                totals['chunked'] += len(chunks)
+            
+            totals['total'] = totals['raw'] + totals['cleaned'] + totals['chunked']
+            yield b'}},"totals":' + to_json_bytes(totals) + b'}'
+            
+        except Exception as e:
+            # Headers are already sent; the truncated body fails to parse
+            # on the client, which reports the error
+            current_app.logger.error(f'Error streaming pending items: {str(e)}')
+    
+    return current_app.response_class(stream_with_context(generate()), mimetype='application/json')
+
+
+# -----------------------------------------------------------------------------
+# Item Handlers (dispatched by item type)
+# -----------------------------------------------------------------------------
+# The single-item endpoints (item, update, approve, reject) look the item
+# type up in a dispatch table instead of walking an if/elif chain. Each
+# handler deals with one kind of item; raw and cleaned share a handler
+# bound to their stage with functools.partial.
+
+class _ItemError(Exception):
+    """Raised by an item handler; turned into a JSON error response."""
+    
+    def __init__(self, message, status):
+        super().__init__(message)
+        self.message = message
+        self.status = status
+
+
+def _item_error_response(error):
+    """Build the standard error response for an _ItemError."""
+    return jsonify({
+        'success': False,
+        'error': error.message
+    }), error.status
+
+
+def _pending_chunk_path(filename, params):
+    """
+    Resolve a pending chunk file from the request's chunk_index.
+    
+    Args:
+        filename: Source file name (chunk folder)
+        params: Request args or JSON body containing chunk_index
+    
+    Returns:
+        tuple: (chunk file name, full pending path)
+    """
+    chunk_index = params.get('chunk_index')
+    if chunk_index is None:
+        raise _ItemError('Missing chunk_index', 400)
+    
+    chunk_file = _chunk_filename(int(chunk_index))
+    return chunk_file, os.path.join(Config.PENDING_CHUNKED_DIR, filename, chunk_file)
+
+
+def _get_file_item(stage, filename, params):
+    """Load a pending raw/cleaned item's content and metadata."""
+    paths = _item_paths(stage, filename)
+    
+    try:
+        content = read_text(paths.pending_content)
+    except FileNotFoundError:
+        raise _ItemError('Item not found', 404)
+    
+    return {
+        'content': content,
+        'metadata': read_json(paths.pending_meta)
+    }
+
+
+def _get_chunk_item(filename, params):
+    """Load a pending chunk."""
+    _, chunk_path = _pending_chunk_path(filename, params)
+    
+    try:
+        return {'chunk': read_json(chunk_path)}
+    except FileNotFoundError:
+        raise _ItemError('Chunk not found', 404)
+
+
+def _update_file_item(stage, filename, data, pretty):
+    """Update a pending raw/cleaned item's content and/or metadata."""
+    paths = _item_paths(stage, filename)
+    
+    # Loading the metadata doubles as the existence check
+    try:
+        metadata = read_json(paths.pending_meta)
+    except FileNotFoundError:
+        raise _ItemError('Item not found', 404)
+    
+    # Update content if provided
+    if 'content' in data:
+        write_text(paths.pending_content, data['content'])
+    
+    # Update metadata
+    if 'metadata' in data:
+        # Merge metadata updates
+        metadata.update(data['metadata'])
+    
+    # Keep the stored length in step with edited content; the file
+    # listings report content_length from metadata
+    if 'content' in data:
+        metadata['content_length'] = len(data['content'])
+    
+    # Track edit history
+    metadata['updated_at'] = now_iso()
+    metadata['updated_by'] = 'admin'
+    
+    write_json(paths.pending_meta, metadata, pretty=pretty)
+
+
+def _update_chunk_item(filename, data, pretty):
+    """Replace a pending chunk with the edited version."""
+    _, chunk_path = _pending_chunk_path(filename, data)
+    
+    if not os.path.exists(chunk_path):
+        raise _ItemError('Chunk not found', 404)
+    
+    # Update chunk
+    if 'chunk' in data:
+        chunk_data = data['chunk']
+        chunk_data['updated_at'] = now_iso()
+        chunk_data['updated_by'] = 'admin'
+        
+        write_json(chunk_path, chunk_data, pretty=pretty)
+
+
+def _approve_file_item(stage, filename, data):
+    """Move a raw/cleaned item from pending to approved."""
+    try:
+        _approve_content_file(_item_paths(stage, filename), {
+            'status': 'approved',
+            'approved_at': now_iso(),
+            'approved_by': 'admin'
+        })
+    except FileNotFoundError:
+        raise _ItemError('Pending file not found', 404)
+
+
+def _approve_chunk_item(filename, data):
+    """Move a chunk from pending to approved."""
+    chunk_file, pending_chunk = _pending_chunk_path(filename, data)
+    
+    # Load the pending chunk first; a missing chunk creates nothing
+    try:
+        chunk = dict(read_json_cached(pending_chunk))
+    except FileNotFoundError:
+        raise _ItemError('Pending chunk not found', 404)
+    
+    # Update chunk with approval info
+    chunk.update({
+        'status': 'approved',
+        'approved_at': now_iso(),
+        'approved_by': 'admin'
+    })
+    
+    # Write it to approved, creating the folder only if it is missing
+    approved_dir = os.path.join(Config.APPROVED_CHUNKED_DIR, filename)
+    approved_chunk = os.path.join(approved_dir, chunk_file)
+    try:
+        write_json(approved_chunk, chunk)
+    except FileNotFoundError:
+        os.makedirs(approved_dir, exist_ok=True)
+        write_json(approved_chunk, chunk)
+    remove_json(pending_chunk)
+    
+    # Clean up empty directory
+    _remove_dir_if_empty(os.path.join(Config.PENDING_CHUNKED_DIR, filename))
+
+
+def _reject_file_item(stage, filename, data):
+    """Delete a pending raw/cleaned item."""
+    paths = _item_paths(stage, filename)
+    
+    # Unlink directly; an already-missing file is not an error
+    try:
+        os.unlink(paths.pending_content)
+    except FileNotFoundError:
+        pass
+    try:
+        remove_json(paths.pending_meta)
+    except FileNotFoundError:
+        pass
+
+
+def _reject_chunk_item(filename, data):
+    """Delete a pending chunk."""
+    _, pending_chunk = _pending_chunk_path(filename, data)
+    
+    try:
+        remove_json(pending_chunk)
+    except FileNotFoundError:
+        pass
+    
+    # Clean up empty directory
+    _remove_dir_if_empty(os.path.join(Config.PENDING_CHUNKED_DIR, filename))
+
+
+# Dispatch tables: item type -> handler
+_GET_HANDLERS = {
+    'raw': partial(_get_file_item, 'raw'),
+    'cleaned': partial(_get_file_item, 'cleaned'),
+    'chunk': _get_chunk_item
+}
+
+_UPDATE_HANDLERS = {
+    'raw': partial(_update_file_item, 'raw'),
+    'cleaned': partial(_update_file_item, 'cleaned'),
+    'chunk': _update_chunk_item
+}
+
+_APPROVE_HANDLERS = {
+    'raw': partial(_approve_file_item, 'raw'),
+    'cleaned': partial(_approve_file_item, 'cleaned'),
+    'chunk': _approve_chunk_item
+}
+
+_REJECT_HANDLERS = {
+    'raw': partial(_reject_file_item, 'raw'),
+    'cleaned': partial(_reject_file_item, 'cleaned'),
+    'chunk': _reject_chunk_item
+}
 
 
 # -----------------------------------------------------------------------------
@@ -127,8 +549,6 @@ def get_pending_item():
         JSON: Item content and metadata
     """
     try:
-        from ..config import Config
-        
         item_type = request.args.get('type')
         filename = request.args.get('filename')
         
@@ -138,72 +558,24 @@ def get_pending_item():
                 'error': 'Missing type or filename'
             }), 400
         
+        handler = _GET_HANDLERS.get(item_type)
+        if handler is None:
+            return jsonify({
+                'success': False,
+                'error': 'Invalid type'
+            }), 400
+        
         result = {
             'success': True,
             'type': item_type,
             'filename': filename
         }
-        
-        if item_type == 'raw':
-            content_path = os.path.join(Config.PENDING_RAW_DIR, f'{filename}.txt')
-            meta_path = os.path.join(Config.PENDING_RAW_DIR, f'{filename}.meta.json')
-            
-            if not os.path.exists(content_path):
-                return jsonify({
-                    'success': False,
-                    'error': 'Item not found'
-                }), 404
-            
-            with open(content_path, 'r', encoding='utf-8') as f:
-                result['content'] = f.read()
-            
-            with open(meta_path, 'r', encoding='utf-8') as f:
-                result['metadata'] = json.load(f)
-                
-        elif item_type == 'cleaned':
-            content_path = os.path.join(Config.PENDING_CLEANED_DIR, f'{filename}.txt')
-            meta_path = os.path.join(Config.PENDING_CLEANED_DIR, f'{filename}.meta.json')
-            
-            if not os.path.exists(content_path):
-                return jsonify({
-                    'success': False,
-                    'error': 'Item not found'
-                }), 404
-            
-            with open(content_path, 'r', encoding='utf-8') as f:
-                result['content'] = f.read()
-            
-            with open(meta_path, 'r', encoding='utf-8') as f:
-                result['metadata'] = json.load(f)
-                
-        elif item_type == 'chunk':
-            chunk_index = request.args.get('chunk_index')
-            if chunk_index is None:
-                return jsonify({
-                    'success': False,
-                    'error': 'Missing chunk_index'
-                }), 400
-            
-            chunk_file = f'chunk_{int(chunk_index):02d}.json'
-            chunk_path = os.path.join(Config.PENDING_CHUNKED_DIR, filename, chunk_file)
-            
-            if not os.path.exists(chunk_path):
-                return jsonify({
-                    'success': False,
-                    'error': 'Chunk not found'
-                }), 404
-            
-            with open(chunk_path, 'r', encoding='utf-8') as f:
-                chunk_data = json.load(f)
-                result['chunk'] = chunk_data
-        else:
-            return jsonify({
-                'success': False,
-                'error': 'Invalid type'
-            }), 400
+        result.update(handler(filename, request.args))
         
         return jsonify(result)
         
+    except _ItemError as e:
+        return _item_error_response(e)
     except Exception as e:
         current_app.logger.error(f'Error getting pending item: {str(e)}')
         return jsonify({
@@ -230,6 +602,10 @@ def update_pending_item():
         "chunk": {...}                    // For chunk updates
     }
     
+    Query params:
+        pretty: "1" to write the metadata/chunk file indented
+                (always indented when PRETTY_JSON is set)
+    
     Returns:
         JSON: Success/error response
     """
@@ -244,98 +620,17 @@ def update_pending_item():
         
         item_type = data['type']
         filename = data['filename']
+        pretty = request.args.get('pretty') == '1' or Config.PRETTY_JSON
         
-        from ..config import Config
-        
-        if item_type == 'raw':
-            content_path = os.path.join(Config.PENDING_RAW_DIR, f'{filename}.txt')
-            meta_path = os.path.join(Config.PENDING_RAW_DIR, f'{filename}.meta.json')
-            
-            if not os.path.exists(content_path):
-                return jsonify({
-                    'success': False,
-                    'error': 'Item not found'
-                }), 404
-            
-            # Update content if provided
-            if 'content' in data:
-                with open(content_path, 'w', encoding='utf-8') as f:
-                    f.write(data['content'])
-            
-            # Update metadata
-            with open(meta_path, 'r', encoding='utf-8') as f:
-                metadata = json.load(f)
-            
-            if 'metadata' in data:
-                # Merge metadata updates
-                metadata.update(data['metadata'])
-            
-            # Track edit history
-            metadata['updated_at'] = datetime.now().isoformat()
-            metadata['updated_by'] = 'admin'
-            
-            with open(meta_path, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=2, ensure_ascii=False)
-                
-        elif item_type == 'cleaned':
-            content_path = os.path.join(Config.PENDING_CLEANED_DIR, f'{filename}.txt')
-            meta_path = os.path.join(Config.PENDING_CLEANED_DIR, f'{filename}.meta.json')
-            
-            if not os.path.exists(content_path):
-                return jsonify({
-                    'success': False,
-                    'error': 'Item not found'
-                }), 404
-            
-            # Update content if provided
-            if 'content' in data:
-                with open(content_path, 'w', encoding='utf-8') as f:
-                    f.write(data['content'])
-            
-            # Update metadata
-            with open(meta_path, 'r', encoding='utf-8') as f:
-                metadata = json.load(f)
-            
-            if 'metadata' in data:
-                metadata.update(data['metadata'])
-            
-            metadata['updated_at'] = datetime.now().isoformat()
-            metadata['updated_by'] = 'admin'
-            
-            with open(meta_path, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=2, ensure_ascii=False)
-                
-        elif item_type == 'chunk':
-            chunk_index = data.get('chunk_index')
-            if chunk_index is None:
-                return jsonify({
-                    'success': False,
-                    'error': 'Missing chunk_index'
-                }), 400
-            
-            chunk_file = f'chunk_{int(chunk_index):02d}.json'
-            chunk_path = os.path.join(Config.PENDING_CHUNKED_DIR, filename, chunk_file)
-            
-            if not os.path.exists(chunk_path):
-                return jsonify({
-                    'success': False,
-                    'error': 'Chunk not found'
-                }), 404
-            
-            # Update chunk
-            if 'chunk' in data:
-                chunk_data = data['chunk']
-                chunk_data['updated_at'] = datetime.now().isoformat()
-                chunk_data['updated_by'] = 'admin'
-                
-                with open(chunk_path, 'w', encoding='utf-8') as f:
-                    json.dump(chunk_data, f, indent=2, ensure_ascii=False)
-        else:
+        handler = _UPDATE_HANDLERS.get(item_type)
+        if handler is None:
             return jsonify({
                 'success': False,
                 'error': 'Invalid type'
             }), 400
         
+        handler(filename, data, pretty)
+        
         return jsonify({
             'success': True,
             'message': f'{item_type} updated successfully',
@@ -343,6 +638,8 @@ def update_pending_item():
             'filename': filename
         })
         
+    except _ItemError as e:
+        return _item_error_response(e)
     except Exception as e:
         current_app.logger.error(f'Error updating item: {str(e)}')
         return jsonify({
@@ -383,109 +680,15 @@ def approve_submission():
         submission_type = data['type']
         filename = data['filename']
         
-        from ..config import Config
-        
-        if submission_type == 'raw':
-            # Move raw file from pending to approved
-            pending_content = os.path.join(Config.PENDING_RAW_DIR, f'{filename}.txt')
-            pending_meta = os.path.join(Config.PENDING_RAW_DIR, f'{filename}.meta.json')
-            approved_content = os.path.join(Config.APPROVED_RAW_DIR, f'{filename}.txt')
-            approved_meta = os.path.join(Config.APPROVED_RAW_DIR, f'{filename}.meta.json')
-            
-            if not os.path.exists(pending_content):
-                return jsonify({
-                    'success': False,
-                    'error': 'Pending file not found'
-                }), 404
-            
-            # Update metadata with approval info
-            with open(pending_meta, 'r', encoding='utf-8') as f:
-                metadata = json.load(f)
-            
-            metadata['status'] = 'approved'
-            metadata['approved_at'] = datetime.now().isoformat()
-            metadata['approved_by'] = 'admin'
-            
-            # Move files
-            shutil.move(pending_content, approved_content)
-            with open(approved_meta, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=2, ensure_ascii=False)
-            os.remove(pending_meta)
-            
-        elif submission_type == 'cleaned':
-            # Move cleaned file from pending to approved
-            pending_content = os.path.join(Config.PENDING_CLEANED_DIR, f'{filename}.txt')
-            pending_meta = os.path.join(Config.PENDING_CLEANED_DIR, f'{filename}.meta.json')
-            approved_content = os.path.join(Config.APPROVED_CLEANED_DIR, f'{filename}.txt')
-            approved_meta = os.path.join(Config.APPROVED_CLEANED_DIR, f'{filename}.meta.json')
-            
-            if not os.path.exists(pending_content):
-                return jsonify({
-                    'success': False,
-                    'error': 'Pending file not found'
-                }), 404
-            
-            # Update metadata
-            with open(pending_meta, 'r', encoding='utf-8') as f:
-                metadata = json.load(f)
-            
-            metadata['status'] = 'approved'
-            metadata['approved_at'] = datetime.now().isoformat()
-            metadata['approved_by'] = 'admin'
-            
-            # Move files
-            shutil.move(pending_content, approved_content)
-            with open(approved_meta, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=2, ensure_ascii=False)
-            os.remove(pending_meta)
-            
-        elif submission_type == 'chunk':
-            # Move chunk from pending to approved
-            chunk_index = data.get('chunk_index')
-            if chunk_index is None:
-                return jsonify({
-                    'success': False,
-                    'error': 'Missing chunk_index'
-                }), 400
-            
-            chunk_file = f'chunk_{chunk_index:02d}.json'
-            pending_chunk = os.path.join(Config.PENDING_CHUNKED_DIR, filename, chunk_file)
-            
-            if not os.path.exists(pending_chunk):
-                return jsonify({
-                    'success': False,
-                    'error': 'Pending chunk not found'
-                }), 404
-            
-            # Create approved directory if needed
-            approved_dir = os.path.join(Config.APPROVED_CHUNKED_DIR, filename)
-            os.makedirs(approved_dir, exist_ok=True)
-            
-            # Update chunk with approval info
-            with open(pending_chunk, 'r', encoding='utf-8') as f:
-                chunk = json.load(f)
-            
-            chunk['status'] = 'approved'
-            chunk['approved_at'] = datetime.now().isoformat()
-            chunk['approved_by'] = 'admin'
-            
-            approved_chunk = os.path.join(approved_dir, chunk_file)
-            with open(approved_chunk, 'w', encoding='utf-8') as f:
-                json.dump(chunk, f, indent=2, ensure_ascii=False)
-            
-            os.remove(pending_chunk)
-            
-            # Clean up empty directory
-            pending_dir = os.path.join(Config.PENDING_CHUNKED_DIR, filename)
-            if os.path.exists(pending_dir) and not os.listdir(pending_dir):
-                os.rmdir(pending_dir)
-        
-        else:
+        handler = _APPROVE_HANDLERS.get(submission_type)
+        if handler is None:
             return jsonify({
                 'success': False,
                 'error': 'Invalid type. Must be raw, cleaned, or chunk'
             }), 400
         
+        handler(filename, data)
+        
         return jsonify({
             'success': True,
             'message': f'{submission_type} approved successfully',
@@ -493,6 +696,8 @@ def approve_submission():
             'filename': filename
         })
         
+    except _ItemError as e:
+        return _item_error_response(e)
     except Exception as e:
         current_app.logger.error(f'Error approving submission: {str(e)}')
         return jsonify({
@@ -535,51 +740,15 @@ def reject_submission():
         filename = data['filename']
         reason = data.get('reason', 'No reason provided')
         
-        from ..config import Config
-        
-        if submission_type == 'raw':
-            pending_content = os.path.join(Config.PENDING_RAW_DIR, f'{filename}.txt')
-            pending_meta = os.path.join(Config.PENDING_RAW_DIR, f'{filename}.meta.json')
-            
-            if os.path.exists(pending_content):
-                os.remove(pending_content)
-            if os.path.exists(pending_meta):
-                os.remove(pending_meta)
-                
-        elif submission_type == 'cleaned':
-            pending_content = os.path.join(Config.PENDING_CLEANED_DIR, f'{filename}.txt')
-            pending_meta = os.path.join(Config.PENDING_CLEANED_DIR, f'{filename}.meta.json')
-            
-            if os.path.exists(pending_content):
-                os.remove(pending_content)
-            if os.path.exists(pending_meta):
-                os.remove(pending_meta)
-                
-        elif submission_type == 'chunk':
-            chunk_index = data.get('chunk_index')
-            if chunk_index is None:
-                return jsonify({
-                    'success': False,
-                    'error': 'Missing chunk_index'
-                }), 400
-            
-            chunk_file = f'chunk_{chunk_index:02d}.json'
-            pending_chunk = os.path.join(Config.PENDING_CHUNKED_DIR, filename, chunk_file)
-            
-            if os.path.exists(pending_chunk):
-                os.remove(pending_chunk)
-            
-            # Clean up empty directory
-            pending_dir = os.path.join(Config.PENDING_CHUNKED_DIR, filename)
-            if os.path.exists(pending_dir) and not os.listdir(pending_dir):
-                os.rmdir(pending_dir)
-        
-        else:
+        handler = _REJECT_HANDLERS.get(submission_type)
+        if handler is None:
             return jsonify({
                 'success': False,
                 'error': 'Invalid type'
             }), 400
         
+        handler(filename, data)
+        
         # Log rejection (could be stored in a rejection log file)
         current_app.logger.info(f'Rejected {submission_type}: {filename}, Reason: {reason}')
         
@@ -590,6 +759,8 @@ def reject_submission():
             'filename': filename
         })
         
+    except _ItemError as e:
+        return _item_error_response(e)
     except Exception as e:
         current_app.logger.error(f'Error rejecting submission: {str(e)}')
         return jsonify({
@@ -625,54 +796,28 @@ def approve_all():
                 'error': 'Missing type'
             }), 400
         
-        from ..config import Config
         approved_count = 0
         
-        if submission_type == 'raw':
-            if os.path.exists(Config.PENDING_RAW_DIR):
-                for filename in list(os.listdir(Config.PENDING_RAW_DIR)):
-                    if filename.endswith('.txt'):
-                        base_name = filename.replace('.txt', '')
-                        # Approve each file
-                        # (Reusing approve logic)
-                        pending_content = os.path.join(Config.PENDING_RAW_DIR, filename)
-                        pending_meta = os.path.join(Config.PENDING_RAW_DIR, f'{base_name}.meta.json')
-                        approved_content = os.path.join(Config.APPROVED_RAW_DIR, filename)
-                        approved_meta = os.path.join(Config.APPROVED_RAW_DIR, f'{base_name}.meta.json')
-                        
-                        if os.path.exists(pending_meta):
-                            with open(pending_meta, 'r', encoding='utf-8') as f:
-                                metadata = json.load(f)
-                            metadata['status'] = 'approved'
-                            metadata['approved_at'] = datetime.now().isoformat()
-                            
-                            shutil.move(pending_content, approved_content)
-                            with open(approved_meta, 'w', encoding='utf-8') as f:
-                                json.dump(metadata, f, indent=2, ensure_ascii=False)
-                            os.remove(pending_meta)
-                            approved_count += 1
-        
-        elif submission_type == 'cleaned':
-            if os.path.exists(Config.PENDING_CLEANED_DIR):
-                for filename in list(os.listdir(Config.PENDING_CLEANED_DIR)):
-                    if filename.endswith('.txt'):
-                        base_name = filename.replace('.txt', '')
-                        pending_content = os.path.join(Config.PENDING_CLEANED_DIR, filename)
-                        pending_meta = os.path.join(Config.PENDING_CLEANED_DIR, f'{base_name}.meta.json')
-                        approved_content = os.path.join(Config.APPROVED_CLEANED_DIR, filename)
-                        approved_meta = os.path.join(Config.APPROVED_CLEANED_DIR, f'{base_name}.meta.json')
-                        
-                        if os.path.exists(pending_meta):
-                            with open(pending_meta, 'r', encoding='utf-8') as f:
-                                metadata = json.load(f)
-                            metadata['status'] = 'approved'
-                            metadata['approved_at'] = datetime.now().isoformat()
-                            
-                            shutil.move(pending_content, approved_content)
-                            with open(approved_meta, 'w', encoding='utf-8') as f:
-                                json.dump(metadata, f, indent=2, ensure_ascii=False)
-                            os.remove(pending_meta)
-                            approved_count += 1
+        # Every item in the batch gets the same approval fields
+        approval = {
+            'status': 'approved',
+            'approved_at': now_iso()
+        }
+        
+        if submission_type in _STAGE_DIRS:
+            pending_dir = _STAGE_DIRS[submission_type][0]
+            
+            if os.path.exists(pending_dir):
+                # Snapshot complete items first since files are moved out below;
+                # items without a metadata file are skipped
+                stems = _approvable_stems(pending_dir)
+                
+                # Approve the files concurrently
+                _run_parallel(
+                    lambda stem: _approve_content_file(_item_paths(submission_type, stem), approval),
+                    stems
+                )
+                approved_count = len(stems)
         
         elif submission_type == 'chunks':
             target_file = data.get('filename')
@@ -687,31 +832,23 @@ def approve_all():
             
             if os.path.exists(pending_dir):
                 os.makedirs(approved_dir, exist_ok=True)
-                for chunk_file in list(os.listdir(pending_dir)):
-                    if chunk_file.endswith('.json'):
-                        pending_path = os.path.join(pending_dir, chunk_file)
-                        approved_path = os.path.join(approved_dir, chunk_file)
-                        
-                        with open(pending_path, 'r', encoding='utf-8') as f:
-                            chunk = json.load(f)
-                        chunk['status'] = 'approved'
-                        chunk['approved_at'] = datetime.now().isoformat()
-                        
-                        with open(approved_path, 'w', encoding='utf-8') as f:
-                            json.dump(chunk, f, indent=2, ensure_ascii=False)
-                        os.remove(pending_path)
-                        approved_count += 1
+                with os.scandir(pending_dir) as entries:
+                    chunk_entries = [e for e in entries if e.name[-5:] == '.json' and e.is_file(follow_symlinks=False)]
+                _run_parallel(
+                    lambda entry: _approve_json(entry.path, os.path.join(approved_dir, entry.name), approval),
+                    chunk_entries
+                )
+                approved_count = len(chunk_entries)
                 
                 # Clean up empty directory
-                if not os.listdir(pending_dir):
-                    os.rmdir(pending_dir)
+                _remove_dir_if_empty(pending_dir)
         
         return jsonify({
             'success': True,
             'message': f'Approved {approved_count} items',
             'approved_count': approved_count
         })
-        
+    
     except Exception as e:
         current_app.logger.error(f'Error in bulk approve: {str(e)}')
         return jsonify({
@@ -720,6 +857,37 @@ def approve_all():
         }), 500
 
 
+# -----------------------------------------------------------------------------
+# Helper Functions: File Counting
+# -----------------------------------------------------------------------------
+def _count_ext(path, ext):
+    """
+    Count regular files with a given extension in a directory.
+    
+    Args:
+        path: Directory to scan (missing directories count as 0)
+        ext: File extension to match, e.g. '.txt'
+    
+    Returns:
+        int: Number of matching files
+    """
+    cut = -len(ext)
+    return sum(1 for name in list_dir(path).files if name[cut:] == ext)
+
+
+def _count_chunks(path):
+    """
+    Count chunk files across all per-file folders of a chunked directory.
+    
+    Args:
+        path: Pending or approved chunked directory
+    
+    Returns:
+        int: Total number of chunk .json files
+    """
+    return sum(_count_ext(os.path.join(path, name), '.json') for name in list_dir(path).dirs)
+
+
 # -----------------------------------------------------------------------------
 # GET /api/admin/stats - Get Platform Statistics
 # -----------------------------------------------------------------------------
@@ -733,53 +901,52 @@ def get_stats():
     - Total chunks created
     - Languages and categories distribution
     
+    Counts only depend on directory listings, so the response carries an
+    ETag built from the data directories and chunk folders; unchanged
+    state gets an empty 304.
+    
     Returns:
         JSON: Statistics object
     """
     try:
-        from ..config import Config
+        signed_paths = [
+            Config.PENDING_RAW_DIR, Config.APPROVED_RAW_DIR,
+            Config.PENDING_CLEANED_DIR, Config.APPROVED_CLEANED_DIR,
+            Config.PENDING_CHUNKED_DIR, Config.APPROVED_CHUNKED_DIR
+        ]
+        for chunked_dir in (Config.PENDING_CHUNKED_DIR, Config.APPROVED_CHUNKED_DIR):
+            signed_paths.extend(os.path.join(chunked_dir, name) for name in list_dir(chunked_dir).dirs)
         
-        stats = {
-            'raw': {'pending': 0, 'approved': 0},
-            'cleaned': {'pending': 0, 'approved': 0},
-            'chunked': {'pending': 0, 'approved': 0}
-        }
+        etag = stat_signature(signed_paths)
+        cached = not_modified(etag)
+        if cached is not None:
+            return cached
         
-        # Count raw files
-        if os.path.exists(Config.PENDING_RAW_DIR):
-            stats['raw']['pending'] = len([f for f in os.listdir(Config.PENDING_RAW_DIR) if f.endswith('.txt')])
-        if os.path.exists(Config.APPROVED_RAW_DIR):
-            stats['raw']['approved'] = len([f for f in os.listdir(Config.APPROVED_RAW_DIR) if f.endswith('.txt')])
-        
-        # Count cleaned files
-        if os.path.exists(Config.PENDING_CLEANED_DIR):
-            stats['cleaned']['pending'] = len([f for f in os.listdir(Config.PENDING_CLEANED_DIR) if f.endswith('.txt')])
-        if os.path.exists(Config.APPROVED_CLEANED_DIR):
-            stats['cleaned']['approved'] = len([f for f in os.listdir(Config.APPROVED_CLEANED_DIR) if f.endswith('.txt')])
-        
-        # Count chunks
-        if os.path.exists(Config.PENDING_CHUNKED_DIR):
-            for folder in os.listdir(Config.PENDING_CHUNKED_DIR):
-                folder_path = os.path.join(Config.PENDING_CHUNKED_DIR, folder)
-                if os.path.isdir(folder_path):
-                    stats['chunked']['pending'] += len([f for f in os.listdir(folder_path) if f.endswith('.json')])
-        
-        if os.path.exists(Config.APPROVED_CHUNKED_DIR):
-            for folder in os.listdir(Config.APPROVED_CHUNKED_DIR):
-                folder_path = os.path.join(Config.APPROVED_CHUNKED_DIR, folder)
-                if os.path.isdir(folder_path):
-                    stats['chunked']['approved'] += len([f for f in os.listdir(folder_path) if f.endswith('.json')])
+        # One pass per directory, summed in locals
+        raw_pending = _count_ext(Config.PENDING_RAW_DIR, '.txt')
+        raw_approved = _count_ext(Config.APPROVED_RAW_DIR, '.txt')
+        cleaned_pending = _count_ext(Config.PENDING_CLEANED_DIR, '.txt')
+        cleaned_approved = _count_ext(Config.APPROVED_CLEANED_DIR, '.txt')
+        chunked_pending = _count_chunks(Config.PENDING_CHUNKED_DIR)
+        chunked_approved = _count_chunks(Config.APPROVED_CHUNKED_DIR)
         
-        # Calculate totals
-        stats['totals'] = {
-            'pending': stats['raw']['pending'] + stats['cleaned']['pending'] + stats['chunked']['pending'],
-            'approved': stats['raw']['approved'] + stats['cleaned']['approved'] + stats['chunked']['approved']
+        stats = {
+            'raw': {'pending': raw_pending, 'approved': raw_approved},
+            'cleaned': {'pending': cleaned_pending, 'approved': cleaned_approved},
+            'chunked': {'pending': chunked_pending, 'approved': chunked_approved},
+            'totals': {
+                'pending': raw_pending + cleaned_pending + chunked_pending,
+                'approved': raw_approved + cleaned_approved + chunked_approved
+            }
         }
         
-        return jsonify({
+        response = json_response({
             'success': True,
             'stats': stats
         })
+        if etag is not None:
+            response.set_etag(etag)
+        return response
         
     except Exception as e:
         current_app.logger.error(f'Error getting stats: {str(e)}')
@@ -788,6 +955,196 @@ def get_stats():
             'error': 'Failed to get statistics'
         }), 500
 
+
+# -----------------------------------------------------------------------------
+# Helper Functions: HuggingFace Uploads
+# -----------------------------------------------------------------------------
+# Approved files are pushed in batched commits instead of one commit per
+# file. Files are uploaded as stored on disk, without re-reading them.
+
+# Maximum number of files in one HuggingFace commit
+_HF_COMMIT_BATCH = 256
+
+
+def _push_marker_path(stage):
+    """Path of the file recording the state of a stage's last full push."""
+    return os.path.join(Config.STATE_DIR, f'last_push_{stage}')
+
+
+def _push_signature(stage):
+    """
+    Signature of an approved stage's contents, for skipping repeat pushes.
+    
+    Raw and cleaned files are added and removed, never edited in place,
+    so their directory's mtime covers them; chunk folders are included
+    for the chunked stage.
+    
+    Returns:
+        str: Signature, or None if the directory changed too recently
+    """
+    if stage == 'chunked':
+        base = Config.APPROVED_CHUNKED_DIR
+        return stat_signature([base, *(os.path.join(base, name) for name in list_dir(base).dirs)])
+    return stat_signature([_STAGE_DIRS[stage][1]])
+
+
+def _read_push_marker(stage):
+    """Return the (signature, repo) recorded by the last full push, if any."""
+    try:
+        signature, _, repo = read_text(_push_marker_path(stage)).partition('\n')
+        return signature, repo
+    except FileNotFoundError:
+        return None
+
+
+def _write_push_marker(stage, signature, repo):
+    """Record that every file of a stage was pushed to repo."""
+    os.makedirs(Config.STATE_DIR, exist_ok=True)
+    write_text(_push_marker_path(stage), f'{signature}\n{repo}')
+
+
+def _iter_chunk_files(base_dir):
+    """
+    Walk a chunked directory once, yielding every chunk file.
+    
+    Each folder is listed a single time through the directory cache, so
+    unchanged folders cost one stat() rather than a readdir.
+    
+    Args:
+        base_dir: Pending or approved chunked directory
+    
+    Yields:
+        tuple: (folder name, chunk file name)
+    """
+    for folder_name in list_dir(base_dir).dirs:
+        for chunk_file in list_dir(os.path.join(base_dir, folder_name)).files:
+            if chunk_file[-5:] == '.json':
+                yield folder_name, chunk_file
+
+
+def _content_items(directory, stage_results):
+    """
+    Build upload items for the approved raw/cleaned files in a directory.
+    
+    Files without a metadata file cannot be pushed and are counted as
+    failed in stage_results.
+    
+    Args:
+        directory: Approved raw or cleaned directory
+        stage_results: Result dict for the stage (uploaded/failed/files)
+    
+    Returns:
+        list: (name, [(path_in_repo, local path), ...]) per item, with the
+        .txt and .meta.json of an item kept together
+    """
+    names = list_dir(directory).files
+    present = set(names)
+    items = []
+    for filename in names:
+        if filename[-4:] == '.txt':
+            base_name = filename[:-len('.txt')]
+            meta_name = f'{base_name}.meta.json'
+            if meta_name not in present:
+                current_app.logger.error(f'Failed to upload {base_name}: missing metadata')
+                stage_results['failed'] += 1
+                continue
+            items.append((base_name, [
+                (filename, os.path.join(directory, filename)),
+                (meta_name, os.path.join(directory, meta_name))
+            ]))
+    return items
+
+
+def _push_items(hf_service, items, repo, stage, stage_results):
+    """
+    Push upload items in batched commits and record the outcome.
+    
+    An item's files always land in the same commit. A failed commit
+    counts all of its items as failed.
+    
+    Args:
+        hf_service: Configured HuggingFaceService
+        items: (name, files) pairs from _content_items or the chunk walk
+        repo: Target repository
+        stage: Stage name used in commit messages, e.g. 'raw'
+        stage_results: Result dict for the stage (uploaded/failed/files)
+    """
+    batch = []
+    batch_files = 0
+    
+    def flush():
+        files = [f for _, item_files in batch for f in item_files]
+        result = hf_service.commit_files(files, repo, f'Add {len(batch)} approved {stage} files')
+        if result['success']:
+            stage_results['uploaded'] += len(batch)
+            stage_results['files'].extend(name for name, _ in batch)
+        else:
+            current_app.logger.error(f'Failed to push {len(batch)} {stage} files: {result["error"]}')
+            stage_results['failed'] += len(batch)
+    
+    for item in items:
+        if batch and batch_files + len(item[1]) > _HF_COMMIT_BATCH:
+            flush()
+            batch = []
+            batch_files = 0
+        batch.append(item)
+        batch_files += len(item[1])
+    
+    if batch:
+        flush()
+
+
+def _chunk_items(stage_results):
+    """
+    Build upload items for every approved chunk (one file per item).
+    
+    Args:
+        stage_results: Result dict for the stage (unused; kept for the
+                       common item-builder signature)
+    
+    Returns:
+        list: (folder/chunk name, [(path_in_repo, local path)]) per chunk
+    """
+    base = Config.APPROVED_CHUNKED_DIR
+    return [
+        (f'{folder_name}/{chunk_file}',
+         [(f'{folder_name}/{chunk_file}', os.path.join(base, folder_name, chunk_file))])
+        for folder_name, chunk_file in _iter_chunk_files(base)
+    ]
+
+
+# Push table: stage -> (default repository, item builder)
+_PUSH_STAGES = {
+    'raw': (Config.HF_RAW_REPO, partial(_content_items, Config.APPROVED_RAW_DIR)),
+    'cleaned': (Config.HF_CLEANED_REPO, partial(_content_items, Config.APPROVED_CLEANED_DIR)),
+    'chunked': (Config.HF_CHUNKED_REPO, _chunk_items)
+}
+
+
+def _push_stage(hf_service, stage, repo, build_items, force, stage_results):
+    """
+    Push one stage's approved files, unless unchanged since the last push.
+    
+    Args:
+        hf_service: Configured HuggingFaceService
+        stage: 'raw', 'cleaned' or 'chunked'
+        repo: Target repository
+        build_items: Item builder from _PUSH_STAGES
+        force: Push even if the stage is unchanged
+        stage_results: Result dict for the stage (uploaded/failed/files)
+    """
+    # Skip the walk entirely if nothing changed since the last push
+    signature = _push_signature(stage)
+    if not force and signature is not None and _read_push_marker(stage) == (signature, repo):
+        stage_results['skipped'] = True
+        return
+    
+    _push_items(hf_service, build_items(stage_results), repo, stage, stage_results)
+    
+    if signature is not None and stage_results['failed'] == 0:
+        _write_push_marker(stage, signature, repo)
+
+
 # -----------------------------------------------------------------------------
 # POST /api/admin/push-to-hf - Push Approved Data to HuggingFace
 # -----------------------------------------------------------------------------
@@ -800,9 +1157,14 @@ def push_to_huggingface():
     {
         "type": "raw" | "cleaned" | "chunked" | "all",
         "hf_token": "hf_...",  // HuggingFace token
-        "repo": "username/repo-name"  // Target repo
+        "repo": "username/repo-name",  // Target repo
+        "force": false  // Push even if nothing changed since the last push
     }
     
+    A stage is skipped (results[stage].skipped = true) when its approved
+    files are unchanged since the last push to the same repo that
+    uploaded everything without failures.
+    
     Returns:
         JSON: Upload results with count of files pushed
     """
@@ -825,8 +1187,8 @@ def push_to_huggingface():
         
         push_type = data['type']
         
+        # huggingface_hub stays a lazy import; only this route needs it
         from ..services.huggingface import HuggingFaceService
-        from ..config import Config
         
         # Initialize HF service with token
         hf_service = HuggingFaceService(token=hf_token)
@@ -843,88 +1205,13 @@ def push_to_huggingface():
             'chunked': {'uploaded': 0, 'failed': 0, 'files': []}
         }
         
-        # Push raw files
-        if push_type in ['raw', 'all']:
-            repo = data.get('repo') or Config.HF_RAW_REPO
-            if os.path.exists(Config.APPROVED_RAW_DIR):
-                for filename in os.listdir(Config.APPROVED_RAW_DIR):
-                    if filename.endswith('.txt'):
-                        base_name = filename.replace('.txt', '')
-                        content_path = os.path.join(Config.APPROVED_RAW_DIR, filename)
-                        meta_path = os.path.join(Config.APPROVED_RAW_DIR, f'{base_name}.meta.json')
-                        
-                        try:
-                            with open(content_path, 'r', encoding='utf-8') as f:
-                                content = f.read()
-                            with open(meta_path, 'r', encoding='utf-8') as f:
-                                metadata = json.load(f)
-                            
-                            result = hf_service.upload_raw_file(base_name, content, metadata, repo)
-                            
-                            if result['success']:
-                                results['raw']['uploaded'] += 1
-                                results['raw']['files'].append(base_name)
-                            else:
-                                results['raw']['failed'] += 1
-                                
-                        except Exception as e:
-                            current_app.logger.error(f'Failed to upload {base_name}: {str(e)}')
-                            results['raw']['failed'] += 1
-        
-        # Push cleaned files
-        if push_type in ['cleaned', 'all']:
-            repo = data.get('repo') or Config.HF_CLEANED_REPO
-            if os.path.exists(Config.APPROVED_CLEANED_DIR):
-                for filename in os.listdir(Config.APPROVED_CLEANED_DIR):
-                    if filename.endswith('.txt'):
-                        base_name = filename.replace('.txt', '')
-                        content_path = os.path.join(Config.APPROVED_CLEANED_DIR, filename)
-                        meta_path = os.path.join(Config.APPROVED_CLEANED_DIR, f'{base_name}.meta.json')
-                        
-                        try:
-                            with open(content_path, 'r', encoding='utf-8') as f:
-                                content = f.read()
-                            with open(meta_path, 'r', encoding='utf-8') as f:
-                                metadata = json.load(f)
-                            
-                            result = hf_service.upload_cleaned_file(base_name, content, metadata, repo)
-                            
-                            if result['success']:
-                                results['cleaned']['uploaded'] += 1
-                                results['cleaned']['files'].append(base_name)
-                            else:
-                                results['cleaned']['failed'] += 1
-                                
-                        except Exception as e:
-                            current_app.logger.error(f'Failed to upload {base_name}: {str(e)}')
-                            results['cleaned']['failed'] += 1
-        
-        # Push chunks
-        if push_type in ['chunked', 'all']:
-            repo = data.get('repo') or Config.HF_CHUNKED_REPO
-            if os.path.exists(Config.APPROVED_CHUNKED_DIR):
-                for folder_name in os.listdir(Config.APPROVED_CHUNKED_DIR):
-                    folder_path = os.path.join(Config.APPROVED_CHUNKED_DIR, folder_name)
-                    if os.path.isdir(folder_path):
-                        for chunk_file in os.listdir(folder_path):
-                            if chunk_file.endswith('.json'):
-                                chunk_path = os.path.join(folder_path, chunk_file)
-                                
-                                try:
-                                    with open(chunk_path, 'r', encoding='utf-8') as f:
-                                        chunk_data = json.load(f)
-                                    
-                                    result = hf_service.upload_chunk(folder_name, chunk_file, chunk_data, repo)
-                                    
-                                    if result['success']:
-                                        results['chunked']['uploaded'] += 1
-                                        results['chunked']['files'].append(f'{folder_name}/{chunk_file}')
-                                    else:
-                                        results['chunked']['failed'] += 1
-                                        
-                                except Exception as e:
-                                    current_app.logger.error(f'Failed to upload chunk {chunk_file}: {str(e)}')
-                                    results['chunked']['failed'] += 1
+        force = bool(data.get('force'))
+        
+        # One code path for every stage, driven by the push table
+        for stage, (default_repo, build_items) in _PUSH_STAGES.items():
+            if push_type in (stage, 'all'):
+                repo = data.get('repo') or default_repo
+                _push_stage(hf_service, stage, repo, build_items, force, results[stage])
         
         # Calculate totals
         total_uploaded = results['raw']['uploaded'] + results['cleaned']['uploaded'] + results['chunked']['uploaded']
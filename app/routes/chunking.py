@@ -32,18 +32,36 @@ Each JSON:
 =============================================================================
 """
 
-from flask import Blueprint, request, jsonify, current_app
+from flask import Blueprint, request, current_app, send_from_directory, stream_with_context
+from werkzeug.exceptions import NotFound
 import os
-import json
-from datetime import datetime
+import threading
 import uuid
 
+try:
+    import fcntl
+except ImportError:   # Windows: fall back to an in-process lock
+    fcntl = None
+
+from ..config import Config
+from ..models.schemas import chunk_id_prefix, now_iso
+from ..services.dir_cache import dir_cache, list_dir, stat_signature
+from ..services.json_io import (
+    json_response, not_modified, read_json, read_json_cached, read_json_many, read_text,
+    to_json_bytes, write_json, write_json_files
+)
+
 # -----------------------------------------------------------------------------
 # Create Blueprint
 # -----------------------------------------------------------------------------
 chunking_bp = Blueprint('chunking', __name__)
 
 
+def _chunk_key(chunk):
+    """Sort key for chunk dictionaries; chunks without an index sort first."""
+    return chunk.get('chunk_index', 0)
+
+
 # -----------------------------------------------------------------------------
 # Helper: Generate Chunk ID
 # -----------------------------------------------------------------------------
@@ -63,13 +81,126 @@ def generate_chunk_id(language, category, filename, index):
     Returns:
         str: Formatted chunk ID
     """
-    # Shorten category to 3-4 chars
-    cat_short = category[:3] if len(category) > 3 else category
+    # Same prefix builder (and cache) as ChunkSchema._generate_chunk_id
+    return f"{chunk_id_prefix(language, category, filename)}{index:02d}"
+
+
+# Highest chunk index accepted from a request path
+_MAX_CHUNK_INDEX = 99999
+
+
+# -----------------------------------------------------------------------------
+# Helpers: Chunk Folder Scans
+# -----------------------------------------------------------------------------
+# Listings come from the shared directory cache: an unchanged folder costs
+# one stat() instead of a scan. Routes that add or delete chunk files
+# invalidate the folder so the next count is exact.
+# Suffixes are matched with fixed-length slices, which are cheaper than
+# str.endswith() calls in these per-entry loops.
+
+def _json_files(folder):
+    """
+    List the .json files in a chunk folder.
+    
+    Args:
+        folder: Chunk folder (missing folders give [])
+    
+    Returns:
+        list: Full paths of the chunk files
+    """
+    return [os.path.join(folder, name) for name in list_dir(folder).files if name[-5:] == '.json']
+
+
+def _count_json(folder):
+    """
+    Count the .json files in a chunk folder.
+    
+    Args:
+        folder: Chunk folder (missing folders count as 0)
+    
+    Returns:
+        int: Number of chunk files
+    """
+    return sum(1 for name in list_dir(folder).files if name[-5:] == '.json')
+
+
+def _load_meta(meta_path):
+    """
+    Load a cleaned file's metadata through the shared metadata cache.
+    
+    Unchanged files are a dict lookup plus one stat(); a missing file
+    gives an empty dict. The result is shared and must not be modified.
+    
+    Args:
+        meta_path: Path of the .meta.json file
+    
+    Returns:
+        dict: Parsed metadata, or {} if the file does not exist
+    """
+    try:
+        return read_json_cached(meta_path)
+    except FileNotFoundError:
+        return {}
+
+
+# -----------------------------------------------------------------------------
+# Helper: Allocate Chunk Indices
+# -----------------------------------------------------------------------------
+# Each source file has a small counter file holding its next chunk index,
+# so submitting chunks no longer lists the chunk folders. Indices only
+# grow: deleting a chunk never frees its index for reuse.
+
+# Used instead of flock() where fcntl is unavailable
+_counter_lock = threading.Lock()
+
+
+def _reserve_chunk_indices(filename, count=1):
+    """
+    Reserve the next chunk indices for a source file.
+    
+    The counter file is locked with flock() while it is read and bumped,
+    so concurrent submissions (threads or worker processes) never get the
+    same index. A missing counter is initialized once from the existing
+    pending + approved chunk files.
+    
+    Args:
+        filename: Source file name
+        count: Number of consecutive indices to reserve
+    
+    Returns:
+        int: The first reserved index
+    """
+    counter_path = os.path.join(Config.CHUNK_COUNTER_DIR, filename)
+    try:
+        fd = os.open(counter_path, os.O_RDWR | os.O_CREAT, 0o666)
+    except FileNotFoundError:
+        os.makedirs(Config.CHUNK_COUNTER_DIR, exist_ok=True)
+        fd = os.open(counter_path, os.O_RDWR | os.O_CREAT, 0o666)
     
-    # Shorten filename
-    file_short = filename.replace('_', '')[:10]
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        else:
+            _counter_lock.acquire()
+        try:
+            stored = os.read(fd, 32).strip()
+            if stored:
+                start = int(stored)
+            else:
+                start = 1 + (_count_json(os.path.join(Config.PENDING_CHUNKED_DIR, filename))
+                             + _count_json(os.path.join(Config.APPROVED_CHUNKED_DIR, filename)))
+            
+            os.lseek(fd, 0, os.SEEK_SET)
+            os.ftruncate(fd, 0)
+            os.write(fd, str(start + count).encode())
+        finally:
+            if fcntl is None:
+                _counter_lock.release()
+    finally:
+        # Closing the descriptor also releases the flock()
+        os.close(fd)
     
-    return f"{language}_{cat_short}_{file_short}_{index:02d}"
+    return start
 
 
 # -----------------------------------------------------------------------------
@@ -80,57 +211,56 @@ def list_cleaned_files():
     """
     List all approved cleaned files available for chunking.
     
+    File contents are not included unless requested; the UI fetches a
+    file's content from /cleaned-files/<filename>/content when it is
+    selected. content_length then comes from the file's metadata
+    (a character count, or null for files without one).
+    
+    Query params:
+        include_content: "1" to include each file's full content
+    
     Returns:
-        JSON: Array of cleaned files with content and chunking status
+        JSON: Array of cleaned files with chunking status
     """
     try:
-        from ..config import Config
         approved_cleaned_dir = Config.APPROVED_CLEANED_DIR
+        include_content = request.args.get('include_content', '0') == '1'
         
         cleaned_files = []
         
-        if os.path.exists(approved_cleaned_dir):
-            for filename in os.listdir(approved_cleaned_dir):
-                if filename.endswith('.txt'):
-                    base_name = filename.replace('.txt', '')
-                    
-                    # Read content
-                    content_path = os.path.join(approved_cleaned_dir, filename)
-                    with open(content_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    
-                    # Read metadata
-                    meta_path = os.path.join(approved_cleaned_dir, f'{base_name}.meta.json')
-                    metadata = {}
-                    if os.path.exists(meta_path):
-                        with open(meta_path, 'r', encoding='utf-8') as f:
-                            metadata = json.load(f)
-                    
-                    # Count existing chunks (pending + approved)
-                    pending_chunks = 0
-                    approved_chunks = 0
-                    
-                    pending_chunk_dir = os.path.join(Config.PENDING_CHUNKED_DIR, base_name)
-                    approved_chunk_dir = os.path.join(Config.APPROVED_CHUNKED_DIR, base_name)
-                    
-                    if os.path.exists(pending_chunk_dir):
-                        pending_chunks = len([f for f in os.listdir(pending_chunk_dir) if f.endswith('.json')])
-                    
-                    if os.path.exists(approved_chunk_dir):
-                        approved_chunks = len([f for f in os.listdir(approved_chunk_dir) if f.endswith('.json')])
-                    
-                    cleaned_files.append({
-                        'filename': base_name,
-                        'language': metadata.get('language', 'ta'),
-                        'source': metadata.get('source', 'unknown'),
-                        'content': content,
-                        'content_length': len(content),
-                        'pending_chunks': pending_chunks,
-                        'approved_chunks': approved_chunks,
-                        'total_chunks': pending_chunks + approved_chunks
-                    })
-        
-        return jsonify({
+        for name in list_dir(approved_cleaned_dir).files:
+            if name[-4:] == '.txt':
+                base_name = name[:-len('.txt')]
+                
+                # Read metadata
+                meta_path = os.path.join(approved_cleaned_dir, f'{base_name}.meta.json')
+                metadata = _load_meta(meta_path)
+                
+                # Read content only when asked for
+                content_path = os.path.join(approved_cleaned_dir, name)
+                if include_content:
+                    content = read_text(content_path)
+                    content_length = len(content)
+                else:
+                    content = None
+                    content_length = metadata.get('content_length')
+                
+                # Count existing chunks (pending + approved)
+                pending_chunks = _count_json(os.path.join(Config.PENDING_CHUNKED_DIR, base_name))
+                approved_chunks = _count_json(os.path.join(Config.APPROVED_CHUNKED_DIR, base_name))
+                
+                cleaned_files.append({
+                    'filename': base_name,
+                    'language': metadata.get('language', 'ta'),
+                    'source': metadata.get('source', 'unknown'),
+                    'content': content,
+                    'content_length': content_length,
+                    'pending_chunks': pending_chunks,
+                    'approved_chunks': approved_chunks,
+                    'total_chunks': pending_chunks + approved_chunks
+                })
+        
+        return json_response({
             'success': True,
             'files': cleaned_files,
             'count': len(cleaned_files)
@@ -138,10 +268,52 @@ def list_cleaned_files():
         
     except Exception as e:
         current_app.logger.error(f'Error listing cleaned files: {str(e)}')
-        return jsonify({
+        return json_response({
             'success': False,
             'error': 'Failed to list cleaned files'
-        }), 500
+        }, 500)
+
+
+# -----------------------------------------------------------------------------
+# GET /api/chunking/cleaned-files/<filename>/content - Get Cleaned File Content
+# -----------------------------------------------------------------------------
+@chunking_bp.route('/cleaned-files/<filename>/content', methods=['GET'])
+def get_cleaned_file_content(filename):
+    """
+    Send the content of one approved cleaned file as plain text.
+    
+    The file is streamed from disk by send_from_directory, which also
+    rejects names that would escape the cleaned directory. Responses are
+    conditional: they carry an ETag and Last-Modified, repeat requests for
+    an unchanged file get a 304, and the body is handed to the server's
+    file wrapper (sendfile where supported) instead of being read into
+    Python.
+    
+    Args:
+        filename: Name of the file (without extension)
+    
+    Returns:
+        text/plain: File content, or a JSON error
+    """
+    try:
+        return send_from_directory(
+            Config.APPROVED_CLEANED_DIR,
+            f'{filename}.txt',
+            mimetype='text/plain; charset=utf-8',
+            conditional=True,
+            etag=True
+        )
+    except NotFound:
+        return json_response({
+            'success': False,
+            'error': f'Cleaned file "{filename}" not found'
+        }, 404)
+    except Exception as e:
+        current_app.logger.error(f'Error sending cleaned file: {str(e)}')
+        return json_response({
+            'success': False,
+            'error': 'Failed to read file'
+        }, 500)
 
 
 # -----------------------------------------------------------------------------
@@ -152,6 +324,9 @@ def get_chunks(filename):
     """
     Get all chunks (pending and approved) for a specific file.
     
+    The response carries an ETag built from the chunk folders and files;
+    a request whose If-None-Match still matches gets an empty 304.
+    
     Args:
         filename: Source file name
     
@@ -159,48 +334,50 @@ def get_chunks(filename):
         JSON: Array of chunk objects
     """
     try:
-        from ..config import Config
-        
         chunks = []
         
-        # Get pending chunks
         pending_dir = os.path.join(Config.PENDING_CHUNKED_DIR, filename)
-        if os.path.exists(pending_dir):
-            for chunk_file in os.listdir(pending_dir):
-                if chunk_file.endswith('.json'):
-                    chunk_path = os.path.join(pending_dir, chunk_file)
-                    with open(chunk_path, 'r', encoding='utf-8') as f:
-                        chunk = json.load(f)
-                        chunk['status'] = 'pending'
-                        chunks.append(chunk)
+        approved_dir = os.path.join(Config.APPROVED_CHUNKED_DIR, filename)
+        pending_paths = _json_files(pending_dir)
+        approved_paths = _json_files(approved_dir)
+        
+        # Skip reading anything if the client's copy is current
+        etag = stat_signature([pending_dir, approved_dir, *pending_paths, *approved_paths])
+        cached = not_modified(etag)
+        if cached is not None:
+            return cached
+        
+        # Get pending chunks
+        for chunk_path in pending_paths:
+            chunk = read_json(chunk_path)
+            chunk['status'] = 'pending'
+            chunks.append(chunk)
         
         # Get approved chunks
-        approved_dir = os.path.join(Config.APPROVED_CHUNKED_DIR, filename)
-        if os.path.exists(approved_dir):
-            for chunk_file in os.listdir(approved_dir):
-                if chunk_file.endswith('.json'):
-                    chunk_path = os.path.join(approved_dir, chunk_file)
-                    with open(chunk_path, 'r', encoding='utf-8') as f:
-                        chunk = json.load(f)
-                        chunk['status'] = 'approved'
-                        chunks.append(chunk)
+        for chunk_path in approved_paths:
+            chunk = read_json(chunk_path)
+            chunk['status'] = 'approved'
+            chunks.append(chunk)
         
         # Sort by chunk index
-        chunks.sort(key=lambda x: x.get('chunk_index', 0))
+        chunks.sort(key=_chunk_key)
         
-        return jsonify({
+        response = json_response({
             'success': True,
             'filename': filename,
             'chunks': chunks,
             'count': len(chunks)
         })
+        if etag is not None:
+            response.set_etag(etag)
+        return response
         
     except Exception as e:
         current_app.logger.error(f'Error getting chunks: {str(e)}')
-        return jsonify({
+        return json_response({
             'success': False,
             'error': 'Failed to get chunks'
-        }), 500
+        }, 500)
 
 
 # -----------------------------------------------------------------------------
@@ -220,7 +397,7 @@ def submit_chunk():
         "overlap_reference": "previous chunk context..." (optional)
     }
     
-    Chunk index is auto-calculated based on existing chunks.
+    Chunk index is auto-assigned from the source file's chunk counter.
     
     Returns:
         JSON: Success response with chunk ID
@@ -232,10 +409,10 @@ def submit_chunk():
         required_fields = ['filename', 'text', 'category']
         for field in required_fields:
             if field not in data or not data[field]:
-                return jsonify({
+                return json_response({
                     'success': False,
                     'error': f'Missing required field: {field}'
-                }), 400
+                }, 400)
         
         filename = data['filename'].strip()
         text = data['text']
@@ -243,35 +420,21 @@ def submit_chunk():
         source = data.get('source', 'unknown')
         overlap_reference = data.get('overlap_reference', '')
         
-        from ..config import Config
-        
         # Verify cleaned file exists
         cleaned_path = os.path.join(Config.APPROVED_CLEANED_DIR, f'{filename}.txt')
         if not os.path.exists(cleaned_path):
-            return jsonify({
+            return json_response({
                 'success': False,
                 'error': f'Cleaned file "{filename}" not found'
-            }), 404
+            }, 404)
         
         # Get metadata for language
         cleaned_meta = os.path.join(Config.APPROVED_CLEANED_DIR, f'{filename}.meta.json')
-        language = 'ta'
-        if os.path.exists(cleaned_meta):
-            with open(cleaned_meta, 'r', encoding='utf-8') as f:
-                meta = json.load(f)
-                language = meta.get('language', 'ta')
+        language = _load_meta(cleaned_meta).get('language', 'ta')
         
-        # Calculate chunk index
+        # Allocate chunk index
         pending_dir = os.path.join(Config.PENDING_CHUNKED_DIR, filename)
-        approved_dir = os.path.join(Config.APPROVED_CHUNKED_DIR, filename)
-        
-        existing_count = 0
-        if os.path.exists(pending_dir):
-            existing_count += len([f for f in os.listdir(pending_dir) if f.endswith('.json')])
-        if os.path.exists(approved_dir):
-            existing_count += len([f for f in os.listdir(approved_dir) if f.endswith('.json')])
-        
-        chunk_index = existing_count + 1
+        chunk_index = _reserve_chunk_indices(filename)
         
         # Generate chunk ID
         chunk_id = generate_chunk_id(language, category, filename, chunk_index)
@@ -286,7 +449,7 @@ def submit_chunk():
             'chunk_index': chunk_index,
             'source_file': filename,
             'overlap_reference': overlap_reference,
-            'created_at': datetime.now().isoformat(),
+            'created_at': now_iso(),
             'created_by': 'chunker',
             'text_length': len(text)
         }
@@ -298,10 +461,10 @@ def submit_chunk():
         chunk_filename = f'chunk_{chunk_index:02d}.json'
         chunk_path = os.path.join(pending_dir, chunk_filename)
         
-        with open(chunk_path, 'w', encoding='utf-8') as f:
-            json.dump(chunk, f, indent=2, ensure_ascii=False)
+        write_json(chunk_path, chunk, pretty=Config.PRETTY_JSON)
+        dir_cache.invalidate(pending_dir)
         
-        return jsonify({
+        return json_response({
             'success': True,
             'message': 'Chunk created. Awaiting admin approval.',
             'chunk_id': chunk_id,
@@ -311,10 +474,10 @@ def submit_chunk():
         
     except Exception as e:
         current_app.logger.error(f'Error submitting chunk: {str(e)}')
-        return jsonify({
+        return json_response({
             'success': False,
             'error': 'Failed to submit chunk'
-        }), 500
+        }, 500)
 
 
 # -----------------------------------------------------------------------------
@@ -341,58 +504,50 @@ def submit_batch():
         data = request.get_json()
         
         if 'filename' not in data or 'chunks' not in data:
-            return jsonify({
+            return json_response({
                 'success': False,
                 'error': 'Missing filename or chunks array'
-            }), 400
+            }, 400)
         
         filename = data['filename'].strip()
         chunks_data = data['chunks']
         
         if not isinstance(chunks_data, list) or len(chunks_data) == 0:
-            return jsonify({
+            return json_response({
                 'success': False,
                 'error': 'Chunks must be a non-empty array'
-            }), 400
-        
-        from ..config import Config
+            }, 400)
         
         # Verify cleaned file exists
         cleaned_path = os.path.join(Config.APPROVED_CLEANED_DIR, f'{filename}.txt')
         if not os.path.exists(cleaned_path):
-            return jsonify({
+            return json_response({
                 'success': False,
                 'error': f'Cleaned file "{filename}" not found'
-            }), 404
+            }, 404)
         
         # Get language from metadata
         cleaned_meta = os.path.join(Config.APPROVED_CLEANED_DIR, f'{filename}.meta.json')
-        language = 'ta'
-        if os.path.exists(cleaned_meta):
-            with open(cleaned_meta, 'r', encoding='utf-8') as f:
-                meta = json.load(f)
-                language = meta.get('language', 'ta')
+        language = _load_meta(cleaned_meta).get('language', 'ta')
         
-        # Get starting index
+        # Reserve indices for the whole batch at once
         pending_dir = os.path.join(Config.PENDING_CHUNKED_DIR, filename)
-        approved_dir = os.path.join(Config.APPROVED_CHUNKED_DIR, filename)
-        
-        existing_count = 0
-        if os.path.exists(pending_dir):
-            existing_count += len([f for f in os.listdir(pending_dir) if f.endswith('.json')])
-        if os.path.exists(approved_dir):
-            existing_count += len([f for f in os.listdir(approved_dir) if f.endswith('.json')])
+        first_index = _reserve_chunk_indices(filename, len(chunks_data))
         
         # Create pending directory
         os.makedirs(pending_dir, exist_ok=True)
         
         created_chunks = []
+        chunk_files = []
+        
+        # All chunks of a batch share one creation timestamp
+        created_at = now_iso()
         
         for i, chunk_data in enumerate(chunks_data):
             if 'text' not in chunk_data or 'category' not in chunk_data:
                 continue
             
-            chunk_index = existing_count + i + 1
+            chunk_index = first_index + i
             chunk_id = generate_chunk_id(language, chunk_data['category'], filename, chunk_index)
             
             chunk = {
@@ -404,23 +559,23 @@ def submit_batch():
                 'chunk_index': chunk_index,
                 'source_file': filename,
                 'overlap_reference': chunk_data.get('overlap_reference', ''),
-                'created_at': datetime.now().isoformat(),
+                'created_at': created_at,
                 'created_by': 'chunker',
                 'text_length': len(chunk_data['text'])
             }
             
-            chunk_filename = f'chunk_{chunk_index:02d}.json'
-            chunk_path = os.path.join(pending_dir, chunk_filename)
-            
-            with open(chunk_path, 'w', encoding='utf-8') as f:
-                json.dump(chunk, f, indent=2, ensure_ascii=False)
+            chunk_files.append((f'chunk_{chunk_index:02d}.json', chunk))
             
             created_chunks.append({
                 'chunk_id': chunk_id,
                 'chunk_index': chunk_index
             })
         
-        return jsonify({
+        # Written through one handle on the folder
+        write_json_files(pending_dir, chunk_files, pretty=Config.PRETTY_JSON)
+        dir_cache.invalidate(pending_dir)
+        
+        return json_response({
             'success': True,
             'message': f'{len(created_chunks)} chunks created. Awaiting admin approval.',
             'chunks': created_chunks,
@@ -429,10 +584,10 @@ def submit_batch():
         
     except Exception as e:
         current_app.logger.error(f'Error submitting batch: {str(e)}')
-        return jsonify({
+        return json_response({
             'success': False,
             'error': 'Failed to submit chunks'
-        }), 500
+        }, 500)
 
 
 # -----------------------------------------------------------------------------
@@ -443,44 +598,63 @@ def list_pending():
     """
     List all chunks pending admin approval.
     
+    Conditional like /chunks/<filename>: unchanged state gets a 304.
+    
+    The response is streamed one source file at a time, so only one
+    folder's chunks are held in memory; totals come last.
+    
     Returns:
         JSON: Array of pending chunks grouped by source file
     """
     try:
-        from ..config import Config
         pending_base = Config.PENDING_CHUNKED_DIR
         
-        pending_files = {}
-        
-        if os.path.exists(pending_base):
-            for folder_name in os.listdir(pending_base):
-                folder_path = os.path.join(pending_base, folder_name)
-                if os.path.isdir(folder_path):
-                    chunks = []
-                    for chunk_file in os.listdir(folder_path):
-                        if chunk_file.endswith('.json'):
-                            chunk_path = os.path.join(folder_path, chunk_file)
-                            with open(chunk_path, 'r', encoding='utf-8') as f:
-                                chunk = json.load(f)
-                                chunks.append(chunk)
-                    
-                    if chunks:
-                        chunks.sort(key=lambda x: x.get('chunk_index', 0))
-                        pending_files[folder_name] = chunks
-        
-        return jsonify({
-            'success': True,
-            'files': pending_files,
-            'total_files': len(pending_files),
-            'total_chunks': sum(len(c) for c in pending_files.values())
-        })
+        folders = []
+        signed_paths = [pending_base]
+        for folder_name in list_dir(pending_base).dirs:
+            folder_path = os.path.join(pending_base, folder_name)
+            chunk_paths = _json_files(folder_path)
+            folders.append((folder_name, chunk_paths))
+            signed_paths.append(folder_path)
+            signed_paths.extend(chunk_paths)
+        
+        # Skip reading anything if the client's copy is current
+        etag = stat_signature(signed_paths)
+        cached = not_modified(etag)
+        if cached is not None:
+            return cached
         
     except Exception as e:
         current_app.logger.error(f'Error listing pending chunks: {str(e)}')
-        return jsonify({
+        return json_response({
             'success': False,
             'error': 'Failed to list pending chunks'
-        }), 500
+        }, 500)
+    
+    def generate():
+        total_files = 0
+        total_chunks = 0
+        try:
+            yield b'{"success":true,"files":{'
+            for folder_name, chunk_paths in folders:
+                chunks = read_json_many(chunk_paths, cached=True)
+                if not chunks:
+                    continue
+                chunks.sort(key=_chunk_key)
+                yield (b',' if total_files else b'') + to_json_bytes(folder_name) + b':' + to_json_bytes(chunks)
+                total_files += 1
+                total_chunks += len(chunks)
+            yield b'},"total_files":' + to_json_bytes(total_files) + b',"total_chunks":' + to_json_bytes(total_chunks) + b'}'
+            
+        except Exception as e:
+            # Headers are already sent; the truncated body fails to parse
+            # on the client, which reports the error
+            current_app.logger.error(f'Error streaming pending chunks: {str(e)}')
+    
+    response = current_app.response_class(stream_with_context(generate()), mimetype='application/json')
+    if etag is not None:
+        response.set_etag(etag)
+    return response
 
 
 # -----------------------------------------------------------------------------
@@ -500,28 +674,39 @@ def delete_chunk(filename, chunk_index):
     Returns:
         JSON: Success/error response
     """
+    # Reject bad input before touching the filesystem
+    if not 0 < chunk_index <= _MAX_CHUNK_INDEX:
+        return json_response({
+            'success': False,
+            'error': 'Invalid chunk index'
+        }, 400)
+    if filename in ('.', '..') or '/' in filename or '\\' in filename:
+        return json_response({
+            'success': False,
+            'error': 'Invalid filename'
+        }, 400)
+    
     try:
-        from ..config import Config
-        
         chunk_file = f'chunk_{chunk_index:02d}.json'
         chunk_path = os.path.join(Config.PENDING_CHUNKED_DIR, filename, chunk_file)
         
-        if not os.path.exists(chunk_path):
-            return jsonify({
+        try:
+            os.unlink(chunk_path)
+        except FileNotFoundError:
+            return json_response({
                 'success': False,
                 'error': 'Chunk not found or already approved'
-            }), 404
-        
-        os.remove(chunk_path)
+            }, 404)
+        dir_cache.invalidate(os.path.dirname(chunk_path))
         
-        return jsonify({
+        return json_response({
             'success': True,
             'message': 'Chunk deleted successfully'
         })
         
     except Exception as e:
         current_app.logger.error(f'Error deleting chunk: {str(e)}')
-        return jsonify({
+        return json_response({
             'success': False,
             'error': 'Failed to delete chunk'
-        }), 500
+        }, 500)
@@ -13,24 +13,156 @@ Workflow:
 
 Endpoints:
     GET  /api/cleaning/raw-files      - List available raw files
+    GET  /api/cleaning/raw-files/<name>/content - Get raw file content
     POST /api/cleaning/submit         - Submit cleaned data
     GET  /api/cleaning/pending        - List pending cleaned files
     GET  /api/cleaning/approved       - List approved cleaned files
-    GET  /api/cleaning/file/<name>    - Get cleaned file content
+    GET  /api/cleaning/overview       - Raw, pending and approved lists at once
+    GET  /api/cleaning/file/<name>    - Get cleaned file content (?raw=1 for text)
 =============================================================================
 """
 
-from flask import Blueprint, request, jsonify, current_app
+from flask import Blueprint, request, current_app, send_from_directory
+from werkzeug.exceptions import NotFound
 import os
-import json
-from datetime import datetime
-import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from ..config import Config
+from ..models.schemas import new_id, now_iso
+from ..services.dir_cache import list_dir, stat_signature
+from ..services.json_io import (
+    files_response, json_response, not_modified, read_json_cached, read_json_dir,
+    read_json_dir_encoded, read_text, write_json, write_text
+)
 
 # -----------------------------------------------------------------------------
 # Create Blueprint
 # -----------------------------------------------------------------------------
 cleaning_bp = Blueprint('cleaning', __name__)
 
+# Characters shown in a file's list preview
+_PREVIEW_CHARS = 200
+
+# Builds the three /overview lists side by side; threads start on first use.
+# Separate from json_io's read pool, which the list builders use themselves.
+_OVERVIEW_POOL = ThreadPoolExecutor(max_workers=3, thread_name_prefix='cleaning-overview')
+
+
+# -----------------------------------------------------------------------------
+# Helper: List Text Files
+# -----------------------------------------------------------------------------
+def _txt_stems(directory):
+    """
+    Names (without .txt) of the text files in a directory.
+    
+    Uses the shared directory cache, so an unchanged directory costs one
+    stat() instead of a scan.
+    
+    Args:
+        directory: Directory to list (missing directories give no names)
+    
+    Returns:
+        set: File names without the .txt extension
+    """
+    return {name[:-4] for name in list_dir(directory).files if name[-4:] == '.txt'}
+
+
+# -----------------------------------------------------------------------------
+# Helper: Read Content Preview
+# -----------------------------------------------------------------------------
+def _read_preview(path):
+    """
+    Build a list preview from the start of a text file.
+    
+    Only the first bytes that can hold the preview are read (UTF-8 uses
+    at most 4 bytes per character), not the whole file.
+    
+    Args:
+        path: Path to the UTF-8 text file
+    
+    Returns:
+        str: First characters of the file, with '...' if truncated
+    """
+    with open(path, 'rb') as f:
+        head = f.read(_PREVIEW_CHARS * 4 + 4)
+    # A character cut in half at the end of the read is dropped
+    text = head.decode('utf-8', errors='ignore')
+    return text[:_PREVIEW_CHARS] + '...' if len(text) > _PREVIEW_CHARS else text
+
+
+# -----------------------------------------------------------------------------
+# Helpers: Listings
+# -----------------------------------------------------------------------------
+def _raw_file_entries(include_content=False):
+    """
+    Build the /raw-files entry for every approved raw file.
+    
+    Args:
+        include_content: Include each file's full content
+    
+    Returns:
+        list: File entries with preview and cleaning status
+    """
+    approved_raw_dir = Config.APPROVED_RAW_DIR
+    
+    raw_files = []
+    
+    # Cleaning status comes from set lookups against one listing of
+    # each cleaned directory instead of two exists() probes per file
+    cleaned_pending = _txt_stems(Config.PENDING_CLEANED_DIR)
+    cleaned_approved = _txt_stems(Config.APPROVED_CLEANED_DIR)
+    
+    # Get all approved raw files
+    for filename in list_dir(approved_raw_dir).files:
+        if filename[-4:] != '.txt':
+            continue
+        base_name = filename[:-4]
+        meta_path = os.path.join(approved_raw_dir, f'{base_name}.meta.json')
+        
+        try:
+            metadata = read_json_cached(meta_path)
+        except FileNotFoundError:
+            metadata = {}
+        
+        # Read content only when asked for; otherwise just the preview
+        content_path = os.path.join(approved_raw_dir, filename)
+        if include_content:
+            content = read_text(content_path)
+            content_length = len(content)
+            content_preview = content[:_PREVIEW_CHARS] + '...' if len(content) > _PREVIEW_CHARS else content
+        else:
+            content = None
+            content_length = metadata.get('content_length')
+            content_preview = _read_preview(content_path)
+        
+        raw_files.append({
+            'filename': base_name,
+            'language': metadata.get('language', 'ta'),
+            'source': metadata.get('source', 'unknown'),
+            'content_length': content_length,
+            'content_preview': content_preview,
+            'content': content,  # Full content, only with include_content
+            'cleaning_status': 'approved' if base_name in cleaned_approved else ('pending' if base_name in cleaned_pending else 'not_started')
+        })
+    
+    return raw_files
+
+
+def _sorted_meta(directory, field):
+    """
+    Metadata of every file in a directory, newest first.
+    
+    The parsed, sorted list is reused while the directory is unchanged.
+    
+    Args:
+        directory: Pending or approved cleaned directory
+        field: Timestamp field to sort by ('submitted_at', 'approved_at')
+    
+    Returns:
+        list: Metadata dicts (shared; do not modify)
+    """
+    return read_json_dir(directory, sort_by=field, reverse=True)
+
 
 # -----------------------------------------------------------------------------
 # GET /api/cleaning/raw-files - List Available Raw Files
@@ -45,51 +177,23 @@ def list_raw_files():
     2. Approved by admin
     3. Pushed to mozhii-raw-data repo
     
+    Only a preview of each file is included unless the full content is
+    requested; the UI fetches a file's content from
+    /raw-files/<filename>/content when it is selected. content_length then
+    comes from the file's metadata (a character count, or null for files
+    without one).
+    
+    Query params:
+        include_content: "1" to include each file's full content
+    
     Returns:
         JSON: Array of raw files available for cleaning
     """
     try:
-        from ..config import Config
-        approved_raw_dir = Config.APPROVED_RAW_DIR
-        
-        raw_files = []
-        
-        # Get all approved raw files
-        if os.path.exists(approved_raw_dir):
-            for filename in os.listdir(approved_raw_dir):
-                if filename.endswith('.txt'):
-                    base_name = filename.replace('.txt', '')
-                    meta_path = os.path.join(approved_raw_dir, f'{base_name}.meta.json')
-                    
-                    # Read content preview and metadata
-                    content_path = os.path.join(approved_raw_dir, filename)
-                    with open(content_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    
-                    metadata = {}
-                    if os.path.exists(meta_path):
-                        with open(meta_path, 'r', encoding='utf-8') as f:
-                            metadata = json.load(f)
-                    
-                    # Check if already cleaned
-                    cleaned_pending = os.path.exists(
-                        os.path.join(Config.PENDING_CLEANED_DIR, f'{base_name}.txt')
-                    )
-                    cleaned_approved = os.path.exists(
-                        os.path.join(Config.APPROVED_CLEANED_DIR, f'{base_name}.txt')
-                    )
-                    
-                    raw_files.append({
-                        'filename': base_name,
-                        'language': metadata.get('language', 'ta'),
-                        'source': metadata.get('source', 'unknown'),
-                        'content_length': len(content),
-                        'content_preview': content[:200] + '...' if len(content) > 200 else content,
-                        'content': content,  # Full content for cleaning
-                        'cleaning_status': 'approved' if cleaned_approved else ('pending' if cleaned_pending else 'not_started')
-                    })
+        include_content = request.args.get('include_content', '0') == '1'
+        raw_files = _raw_file_entries(include_content)
         
-        return jsonify({
+        return json_response({
             'success': True,
             'files': raw_files,
             'count': len(raw_files)
@@ -97,10 +201,49 @@ def list_raw_files():
         
     except Exception as e:
         current_app.logger.error(f'Error listing raw files: {str(e)}')
-        return jsonify({
+        return json_response({
             'success': False,
             'error': 'Failed to list raw files'
-        }), 500
+        }, 500)
+
+
+# -----------------------------------------------------------------------------
+# GET /api/cleaning/raw-files/<filename>/content - Get Raw File Content
+# -----------------------------------------------------------------------------
+@cleaning_bp.route('/raw-files/<filename>/content', methods=['GET'])
+def get_raw_file_content(filename):
+    """
+    Send the content of one approved raw file as plain text.
+    
+    Served like /api/chunking/cleaned-files/<filename>/content: streamed
+    from disk with an ETag, so repeat requests for an unchanged file get
+    a 304.
+    
+    Args:
+        filename: Name of the file (without extension)
+    
+    Returns:
+        text/plain: File content, or a JSON error
+    """
+    try:
+        return send_from_directory(
+            Config.APPROVED_RAW_DIR,
+            f'{filename}.txt',
+            mimetype='text/plain; charset=utf-8',
+            conditional=True,
+            etag=True
+        )
+    except NotFound:
+        return json_response({
+            'success': False,
+            'error': f'Raw file "{filename}" not found'
+        }, 404)
+    except Exception as e:
+        current_app.logger.error(f'Error sending raw file: {str(e)}')
+        return json_response({
+            'success': False,
+            'error': 'Failed to read file'
+        }, 500)
 
 
 # -----------------------------------------------------------------------------
@@ -128,40 +271,38 @@ def submit_cleaned_data():
         
         # Validate required fields
         if 'filename' not in data or 'content' not in data:
-            return jsonify({
+            return json_response({
                 'success': False,
                 'error': 'Missing filename or content'
-            }), 400
+            }, 400)
         
         filename = data['filename'].strip()
         content = data['content']
         
-        from ..config import Config
-        
         # Verify that the raw file exists
         raw_path = os.path.join(Config.APPROVED_RAW_DIR, f'{filename}.txt')
         if not os.path.exists(raw_path):
-            return jsonify({
+            return json_response({
                 'success': False,
                 'error': f'Raw file "{filename}" not found. Can only clean approved raw files.'
-            }), 404
+            }, 404)
         
         # Load original metadata
         raw_meta_path = os.path.join(Config.APPROVED_RAW_DIR, f'{filename}.meta.json')
-        original_metadata = {}
-        if os.path.exists(raw_meta_path):
-            with open(raw_meta_path, 'r', encoding='utf-8') as f:
-                original_metadata = json.load(f)
+        try:
+            original_metadata = read_json_cached(raw_meta_path)
+        except FileNotFoundError:
+            original_metadata = {}
         
         # Create cleaned file metadata
         cleaned_metadata = {
-            'id': str(uuid.uuid4()),
+            'id': new_id(),
             'filename': filename,
             'language': original_metadata.get('language', 'ta'),
             'source': original_metadata.get('source', 'unknown'),
             'original_raw_id': original_metadata.get('id', ''),
             'content_length': len(content),
-            'submitted_at': datetime.now().isoformat(),
+            'submitted_at': now_iso(),
             'status': 'pending',
             'submitted_by': 'cleaner'
         }
@@ -173,19 +314,17 @@ def submit_cleaned_data():
         
         # Check if already pending
         if os.path.exists(content_path):
-            return jsonify({
+            return json_response({
                 'success': False,
                 'error': f'File "{filename}" already in cleaning queue'
-            }), 409
-        
-        # Save files
-        with open(content_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+            }, 409)
         
-        with open(metadata_path, 'w', encoding='utf-8') as f:
-            json.dump(cleaned_metadata, f, indent=2, ensure_ascii=False)
+        # Save files (metadata last, so the submission only appears in
+        # the .meta.json-driven listings once both files are complete)
+        write_text(content_path, content)
+        write_json(metadata_path, cleaned_metadata, pretty=Config.PRETTY_JSON)
         
-        return jsonify({
+        return json_response({
             'success': True,
             'message': 'Cleaned data submitted. Awaiting admin approval.',
             'submission_id': cleaned_metadata['id'],
@@ -194,10 +333,10 @@ def submit_cleaned_data():
         
     except Exception as e:
         current_app.logger.error(f'Error submitting cleaned data: {str(e)}')
-        return jsonify({
+        return json_response({
             'success': False,
             'error': 'Failed to submit cleaned data'
-        }), 500
+        }, 500)
 
 
 # -----------------------------------------------------------------------------
@@ -212,33 +351,31 @@ def list_pending():
         JSON: Array of pending cleaned file metadata
     """
     try:
-        from ..config import Config
         pending_dir = Config.PENDING_CLEANED_DIR
         
-        pending_files = []
-        
-        if os.path.exists(pending_dir):
-            for filename in os.listdir(pending_dir):
-                if filename.endswith('.meta.json'):
-                    meta_path = os.path.join(pending_dir, filename)
-                    with open(meta_path, 'r', encoding='utf-8') as f:
-                        metadata = json.load(f)
-                        pending_files.append(metadata)
+        # Answer 304 before reading anything if the directory is unchanged
+        # (metadata is always rewritten by rename, which touches the dir)
+        etag = stat_signature([pending_dir])
+        cached = not_modified(etag)
+        if cached is not None:
+            return cached
         
-        pending_files.sort(key=lambda x: x.get('submitted_at', ''), reverse=True)
+        # Parsed, sorted (newest first) and serialized once per directory change
+        pending_files, files_json = read_json_dir_encoded(
+            pending_dir, sort_by='submitted_at', reverse=True
+        )
         
-        return jsonify({
-            'success': True,
-            'files': pending_files,
-            'count': len(pending_files)
-        })
+        response = files_response(pending_files, files_json)
+        if etag is not None:
+            response.set_etag(etag)
+        return response
         
     except Exception as e:
         current_app.logger.error(f'Error listing pending cleaned files: {str(e)}')
-        return jsonify({
+        return json_response({
             'success': False,
             'error': 'Failed to list pending files'
-        }), 500
+        }, 500)
 
 
 # -----------------------------------------------------------------------------
@@ -253,33 +390,71 @@ def list_approved():
         JSON: Array of approved cleaned file metadata
     """
     try:
-        from ..config import Config
         approved_dir = Config.APPROVED_CLEANED_DIR
         
-        approved_files = []
+        # Answer 304 before reading anything if the directory is unchanged
+        # (metadata is always rewritten by rename, which touches the dir)
+        etag = stat_signature([approved_dir])
+        cached = not_modified(etag)
+        if cached is not None:
+            return cached
         
-        if os.path.exists(approved_dir):
-            for filename in os.listdir(approved_dir):
-                if filename.endswith('.meta.json'):
-                    meta_path = os.path.join(approved_dir, filename)
-                    with open(meta_path, 'r', encoding='utf-8') as f:
-                        metadata = json.load(f)
-                        approved_files.append(metadata)
+        # Parsed, sorted (newest first) and serialized once per directory change
+        approved_files, files_json = read_json_dir_encoded(
+            approved_dir, sort_by='approved_at', reverse=True
+        )
         
-        approved_files.sort(key=lambda x: x.get('approved_at', ''), reverse=True)
+        response = files_response(approved_files, files_json)
+        if etag is not None:
+            response.set_etag(etag)
+        return response
         
-        return jsonify({
+    except Exception as e:
+        current_app.logger.error(f'Error listing approved cleaned files: {str(e)}')
+        return json_response({
+            'success': False,
+            'error': 'Failed to list approved files'
+        }, 500)
+
+
+# -----------------------------------------------------------------------------
+# GET /api/cleaning/overview - Raw, Pending and Approved Lists Together
+# -----------------------------------------------------------------------------
+@cleaning_bp.route('/overview', methods=['GET'])
+def get_overview():
+    """
+    List raw files, pending and approved cleaned files in one response.
+    
+    Same entries as /raw-files, /pending and /approved, for clients that
+    need all three: one request instead of three. The three lists are
+    built concurrently, since each is dominated by file I/O.
+    
+    Query params:
+        include_content: "1" to include each raw file's full content
+    
+    Returns:
+        JSON: Object with raw, pending and approved arrays
+    """
+    try:
+        include_content = request.args.get('include_content', '0') == '1'
+        
+        raw = _OVERVIEW_POOL.submit(_raw_file_entries, include_content)
+        pending = _OVERVIEW_POOL.submit(_sorted_meta, Config.PENDING_CLEANED_DIR, 'submitted_at')
+        approved = _OVERVIEW_POOL.submit(_sorted_meta, Config.APPROVED_CLEANED_DIR, 'approved_at')
+        
+        return json_response({
             'success': True,
-            'files': approved_files,
-            'count': len(approved_files)
+            'raw': raw.result(),
+            'pending': pending.result(),
+            'approved': approved.result()
         })
         
     except Exception as e:
-        current_app.logger.error(f'Error listing approved cleaned files: {str(e)}')
-        return jsonify({
+        current_app.logger.error(f'Error building cleaning overview: {str(e)}')
+        return json_response({
             'success': False,
-            'error': 'Failed to list approved files'
-        }), 500
+            'error': 'Failed to build overview'
+        }, 500)
 
 
 # -----------------------------------------------------------------------------
@@ -290,42 +465,44 @@ def get_file_content(filename):
     """
     Get content of a cleaned file.
     
+    With ?raw=1 only the text is returned, as text/plain streamed from
+    disk by send_from_directory (sendfile where supported, with ETag and
+    range support); metadata is then left to the JSON form.
+    
     Args:
         filename: Name of the file (without extension)
     
+    Query params:
+        raw: "1" to get the file content as plain text
+    
     Returns:
-        JSON: File content and metadata
+        JSON: File content and metadata (text/plain with raw=1)
     """
     try:
-        from ..config import Config
-        
-        # Check pending first
-        pending_path = os.path.join(Config.PENDING_CLEANED_DIR, f'{filename}.txt')
-        pending_meta = os.path.join(Config.PENDING_CLEANED_DIR, f'{filename}.meta.json')
-        
-        # Check approved
-        approved_path = os.path.join(Config.APPROVED_CLEANED_DIR, f'{filename}.txt')
-        approved_meta = os.path.join(Config.APPROVED_CLEANED_DIR, f'{filename}.meta.json')
-        
-        if os.path.exists(pending_path):
-            with open(pending_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            with open(pending_meta, 'r', encoding='utf-8') as f:
-                metadata = json.load(f)
-            location = 'pending'
-        elif os.path.exists(approved_path):
-            with open(approved_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            with open(approved_meta, 'r', encoding='utf-8') as f:
-                metadata = json.load(f)
-            location = 'approved'
+        # Check the pending directory first, then approved
+        if os.path.exists(os.path.join(Config.PENDING_CLEANED_DIR, f'{filename}.txt')):
+            directory, location = Config.PENDING_CLEANED_DIR, 'pending'
+        elif os.path.exists(os.path.join(Config.APPROVED_CLEANED_DIR, f'{filename}.txt')):
+            directory, location = Config.APPROVED_CLEANED_DIR, 'approved'
         else:
-            return jsonify({
+            return json_response({
                 'success': False,
                 'error': f'Cleaned file "{filename}" not found'
-            }), 404
+            }, 404)
         
-        return jsonify({
+        if request.args.get('raw') == '1':
+            return send_from_directory(
+                directory,
+                f'{filename}.txt',
+                mimetype='text/plain; charset=utf-8',
+                conditional=True,
+                etag=True
+            )
+        
+        content = read_text(os.path.join(directory, f'{filename}.txt'))
+        metadata = read_json_cached(os.path.join(directory, f'{filename}.meta.json'))
+        
+        return json_response({
             'success': True,
             'filename': filename,
             'content': content,
@@ -333,9 +510,14 @@ def get_file_content(filename):
             'location': location
         })
         
+    except NotFound:
+        return json_response({
+            'success': False,
+            'error': f'Cleaned file "{filename}" not found'
+        }, 404)
     except Exception as e:
         current_app.logger.error(f'Error reading cleaned file: {str(e)}')
-        return jsonify({
+        return json_response({
             'success': False,
             'error': 'Failed to read file'
-        }), 500
+        }, 500)
@@ -13,6 +13,10 @@ The main blueprint uses no URL prefix, so routes are at the root level.
 """
 
 from flask import Blueprint, render_template, jsonify, current_app
+import hashlib
+
+from ..config import Config
+from ..services.json_io import not_modified, to_json_bytes
 
 # -----------------------------------------------------------------------------
 # Create Blueprint
@@ -21,6 +25,21 @@ from flask import Blueprint, render_template, jsonify, current_app
 # 'main' is the blueprint name, __name__ helps Flask find resources
 main_bp = Blueprint('main', __name__)
 
+# The /api/config body only depends on Config, which is fixed for the
+# life of the process, so it is serialized (and its ETag computed) once
+_CONFIG_JSON = to_json_bytes({
+    'languages': dict(Config.SUPPORTED_LANGUAGES),
+    'defaultLanguage': Config.DEFAULT_LANGUAGE,
+    'categories': Config.CATEGORIES,
+    'sourceTypes': Config.SOURCE_TYPES,
+    'hfRepos': {
+        'raw': Config.HF_RAW_REPO,
+        'cleaned': Config.HF_CLEANED_REPO,
+        'chunked': Config.HF_CHUNKED_REPO
+    }
+})
+_CONFIG_ETAG = hashlib.blake2b(_CONFIG_JSON, digest_size=12).hexdigest()
+
 
 # -----------------------------------------------------------------------------
 # Index Route - Serve Main Application
@@ -74,19 +93,16 @@ def get_config():
     This endpoint exposes safe configuration values that the frontend
     needs to operate. Sensitive values like tokens are NOT exposed.
     
+    The body is prebuilt at import time; clients revalidating with the
+    ETag get a 304.
+    
     Returns:
         JSON: Configuration object with languages, categories, sources
     """
-    from ..config import Config
+    cached = not_modified(_CONFIG_ETAG)
+    if cached is not None:
+        return cached
     
-    return jsonify({
-        'languages': Config.SUPPORTED_LANGUAGES,
-        'defaultLanguage': Config.DEFAULT_LANGUAGE,
-        'categories': Config.CATEGORIES,
-        'sourceTypes': Config.SOURCE_TYPES,
-        'hfRepos': {
-            'raw': Config.HF_RAW_REPO,
-            'cleaned': Config.HF_CLEANED_REPO,
-            'chunked': Config.HF_CHUNKED_REPO
-        }
-    })
+    response = current_app.response_class(_CONFIG_JSON, mimetype='application/json')
+    response.set_etag(_CONFIG_ETAG)
+    return response
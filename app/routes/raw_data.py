@@ -14,21 +14,32 @@ Endpoints:
     POST /api/raw/submit     - Submit new raw data
     GET  /api/raw/pending    - List pending submissions
     GET  /api/raw/approved   - List approved files
-    GET  /api/raw/file/<id>  - Get specific file content
+    GET  /api/raw/file/<id>  - Get specific file content (?raw=1 for text)
 =============================================================================
 """
 
-from flask import Blueprint, request, jsonify, current_app
+from flask import Blueprint, request, current_app, send_from_directory
+from werkzeug.exceptions import NotFound
 import os
-import json
-from datetime import datetime
-import uuid
+import re
+
+from ..config import Config
+from ..models.schemas import new_id, now_iso
+from ..services.dir_cache import stat_signature
+from ..services.json_io import (
+    files_response, json_response, not_modified, read_json_cached, read_json_dir_encoded,
+    read_text, write_json, write_text
+)
 
 # -----------------------------------------------------------------------------
 # Create Blueprint
 # -----------------------------------------------------------------------------
 raw_data_bp = Blueprint('raw_data', __name__)
 
+# Valid filenames: letters, digits, underscores and hyphens, with at least
+# one letter or digit (\w is Unicode-aware, like str.isalnum)
+_FILENAME_RE = re.compile(r'[\w-]*[^\W_][\w-]*')
+
 
 # -----------------------------------------------------------------------------
 # Helper Function: Generate Metadata
@@ -47,12 +58,12 @@ def generate_metadata(filename, language, source, content):
         dict: Metadata object with all required fields
     """
     return {
-        'id': str(uuid.uuid4()),                    # Unique identifier
+        'id': new_id(),                               # Unique, time-ordered identifier
         'filename': filename,                         # File name
         'language': language,                         # Language code
         'source': source,                             # Source type
         'content_length': len(content),               # Character count
-        'submitted_at': datetime.now().isoformat(),   # Submission timestamp
+        'submitted_at': now_iso(),   # Submission timestamp
         'status': 'pending',                          # Approval status
         'submitted_by': 'collector'                   # Role (for audit)
     }
@@ -88,10 +99,10 @@ def submit_raw_data():
         required_fields = ['filename', 'language', 'source', 'content']
         for field in required_fields:
             if field not in data or not data[field]:
-                return jsonify({
+                return json_response({
                     'success': False,
                     'error': f'Missing required field: {field}'
-                }), 400
+                }, 400)
         
         # Extract fields
         filename = data['filename'].strip()
@@ -100,17 +111,16 @@ def submit_raw_data():
         content = data['content']
         
         # Validate filename (no special characters)
-        if not filename.replace('_', '').replace('-', '').isalnum():
-            return jsonify({
+        if not _FILENAME_RE.fullmatch(filename):
+            return json_response({
                 'success': False,
                 'error': 'Filename can only contain letters, numbers, underscores, and hyphens'
-            }), 400
+            }, 400)
         
         # Generate metadata
         metadata = generate_metadata(filename, language, source, content)
         
         # Get pending directory path from config
-        from ..config import Config
         pending_dir = Config.PENDING_RAW_DIR
         
         # Create file paths
@@ -119,21 +129,20 @@ def submit_raw_data():
         
         # Check if file already exists
         if os.path.exists(content_path):
-            return jsonify({
+            return json_response({
                 'success': False,
                 'error': f'File "{filename}" already exists in pending queue'
-            }), 409
+            }, 409)
         
         # Save content file
-        with open(content_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        write_text(content_path, content)
         
-        # Save metadata file
-        with open(metadata_path, 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, indent=2, ensure_ascii=False)
+        # Save metadata file last: listings are driven by .meta.json, so
+        # the submission only appears once both files are complete
+        write_json(metadata_path, metadata, pretty=Config.PRETTY_JSON)
         
         # Return success response
-        return jsonify({
+        return json_response({
             'success': True,
             'message': 'Raw data submitted successfully. Awaiting admin approval.',
             'submission_id': metadata['id'],
@@ -143,10 +152,10 @@ def submit_raw_data():
     except Exception as e:
         # Log error and return error response
         current_app.logger.error(f'Error submitting raw data: {str(e)}')
-        return jsonify({
+        return json_response({
             'success': False,
             'error': 'An unexpected error occurred. Please try again.'
-        }), 500
+        }, 500)
 
 
 # -----------------------------------------------------------------------------
@@ -161,35 +170,31 @@ def list_pending():
         JSON: Array of pending file metadata
     """
     try:
-        from ..config import Config
         pending_dir = Config.PENDING_RAW_DIR
         
-        pending_files = []
-        
-        # Iterate through all .meta.json files in pending directory
-        if os.path.exists(pending_dir):
-            for filename in os.listdir(pending_dir):
-                if filename.endswith('.meta.json'):
-                    meta_path = os.path.join(pending_dir, filename)
-                    with open(meta_path, 'r', encoding='utf-8') as f:
-                        metadata = json.load(f)
-                        pending_files.append(metadata)
+        # Answer 304 before reading anything if the directory is unchanged
+        # (metadata is always rewritten by rename, which touches the dir)
+        etag = stat_signature([pending_dir])
+        cached = not_modified(etag)
+        if cached is not None:
+            return cached
         
-        # Sort by submission time (newest first)
-        pending_files.sort(key=lambda x: x.get('submitted_at', ''), reverse=True)
+        # Parsed, sorted (newest first) and serialized once per directory change
+        pending_files, files_json = read_json_dir_encoded(
+            pending_dir, sort_by='submitted_at', reverse=True
+        )
         
-        return jsonify({
-            'success': True,
-            'files': pending_files,
-            'count': len(pending_files)
-        })
+        response = files_response(pending_files, files_json)
+        if etag is not None:
+            response.set_etag(etag)
+        return response
         
     except Exception as e:
         current_app.logger.error(f'Error listing pending files: {str(e)}')
-        return jsonify({
+        return json_response({
             'success': False,
             'error': 'Failed to list pending files'
-        }), 500
+        }, 500)
 
 
 # -----------------------------------------------------------------------------
@@ -206,35 +211,31 @@ def list_approved():
         JSON: Array of approved file metadata
     """
     try:
-        from ..config import Config
         approved_dir = Config.APPROVED_RAW_DIR
         
-        approved_files = []
+        # Answer 304 before reading anything if the directory is unchanged
+        # (metadata is always rewritten by rename, which touches the dir)
+        etag = stat_signature([approved_dir])
+        cached = not_modified(etag)
+        if cached is not None:
+            return cached
         
-        # Iterate through all .meta.json files in approved directory
-        if os.path.exists(approved_dir):
-            for filename in os.listdir(approved_dir):
-                if filename.endswith('.meta.json'):
-                    meta_path = os.path.join(approved_dir, filename)
-                    with open(meta_path, 'r', encoding='utf-8') as f:
-                        metadata = json.load(f)
-                        approved_files.append(metadata)
+        # Parsed, sorted (newest first) and serialized once per directory change
+        approved_files, files_json = read_json_dir_encoded(
+            approved_dir, sort_by='approved_at', reverse=True
+        )
         
-        # Sort by approval time (newest first)
-        approved_files.sort(key=lambda x: x.get('approved_at', ''), reverse=True)
-        
-        return jsonify({
-            'success': True,
-            'files': approved_files,
-            'count': len(approved_files)
-        })
+        response = files_response(approved_files, files_json)
+        if etag is not None:
+            response.set_etag(etag)
+        return response
         
     except Exception as e:
         current_app.logger.error(f'Error listing approved files: {str(e)}')
-        return jsonify({
+        return json_response({
             'success': False,
             'error': 'Failed to list approved files'
-        }), 500
+        }, 500)
 
 
 # -----------------------------------------------------------------------------
@@ -247,48 +248,44 @@ def get_file_content(filename):
     
     Checks both pending and approved directories.
     
+    With ?raw=1 only the text is returned, as text/plain streamed from
+    disk by send_from_directory (sendfile where supported, with ETag and
+    range support); metadata is then left to the JSON form.
+    
     Args:
         filename: Name of the file (without .txt extension)
     
+    Query params:
+        raw: "1" to get the file content as plain text
+    
     Returns:
-        JSON: File content and metadata
+        JSON: File content and metadata (text/plain with raw=1)
     """
     try:
-        from ..config import Config
-        
-        # Check pending directory first
-        pending_content_path = os.path.join(Config.PENDING_RAW_DIR, f'{filename}.txt')
-        pending_meta_path = os.path.join(Config.PENDING_RAW_DIR, f'{filename}.meta.json')
-        
-        # Check approved directory
-        approved_content_path = os.path.join(Config.APPROVED_RAW_DIR, f'{filename}.txt')
-        approved_meta_path = os.path.join(Config.APPROVED_RAW_DIR, f'{filename}.meta.json')
-        
-        content = None
-        metadata = None
-        location = None
-        
-        # Try pending first
-        if os.path.exists(pending_content_path):
-            with open(pending_content_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            with open(pending_meta_path, 'r', encoding='utf-8') as f:
-                metadata = json.load(f)
-            location = 'pending'
-        # Try approved
-        elif os.path.exists(approved_content_path):
-            with open(approved_content_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            with open(approved_meta_path, 'r', encoding='utf-8') as f:
-                metadata = json.load(f)
-            location = 'approved'
+        # Check the pending directory first, then approved
+        if os.path.exists(os.path.join(Config.PENDING_RAW_DIR, f'{filename}.txt')):
+            directory, location = Config.PENDING_RAW_DIR, 'pending'
+        elif os.path.exists(os.path.join(Config.APPROVED_RAW_DIR, f'{filename}.txt')):
+            directory, location = Config.APPROVED_RAW_DIR, 'approved'
         else:
-            return jsonify({
+            return json_response({
                 'success': False,
                 'error': f'File "{filename}" not found'
-            }), 404
+            }, 404)
+        
+        if request.args.get('raw') == '1':
+            return send_from_directory(
+                directory,
+                f'{filename}.txt',
+                mimetype='text/plain; charset=utf-8',
+                conditional=True,
+                etag=True
+            )
         
-        return jsonify({
+        content = read_text(os.path.join(directory, f'{filename}.txt'))
+        metadata = read_json_cached(os.path.join(directory, f'{filename}.meta.json'))
+        
+        return json_response({
             'success': True,
             'filename': filename,
             'content': content,
@@ -296,9 +293,14 @@ def get_file_content(filename):
             'location': location
         })
         
+    except NotFound:
+        return json_response({
+            'success': False,
+            'error': f'File "{filename}" not found'
+        }, 404)
     except Exception as e:
         current_app.logger.error(f'Error reading file {filename}: {str(e)}')
-        return jsonify({
+        return json_response({
             'success': False,
             'error': 'Failed to read file'
-        }), 500
+        }, 500)
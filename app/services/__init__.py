@@ -7,12 +7,38 @@ This package contains service modules for business logic.
 Services:
     - huggingface: HuggingFace Hub integration for data sync
     - storage: Local file storage management
+    - json_io: orjson-backed JSON file and response helpers
+    - meta_cache: In-memory cache of parsed metadata/chunk files
+    - dir_cache: Directory listing cache validated by directory mtime
 
 Services encapsulate complex operations and keep routes clean.
+
+Service classes are imported lazily (PEP 562), so importing a light helper
+such as app.services.json_io does not pull in huggingface_hub.
 =============================================================================
 """
 
-from .huggingface import HuggingFaceService
-from .storage import StorageService
+import importlib
+
+# Map each exported service class to the module that defines it
+_SERVICES = {
+    'HuggingFaceService': 'app.services.huggingface',
+    'StorageService': 'app.services.storage'
+}
+
+__all__ = list(_SERVICES)
+
 
-__all__ = ['HuggingFaceService', 'StorageService']
+def __getattr__(name):
+    """
+    Import a service class's module on first access.
+    
+    The resolved class is stored in the package globals so later
+    lookups are plain attribute reads.
+    """
+    if name in _SERVICES:
+        module = importlib.import_module(_SERVICES[name])
+        service = getattr(module, name)
+        globals()[name] = service
+        return service
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
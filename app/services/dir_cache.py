@@ -0,0 +1,162 @@
+"""
+=============================================================================
+Mozhii RAG Data Platform - Directory Listing Cache
+=============================================================================
+In-process cache of directory listings for the pending/approved data
+directories, so back-to-back admin polls (/pending then /stats) don't
+re-scan directories that have not changed.
+
+Each listing is validated against the directory's st_mtime_ns on every
+lookup. Creating, renaming or deleting an entry updates the directory's
+mtime, so one stat() replaces a full scandir when nothing has changed.
+Edits to a file's contents do not change its directory's mtime, which
+is fine here: only names and entry types are cached.
+
+Directory timestamps advance in coarse ticks (a few milliseconds), so
+two changes close together can leave the mtime unchanged. A listing is
+therefore only reused when the directory was last modified well before
+it was scanned; recently changed directories are always re-scanned.
+The chunking routes also invalidate a folder after writing chunks.
+
+The cache is bounded with LRU eviction, since chunked/ holds one
+sub-directory per source file and grows with the dataset.
+=============================================================================
+"""
+
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from typing import Iterable, Optional
+
+# Names of the regular files and sub-directories in a directory
+DirListing = namedtuple('DirListing', ['files', 'dirs'])
+
+# Listing returned for directories that do not exist
+_EMPTY = DirListing((), ())
+
+# A listing is only reused if the directory's mtime is at least this much
+# older than the scan, comfortably above the kernel timestamp granularity
+_RACY_WINDOW_NS = 50_000_000
+
+
+class DirCache:
+    """
+    Thread-safe LRU cache of directory listings, validated by directory mtime.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        """
+        Initialize an empty cache.
+
+        Args:
+            maxsize: Maximum number of directories kept in memory
+        """
+        self.maxsize = maxsize
+        self._entries = OrderedDict()   # path -> (mtime_ns, stable, DirListing)
+        self._lock = threading.Lock()
+
+    def list(self, path: str) -> DirListing:
+        """
+        Return the listing of a directory, re-scanning it only if changed.
+
+        Args:
+            path: Directory to list
+
+        Returns:
+            DirListing: File and sub-directory names (empty if missing)
+        """
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            return _EMPTY
+
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry[1] and entry[0] == mtime:
+                self._entries.move_to_end(path)
+                return entry[2]
+
+        # Taken before the scan: a change landing during the scan could
+        # share the recorded mtime, so only older mtimes count as stable
+        stable = time.time_ns() - mtime > _RACY_WINDOW_NS
+
+        files = []
+        dirs = []
+        with os.scandir(path) as entries:
+            for e in entries:
+                if e.is_file(follow_symlinks=False):
+                    files.append(e.name)
+                elif e.is_dir(follow_symlinks=False):
+                    dirs.append(e.name)
+        listing = DirListing(tuple(files), tuple(dirs))
+
+        with self._lock:
+            self._entries[path] = (mtime, stable, listing)
+            self._entries.move_to_end(path)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return listing
+
+    def invalidate(self, path: str) -> None:
+        """
+        Drop a directory's listing after creating or deleting files in it.
+
+        Args:
+            path: Directory whose contents changed
+        """
+        with self._lock:
+            self._entries.pop(path, None)
+
+    def clear(self) -> None:
+        """Drop every cached listing."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Shared instance
+dir_cache = DirCache()
+
+
+def list_dir(path: str) -> DirListing:
+    """
+    List a directory through the shared cache.
+
+    Args:
+        path: Directory to list
+
+    Returns:
+        DirListing: File and sub-directory names (empty if missing)
+    """
+    return dir_cache.list(path)
+
+
+def stat_signature(paths: Iterable[str]) -> Optional[str]:
+    """
+    Build an ETag-style signature from the stat() of files and directories.
+
+    The signature covers each path's mtime and size (directories change
+    mtime when entries are added or removed; files when rewritten).
+    Missing paths are part of the signature too. If any path changed
+    within the timestamp granularity window, None is returned, since a
+    further change in the same tick would not alter the signature.
+
+    Args:
+        paths: Files and directories the response is built from
+
+    Returns:
+        str: Hex signature, or None if the state is too fresh to sign
+    """
+    now = time.time_ns()
+    digest = hashlib.blake2b(digest_size=12)
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            digest.update(f'{path}\0-\n'.encode())
+            continue
+        if now - st.st_mtime_ns <= _RACY_WINDOW_NS:
+            return None
+        digest.update(f'{path}\0{st.st_mtime_ns}\0{st.st_size}\n'.encode())
+    return digest.hexdigest()
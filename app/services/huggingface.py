@@ -17,11 +17,97 @@ HuggingFace Repositories:
 =============================================================================
 """
 
+import hashlib
 import os
-import json
-from typing import Optional, List, Dict, Any
-from huggingface_hub import HfApi, upload_file, hf_hub_download
-from huggingface_hub.utils import RepositoryNotFoundError, HfHubHTTPError
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from importlib.util import find_spec
+from typing import Optional, List, Dict, Any, Iterator, Tuple, Union
+
+# Send large (LFS) uploads through hf_transfer's multi-connection Rust
+# backend when it is installed. huggingface_hub reads this flag once at
+# import time, so it must be set before the import below; small files
+# and regular commits are unaffected. Without hf_transfer the default
+# pure-Python path is used, and an explicit HF_HUB_ENABLE_HF_TRANSFER
+# in the environment always wins.
+if find_spec('hf_transfer') is not None:
+    os.environ.setdefault('HF_HUB_ENABLE_HF_TRANSFER', '1')
+
+from huggingface_hub import HfApi, CommitOperationAdd, get_session, hf_hub_url
+from huggingface_hub.utils import (
+    HfHubHTTPError, RepositoryNotFoundError, build_hf_headers, hf_raise_for_status
+)
+
+from ..config import Config
+from .dir_cache import list_dir
+from .json_io import decode_text, read_json, to_json_bytes, write_json
+
+# list_raw_files() results: repo -> (time.monotonic() when fetched, names)
+_LISTING_TTL = 30.0
+_txt_listings = {}
+_listing_lock = threading.Lock()
+
+# Piece size for download_file_stream()
+_STREAM_CHUNK_SIZE = 128 * 1024
+
+# Read size when hashing local files for the sync manifest
+_HASH_BLOCK_SIZE = 1024 * 1024
+
+
+@lru_cache(maxsize=16)
+def _api_for(token: str) -> HfApi:
+    """
+    Return the shared HfApi client for a token.
+    
+    The push route builds a HuggingFaceService per request, so clients
+    are kept per token (a few at most) rather than built every time.
+    """
+    return HfApi(token=token)
+
+
+@lru_cache(maxsize=1)
+def _sync_pool() -> ThreadPoolExecutor:
+    """Worker threads for sync_all_approved(), one per stage, made on first use."""
+    return ThreadPoolExecutor(max_workers=3, thread_name_prefix='hf-sync')
+
+
+def _sync_paths(stage: str, directory: str) -> List[str]:
+    """Paths (relative to directory) of the files sync_all_approved() uploads."""
+    listing = list_dir(directory)
+    if stage != 'chunked':
+        return [name for name in listing.files if name.endswith(('.txt', '.meta.json'))]
+    # Chunk folders keep their layout: {folder}/chunk_NN.json
+    return [
+        f'{folder}/{name}'
+        for folder in listing.dirs
+        for name in list_dir(os.path.join(directory, folder)).files if name.endswith('.json')
+    ]
+
+
+def _sync_unit(stage: str, path_in_repo: str) -> str:
+    """The file (or chunk folder) a synced path belongs to, for counting."""
+    if stage == 'chunked':
+        return path_in_repo.partition('/')[0]
+    return path_in_repo[:-len('.meta.json')] if path_in_repo.endswith('.meta.json') else path_in_repo[:-len('.txt')]
+
+
+def _file_sha256(path: str) -> str:
+    """SHA-256 of a file's contents, read in blocks into one reused buffer."""
+    digest = hashlib.sha256()
+    buf = bytearray(_HASH_BLOCK_SIZE)
+    view = memoryview(buf)
+    with open(path, 'rb', buffering=0) as f:
+        while n := f.readinto(buf):
+            digest.update(view[:n])
+    return digest.hexdigest()
+
+
+def _forget_listing(repo: str) -> None:
+    """Drop a repository's cached listing after committing to it."""
+    with _listing_lock:
+        _txt_listings.pop(repo, None)
 
 
 class HuggingFaceService:
@@ -44,11 +130,13 @@ class HuggingFaceService:
         # Get token from parameter or environment
         self.token = token or os.getenv('HF_TOKEN', '')
         
-        # Initialize HuggingFace API client
-        self.api = HfApi(token=self.token) if self.token else None
+        # HuggingFace API client, shared by every instance using this token
+        self.api = _api_for(self.token) if self.token else None
+        
+        # Token and client never change after construction
+        self._configured = bool(self.token and self.api)
         
         # Repository names from config
-        from ..config import Config
         self.raw_repo = Config.HF_RAW_REPO
         self.cleaned_repo = Config.HF_CLEANED_REPO
         self.chunked_repo = Config.HF_CHUNKED_REPO
@@ -60,7 +148,7 @@ class HuggingFaceService:
         Returns:
             bool: True if token and repos are configured
         """
-        return bool(self.token and self.api)
+        return self._configured
     
     # -------------------------------------------------------------------------
     # Upload Operations
@@ -79,7 +167,7 @@ class HuggingFaceService:
         Returns:
             dict: Result with success status and message
         """
-        if not self.is_configured():
+        if not self._configured:
             return {
                 'success': False,
                 'error': 'HuggingFace not configured. Please set HF_TOKEN.'
@@ -87,56 +175,31 @@ class HuggingFaceService:
         
         target_repo = repo or self.raw_repo
         
-        try:
-            # Upload content file
-            content_path = f'{filename}.txt'
-            self.api.upload_file(
-                path_or_fileobj=content.encode('utf-8'),
-                path_in_repo=content_path,
-                repo_id=target_repo,
-                repo_type='dataset',
-                commit_message=f'Add raw file: {filename}'
-            )
-            
-            # Upload metadata file
-            meta_path = f'{filename}.meta.json'
-            meta_content = json.dumps(metadata, indent=2, ensure_ascii=False)
-            self.api.upload_file(
-                path_or_fileobj=meta_content.encode('utf-8'),
-                path_in_repo=meta_path,
-                repo_id=target_repo,
-                repo_type='dataset',
-                commit_message=f'Add metadata for: {filename}'
-            )
-            
-            return {
-                'success': True,
-                'message': f'Uploaded {filename} to {target_repo}',
-                'repo': target_repo
-            }
-            
-        except RepositoryNotFoundError:
-            return {
-                'success': False,
-                'error': f'Repository {self.raw_repo} not found. Please create it first.'
-            }
-        except HfHubHTTPError as e:
-            return {
-                'success': False,
-                'error': f'HuggingFace API error: {str(e)}'
-            }
-        except Exception as e:
-            return {
-                'success': False,
-                'error': f'Upload failed: {str(e)}'
-            }
+        # Content and metadata go into a single commit
+        meta_content = to_json_bytes(metadata)
+        result = self.commit_files(
+            [
+                (f'{filename}.txt', content.encode('utf-8')),
+                (f'{filename}.meta.json', meta_content)
+            ],
+            target_repo,
+            f'Add raw file: {filename}'
+        )
+        if not result['success']:
+            return result
+        
+        return {
+            'success': True,
+            'message': f'Uploaded {filename} to {target_repo}',
+            'repo': target_repo
+        }
     
     def upload_cleaned_file(self, filename: str, content: str, metadata: Dict[str, Any], repo: Optional[str] = None) -> Dict[str, Any]:
         """
         Upload a cleaned data file to mozhii-cleaned-data repository.
         
         Args:
-            filename: Name of the file
+            filename: Name of the file (without extension)
             content: The cleaned text content
             metadata: File metadata dictionary
             repo: Optional custom repository name (overrides default)
@@ -144,7 +207,7 @@ class HuggingFaceService:
         Returns:
             dict: Result with success status and message
         """
-        if not self.is_configured():
+        if not self._configured:
             return {
                 'success': False,
                 'error': 'HuggingFace not configured'
@@ -152,39 +215,26 @@ class HuggingFaceService:
         
         target_repo = repo or self.cleaned_repo
         
-        try:
-            # Upload content file
-            self.api.upload_file(
-                path_or_fileobj=content.encode('utf-8'),
-                path_in_repo=f'{filename}.txt',
-                repo_id=target_repo,
-                repo_type='dataset',
-                commit_message=f'Add cleaned file: {filename}'
-            )
-            
-            # Upload metadata
-            meta_content = json.dumps(metadata, indent=2, ensure_ascii=False)
-            self.api.upload_file(
-                path_or_fileobj=meta_content.encode('utf-8'),
-                path_in_repo=f'{filename}.meta.json',
-                repo_id=target_repo,
-                repo_type='dataset',
-                commit_message=f'Add metadata for: {filename}'
-            )
-            
-            return {
-                'success': True,
-                'message': f'Uploaded {filename} to {target_repo}',
-                'repo': target_repo
-            }
-            
-        except Exception as e:
-            return {
-                'success': False,
-                'error': f'Upload failed: {str(e)}'
-            }
+        # Content and metadata go into a single commit
+        meta_content = to_json_bytes(metadata)
+        result = self.commit_files(
+            [
+                (f'{filename}.txt', content.encode('utf-8')),
+                (f'{filename}.meta.json', meta_content)
+            ],
+            target_repo,
+            f'Add cleaned file: {filename}'
+        )
+        if not result['success']:
+            return result
+        
+        return {
+            'success': True,
+            'message': f'Uploaded {filename} to {target_repo}',
+            'repo': target_repo
+        }
     
-    def upload_chunk(self, folder_name: str, chunk_file: str, chunk_data: Dict[str, Any], repo: Optional[str] = None) -> Dict[str, Any]:
+    def upload_chunk(self, folder_name: str, chunk_file: str, chunk_data: Dict[str, Any], repo: Optional[str] = None, pretty: bool = False) -> Dict[str, Any]:
         """
         Upload a single chunk to mozhii-chunked-data repository.
         
@@ -193,11 +243,12 @@ class HuggingFaceService:
             chunk_file: Chunk filename (e.g., chunk_01.json)
             chunk_data: Chunk data dictionary
             repo: Optional custom repository name (overrides default)
+            pretty: Indent the JSON for human inspection (compact by default)
         
         Returns:
             dict: Result with success status and message
         """
-        if not self.is_configured():
+        if not self._configured:
             return {
                 'success': False,
                 'error': 'HuggingFace not configured'
@@ -207,15 +258,15 @@ class HuggingFaceService:
         
         try:
             chunk_filename = f'{folder_name}/{chunk_file}'
-            chunk_content = json.dumps(chunk_data, indent=2, ensure_ascii=False)
             
             self.api.upload_file(
-                path_or_fileobj=chunk_content.encode('utf-8'),
+                path_or_fileobj=to_json_bytes(chunk_data, pretty=pretty),
                 path_in_repo=chunk_filename,
                 repo_id=target_repo,
                 repo_type='dataset',
                 commit_message=f'Add {chunk_file} for {folder_name}'
             )
+            _forget_listing(target_repo)
             
             return {
                 'success': True,
@@ -229,7 +280,7 @@ class HuggingFaceService:
                 'error': f'Upload failed: {str(e)}'
             }
     
-    def upload_chunks(self, folder_name: str, chunks: List[Dict[str, Any]], repo: Optional[str] = None) -> Dict[str, Any]:
+    def upload_chunks(self, folder_name: str, chunks: List[Dict[str, Any]], repo: Optional[str] = None, pretty: bool = False) -> Dict[str, Any]:
         """
         Upload chunks to mozhii-chunked-data repository.
         
@@ -240,11 +291,12 @@ class HuggingFaceService:
             folder_name: Name of the folder (source file name)
             chunks: List of chunk dictionaries
             repo: Optional custom repository name (overrides default)
+            pretty: Indent the JSON for human inspection (compact by default)
         
         Returns:
             dict: Result with success status and message
         """
-        if not self.is_configured():
+        if not self._configured:
             return {
                 'success': False,
                 'error': 'HuggingFace not configured'
@@ -252,30 +304,75 @@ class HuggingFaceService:
         
         target_repo = repo or self.chunked_repo
         
+        # Every payload is encoded up front, then all chunks of the folder
+        # go into a single commit
+        files = [
+            (f"{folder_name}/chunk_{chunk.get('chunk_index', 1):02d}.json", to_json_bytes(chunk, pretty=pretty))
+            for chunk in chunks
+        ]
+        
+        result = self.commit_files(files, target_repo, f'Add {len(files)} chunks for {folder_name}')
+        if not result['success']:
+            return result
+        
+        return {
+            'success': True,
+            'message': f'Uploaded {len(files)} chunks to {target_repo}',
+            'repo': target_repo,
+            'count': len(files)
+        }
+    
+    def commit_files(self, files: List[Tuple[str, Union[bytes, str]]], repo: str, commit_message: str) -> Dict[str, Any]:
+        """
+        Upload many files to a dataset repository in a single commit.
+        
+        One commit replaces a commit (and round trip) per file; the
+        client still uploads the file contents in parallel.
+        
+        Args:
+            files: (path_in_repo, bytes or local file path) pairs
+            repo: Target repository
+            commit_message: Message for the commit
+        
+        Returns:
+            dict: Result with success status and message
+        """
+        if not self._configured:
+            return {
+                'success': False,
+                'error': 'HuggingFace not configured'
+            }
+        
         try:
-            uploaded_count = 0
-            
-            for chunk in chunks:
-                chunk_index = chunk.get('chunk_index', 1)
-                chunk_filename = f'{folder_name}/chunk_{chunk_index:02d}.json'
-                chunk_content = json.dumps(chunk, indent=2, ensure_ascii=False)
-                
-                self.api.upload_file(
-                    path_or_fileobj=chunk_content.encode('utf-8'),
-                    path_in_repo=chunk_filename,
-                    repo_id=target_repo,
-                    repo_type='dataset',
-                    commit_message=f'Add chunk {chunk_index} for {folder_name}'
-                )
-                uploaded_count += 1
+            operations = [
+                CommitOperationAdd(path_in_repo=path_in_repo, path_or_fileobj=source)
+                for path_in_repo, source in files
+            ]
+            self.api.create_commit(
+                repo_id=repo,
+                operations=operations,
+                commit_message=commit_message,
+                repo_type='dataset'
+            )
+            _forget_listing(repo)
             
             return {
                 'success': True,
-                'message': f'Uploaded {uploaded_count} chunks to {target_repo}',
-                'repo': target_repo,
-                'count': uploaded_count
+                'message': f'Uploaded {len(files)} files to {repo}',
+                'repo': repo,
+                'count': len(files)
             }
             
+        except RepositoryNotFoundError:
+            return {
+                'success': False,
+                'error': f'Repository {repo} not found. Please create it first.'
+            }
+        except HfHubHTTPError as e:
+            return {
+                'success': False,
+                'error': f'HuggingFace API error: {str(e)}'
+            }
         except Exception as e:
             return {
                 'success': False,
@@ -293,20 +390,31 @@ class HuggingFaceService:
         Returns:
             dict: List of files with metadata
         """
-        if not self.is_configured():
+        if not self._configured:
             return {
                 'success': False,
                 'error': 'HuggingFace not configured'
             }
         
         try:
-            files = self.api.list_repo_files(
-                repo_id=self.raw_repo,
-                repo_type='dataset'
-            )
-            
-            # Filter to only .txt files
-            txt_files = [f.replace('.txt', '') for f in files if f.endswith('.txt')]
+            # Listings rarely change between successive requests, so the
+            # filtered names are reused for a short while per repository
+            now = time.monotonic()
+            with _listing_lock:
+                entry = _txt_listings.get(self.raw_repo)
+            if entry is not None and now - entry[0] < _LISTING_TTL:
+                txt_files = list(entry[1])
+            else:
+                files = self.api.list_repo_files(
+                    repo_id=self.raw_repo,
+                    repo_type='dataset'
+                )
+                
+                # Filter to only .txt files
+                names = tuple(f[:-4] for f in files if f.endswith('.txt'))
+                with _listing_lock:
+                    _txt_listings[self.raw_repo] = (now, names)
+                txt_files = list(names)
             
             return {
                 'success': True,
@@ -331,20 +439,13 @@ class HuggingFaceService:
         Returns:
             dict: File content and metadata
         """
-        if not self.is_configured():
+        if not self._configured:
             return {
                 'success': False,
                 'error': 'HuggingFace not configured'
             }
         
-        # Select repository
-        repos = {
-            'raw': self.raw_repo,
-            'cleaned': self.cleaned_repo,
-            'chunked': self.chunked_repo
-        }
-        
-        repo_id = repos.get(repo_type)
+        repo_id = self._repo_for(repo_type)
         if not repo_id:
             return {
                 'success': False,
@@ -352,16 +453,10 @@ class HuggingFaceService:
             }
         
         try:
-            # Download content file
-            file_path = hf_hub_download(
-                repo_id=repo_id,
-                filename=f'{filename}.txt',
-                repo_type='dataset',
-                token=self.token
-            )
+            # Fetch the content straight into memory
+            response = self._get_content(repo_id, filename)
             
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = decode_text(response.content)
             
             return {
                 'success': True,
@@ -375,6 +470,87 @@ class HuggingFaceService:
                 'error': f'Download failed: {str(e)}'
             }
     
+    def download_file_stream(self, repo_type: str, filename: str, chunk_size: int = _STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+        """
+        Download a file from HuggingFace as a stream of byte chunks.
+        
+        Only one chunk is held in memory at a time, so large dumps can be
+        passed on (e.g. in a streamed response) without loading them whole.
+        
+        Args:
+            repo_type: 'raw', 'cleaned', or 'chunked'
+            filename: Name of the file to download
+            chunk_size: Maximum size of each yielded chunk in bytes
+        
+        Yields:
+            bytes: Consecutive pieces of the raw file content
+        
+        Raises:
+            ValueError: If HuggingFace is not configured or repo_type is invalid
+            HfHubHTTPError: If the download fails
+        """
+        if not self._configured:
+            raise ValueError('HuggingFace not configured')
+        
+        repo_id = self._repo_for(repo_type)
+        if not repo_id:
+            raise ValueError('Invalid repo_type')
+        
+        with self._get_content(repo_id, filename, stream=True) as response:
+            yield from response.iter_content(chunk_size=chunk_size)
+    
+    def download_file_into(self, repo_type: str, filename: str, out: bytearray) -> int:
+        """
+        Download a file from HuggingFace into a caller-supplied buffer.
+        
+        The content is streamed into out piece by piece, so no bytes or
+        str copy of the whole file is made; the caller can reuse one
+        buffer across downloads.
+        
+        Args:
+            repo_type: 'raw', 'cleaned', or 'chunked'
+            filename: Name of the file to download
+            out: Writable buffer, at least as large as the file
+        
+        Returns:
+            int: Number of bytes written to the start of out
+        
+        Raises:
+            ValueError: If HuggingFace is not configured, repo_type is
+                invalid or the file does not fit in out
+            HfHubHTTPError: If the download fails
+        """
+        view = memoryview(out)
+        size = 0
+        for piece in self.download_file_stream(repo_type, filename):
+            end = size + len(piece)
+            if end > len(view):
+                raise ValueError(f'{filename}.txt does not fit in a {len(view)}-byte buffer')
+            view[size:end] = piece
+            size = end
+        return size
+    
+    def _repo_for(self, repo_type: str) -> Optional[str]:
+        """Return the repository for 'raw', 'cleaned' or 'chunked', or None."""
+        repos = {
+            'raw': self.raw_repo,
+            'cleaned': self.cleaned_repo,
+            'chunked': self.chunked_repo
+        }
+        return repos.get(repo_type)
+    
+    def _get_content(self, repo_id: str, filename: str, stream: bool = False):
+        """
+        GET a .txt file from a dataset repository.
+        
+        Goes over huggingface_hub's shared keep-alive session rather than
+        through the on-disk HF cache.
+        """
+        url = hf_hub_url(repo_id=repo_id, filename=f'{filename}.txt', repo_type='dataset')
+        response = get_session().get(url, headers=build_hf_headers(token=self.token), stream=stream)
+        hf_raise_for_status(response)
+        return response
+    
     # -------------------------------------------------------------------------
     # Sync Operations
     # -------------------------------------------------------------------------
@@ -383,84 +559,83 @@ class HuggingFaceService:
         """
         Sync all approved local files to HuggingFace.
         
-        This is a batch operation that uploads all approved files
-        that haven't been synced yet.
+        This is a batch operation that uploads the approved files that
+        haven't been synced yet. Each stage keeps a manifest of the
+        SHA-256 of every file it last synced, so only new or changed
+        files are uploaded, in a single commit per stage. The three
+        stages go to different repositories, so their commits run side
+        by side on worker threads. Counts are per file (per chunk folder
+        for chunks), and a failed commit counts all of its files as failed.
         
         Returns:
             dict: Sync results with counts
         """
-        from ..config import Config
-        
-        results = {
-            'raw': {'success': 0, 'failed': 0},
-            'cleaned': {'success': 0, 'failed': 0},
-            'chunked': {'success': 0, 'failed': 0}
-        }
-        
-        # Sync raw files
-        if os.path.exists(Config.APPROVED_RAW_DIR):
-            for filename in os.listdir(Config.APPROVED_RAW_DIR):
-                if filename.endswith('.txt'):
-                    base_name = filename.replace('.txt', '')
-                    content_path = os.path.join(Config.APPROVED_RAW_DIR, filename)
-                    meta_path = os.path.join(Config.APPROVED_RAW_DIR, f'{base_name}.meta.json')
-                    
-                    with open(content_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    
-                    metadata = {}
-                    if os.path.exists(meta_path):
-                        with open(meta_path, 'r', encoding='utf-8') as f:
-                            metadata = json.load(f)
-                    
-                    result = self.upload_raw_file(base_name, content, metadata)
-                    if result['success']:
-                        results['raw']['success'] += 1
-                    else:
-                        results['raw']['failed'] += 1
-        
-        # Sync cleaned files
-        if os.path.exists(Config.APPROVED_CLEANED_DIR):
-            for filename in os.listdir(Config.APPROVED_CLEANED_DIR):
-                if filename.endswith('.txt'):
-                    base_name = filename.replace('.txt', '')
-                    content_path = os.path.join(Config.APPROVED_CLEANED_DIR, filename)
-                    meta_path = os.path.join(Config.APPROVED_CLEANED_DIR, f'{base_name}.meta.json')
-                    
-                    with open(content_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    
-                    metadata = {}
-                    if os.path.exists(meta_path):
-                        with open(meta_path, 'r', encoding='utf-8') as f:
-                            metadata = json.load(f)
-                    
-                    result = self.upload_cleaned_file(base_name, content, metadata)
-                    if result['success']:
-                        results['cleaned']['success'] += 1
-                    else:
-                        results['cleaned']['failed'] += 1
-        
-        # Sync chunks
-        if os.path.exists(Config.APPROVED_CHUNKED_DIR):
-            for folder_name in os.listdir(Config.APPROVED_CHUNKED_DIR):
-                folder_path = os.path.join(Config.APPROVED_CHUNKED_DIR, folder_name)
-                if os.path.isdir(folder_path):
-                    chunks = []
-                    for chunk_file in os.listdir(folder_path):
-                        if chunk_file.endswith('.json'):
-                            chunk_path = os.path.join(folder_path, chunk_file)
-                            with open(chunk_path, 'r', encoding='utf-8') as f:
-                                chunks.append(json.load(f))
-                    
-                    if chunks:
-                        result = self.upload_chunks(folder_name, chunks)
-                        if result['success']:
-                            results['chunked']['success'] += 1
-                        else:
-                            results['chunked']['failed'] += 1
+        pool = _sync_pool()
+        futures = [
+            (stage, pool.submit(self._sync_stage, stage, directory, repo))
+            for stage, directory, repo in (
+                ('raw', Config.APPROVED_RAW_DIR, self.raw_repo),
+                ('cleaned', Config.APPROVED_CLEANED_DIR, self.cleaned_repo),
+                ('chunked', Config.APPROVED_CHUNKED_DIR, self.chunked_repo)
+            )
+        ]
         
         return {
             'success': True,
-            'results': results
+            'results': {stage: future.result() for stage, future in futures}
         }
+    
+    def _sync_stage(self, stage: str, directory: str, repo: str) -> Dict[str, int]:
+        """
+        Upload one stage's new or changed approved files in a single commit.
+        
+        Files whose size and mtime match the manifest are not re-hashed;
+        the others are hashed and compared, and the manifest is only
+        rewritten after a successful commit.
+        
+        Args:
+            stage: 'raw', 'cleaned' or 'chunked'
+            directory: Approved directory of the stage
+            repo: Target repository
+        
+        Returns:
+            dict: {'success': n, 'failed': m} counts for the stage
+        """
+        manifest_path = os.path.join(Config.STATE_DIR, f'sync_{stage}.json')
+        try:
+            manifest = read_json(manifest_path)
+        except (OSError, ValueError):
+            manifest = {}
+        known = manifest.get('files', {}) if manifest.get('repo') == repo else {}
+        
+        files = {}      # path in repo -> [size, mtime_ns, sha256]
+        changed = []
+        for path_in_repo in _sync_paths(stage, directory):
+            path = os.path.join(directory, path_in_repo)
+            st = os.stat(path)
+            entry = known.get(path_in_repo)
+            if entry is None or entry[0] != st.st_size or entry[1] != st.st_mtime_ns:
+                digest = _file_sha256(path)
+                if entry is None or entry[2] != digest:
+                    changed.append(path_in_repo)
+                entry = [st.st_size, st.st_mtime_ns, digest]
+            files[path_in_repo] = entry
+        
+        counts = {'success': 0, 'failed': 0}
+        if changed:
+            # One count per file (content + metadata) or chunk folder
+            count = len({_sync_unit(stage, path_in_repo) for path_in_repo in changed})
+            result = self.commit_files(
+                [(path_in_repo, os.path.join(directory, path_in_repo)) for path_in_repo in changed],
+                repo,
+                f'Sync {count} approved {stage} files'
+            )
+            if not result['success']:
+                counts['failed'] = count
+                return counts
+            counts['success'] = count
+        
+        if files != known:
+            os.makedirs(Config.STATE_DIR, exist_ok=True)
+            write_json(manifest_path, {'repo': repo, 'files': files})
+        return counts
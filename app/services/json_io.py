@@ -0,0 +1,445 @@
+"""
+=============================================================================
+Mozhii RAG Data Platform - JSON I/O Helpers
+=============================================================================
+Shared helpers for reading and writing the platform's JSON files
+(.meta.json metadata and chunk_NN.json files) and for building JSON API
+responses, plus read_text()/write_text() for the .txt content files.
+
+All helpers use orjson, which parses and serializes several times faster
+than the stdlib json module and works on UTF-8 bytes directly, so files
+are read and written as raw bytes with no separate encode/decode step.
+
+Files are written compact by default, since they are machine-read; pass
+pretty=True for 2-space indentation. Non-ASCII text (Tamil) is always
+kept as-is, as with json.dump(..., ensure_ascii=False).
+
+Writes are atomic: the serialized bytes go to a temporary file next to
+the target, which is then renamed over it, so readers and crashes never
+see a half-written file.
+
+read_json_dir() additionally keeps the parsed (and optionally sorted)
+contents of a whole directory's JSON files, reused for as long as the
+directory cache hands back the same (unchanged) listing. Since writes replace files by rename,
+every write through these helpers changes the directory and refreshes
+the list. Like the directory cache, these lists are bounded with LRU
+eviction.
+=============================================================================
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterable, List, Optional, Tuple
+
+import orjson
+from flask import current_app, request
+
+from .dir_cache import list_dir
+from .meta_cache import meta_cache
+
+# Options for files on disk: compact by default, indented when pretty
+_FILE_OPTIONS = orjson.OPT_NON_STR_KEYS
+_PRETTY_FILE_OPTIONS = _FILE_OPTIONS | orjson.OPT_INDENT_2
+
+# Shared pool for bulk reads; threads are only started on first use.
+# File reads release the GIL, so many small files load concurrently.
+_READ_POOL = ThreadPoolExecutor(max_workers=16, thread_name_prefix='json-read')
+
+# Below this many files the pool hand-off costs more than it saves
+_PARALLEL_READ_MIN = 8
+
+# Read size for raw os.read() calls; metadata files fit in one read
+_READ_SIZE = 1 << 16
+
+# Fixed parts of the files_response() body around the listing and count
+_FILES_PREFIX = b'{"success":true,"files":'
+_FILES_COUNT = b',"count":'
+
+# Parsed directory contents, LRU-bounded like the directory cache:
+# (directory, suffix, sort_by, reverse) -> (DirListing, values)
+_dir_values = OrderedDict()
+# Same keys -> (values, values serialized as a JSON array)
+_dir_encoded = OrderedDict()
+_dir_values_lock = threading.Lock()
+_DIR_VALUES_MAXSIZE = 1024
+
+# Whether files can be opened/renamed relative to a directory descriptor
+# (openat/renameat). os.replace shares os.rename's implementation, but is
+# not listed in supports_dir_fd itself.
+_DIR_FD_SUPPORTED = (
+    hasattr(os, 'O_DIRECTORY')
+    and {os.open, os.rename, os.unlink} <= os.supports_dir_fd
+)
+
+
+# -----------------------------------------------------------------------------
+# Unbuffered File Access
+# -----------------------------------------------------------------------------
+# Metadata and chunk files are small and always read or written whole, so
+# plain os.open/os.read/os.write are used instead of buffered file objects
+# (no BufferedReader/Writer or 8KB buffer per file).
+
+def _read_bytes(path: str) -> bytes:
+    """
+    Read a whole file with unbuffered os.read() calls.
+
+    A short read means end of file, so files under _READ_SIZE take a
+    single read. Larger ones (multi-MB cleaned corpora) are sized with
+    fstat() and the rest is read in one call instead of _READ_SIZE pieces.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        data = os.read(fd, _READ_SIZE)
+        if len(data) < _READ_SIZE:
+            return data
+        parts = [data]
+        # One byte past the expected end, so a file that grew keeps looping
+        size = max(os.fstat(fd).st_size - len(data), 0) + 1
+        while True:
+            part = os.read(fd, size)
+            parts.append(part)
+            if len(part) < size:
+                break
+            size = _READ_SIZE
+        return b''.join(parts)
+    finally:
+        os.close(fd)
+
+
+def _write_bytes(path: str, data: bytes, dir_fd: Optional[int] = None) -> None:
+    """
+    Atomically replace a file's contents using os.write() and os.replace().
+    
+    The temporary name is unique per process and thread, and ends in
+    .tmp so directory scans for .json files never pick it up. With dir_fd,
+    path is a bare file name resolved relative to that directory.
+    """
+    tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666, dir_fd=dir_fd)
+    try:
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path, src_dir_fd=dir_fd, dst_dir_fd=dir_fd)
+    except BaseException:
+        try:
+            os.unlink(tmp_path, dir_fd=dir_fd)
+        except OSError:
+            pass
+        raise
+
+
+
+def read_text(path: str) -> str:
+    """
+    Read a whole UTF-8 text file.
+    
+    Reads raw bytes and decodes them once, skipping the text-mode file
+    object (its buffering, encoding setup and extra seek/ioctl calls).
+    Line endings are translated to '\\n' as text mode would.
+    
+    Args:
+        path: Path to the text file
+    
+    Returns:
+        str: Decoded file content
+    """
+    return decode_text(_read_bytes(path))
+
+
+def decode_text(data: bytes) -> str:
+    """
+    Decode UTF-8 file content, translating line endings to '\\n'.
+    
+    Args:
+        data: Raw file bytes
+    
+    Returns:
+        str: Decoded text, as read_text() would return it
+    """
+    text = data.decode('utf-8')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+def read_json(path: str) -> Any:
+    """
+    Read and parse a JSON file.
+
+    Args:
+        path: Path to the JSON file
+
+    Returns:
+        The parsed JSON value
+    """
+    return orjson.loads(_read_bytes(path))
+
+
+def read_json_cached(path: str) -> Any:
+    """
+    Read a JSON file through the shared metadata cache.
+
+    Unchanged files are served from memory. The returned value is shared
+    and must not be modified.
+
+    Args:
+        path: Path to the JSON file
+
+    Returns:
+        The parsed JSON value
+    """
+    return meta_cache.get(path, read_json)
+
+
+def read_json_many(paths: Iterable[str], cached: bool = False) -> List[Any]:
+    """
+    Read and parse many JSON files, in parallel when worthwhile.
+
+    Args:
+        paths: Paths to the JSON files
+        cached: Go through the metadata cache (results are then read-only)
+
+    Returns:
+        list: Parsed values, in the same order as paths
+    """
+    loader = read_json_cached if cached else read_json
+    paths = list(paths)
+    if len(paths) < _PARALLEL_READ_MIN:
+        return [loader(path) for path in paths]
+    return list(_READ_POOL.map(loader, paths))
+
+
+def _lru_get(cache: OrderedDict, key: tuple) -> Any:
+    """Look up a directory cache entry, marking it most recently used."""
+    with _dir_values_lock:
+        entry = cache.get(key)
+        if entry is not None:
+            cache.move_to_end(key)
+    return entry
+
+
+def _lru_put(cache: OrderedDict, key: tuple, entry: tuple) -> None:
+    """Store a directory cache entry, evicting the least recently used."""
+    with _dir_values_lock:
+        cache[key] = entry
+        cache.move_to_end(key)
+        while len(cache) > _DIR_VALUES_MAXSIZE:
+            cache.popitem(last=False)
+
+
+def read_json_dir(
+    directory: str,
+    suffix: str = '.meta.json',
+    sort_by: Optional[str] = None,
+    reverse: bool = False
+) -> List[Any]:
+    """
+    Read every JSON file with the given suffix in a directory.
+    
+    While the directory is unchanged the previous list is returned as-is,
+    already sorted, so a repeated call costs one stat() of the directory
+    and no parsing or sorting. The list and its values are shared and
+    must not be modified.
+    
+    Args:
+        directory: Directory to read (missing directories give [])
+        suffix: File name suffix to select
+        sort_by: Field to sort the objects by (missing values sort as '')
+        reverse: Sort in descending order
+    
+    Returns:
+        list: Parsed values, sorted if sort_by is given, otherwise in
+        directory listing order
+    """
+    listing = list_dir(directory)
+    key = (directory, suffix, sort_by, reverse)
+    entry = _lru_get(_dir_values, key)
+    # The directory cache returns the same listing object only while the
+    # directory is unchanged (and settled), so identity is the check
+    if entry is not None and entry[0] is listing:
+        return entry[1]
+    
+    n = len(suffix)
+    values = read_json_many(
+        [os.path.join(directory, name) for name in listing.files if name[-n:] == suffix],
+        cached=True
+    )
+    if sort_by is not None:
+        values.sort(key=lambda x: x.get(sort_by, ''), reverse=reverse)
+    _lru_put(_dir_values, key, (listing, values))
+    return values
+
+
+def read_json_dir_encoded(
+    directory: str,
+    suffix: str = '.meta.json',
+    sort_by: Optional[str] = None,
+    reverse: bool = False
+) -> Tuple[List[Any], bytes]:
+    """
+    Like read_json_dir(), plus the list already serialized as a JSON array.
+    
+    The array is encoded once per directory change, so listing responses
+    for an unchanged directory are assembled without serializing again.
+    
+    Args:
+        directory: Directory to read (missing directories give [])
+        suffix: File name suffix to select
+        sort_by: Field to sort the objects by (missing values sort as '')
+        reverse: Sort in descending order
+    
+    Returns:
+        tuple: (shared list of values, JSON array bytes)
+    """
+    values = read_json_dir(directory, suffix, sort_by, reverse)
+    key = (directory, suffix, sort_by, reverse)
+    entry = _lru_get(_dir_encoded, key)
+    if entry is not None and entry[0] is values:
+        return values, entry[1]
+    
+    encoded = to_json_bytes(values)
+    _lru_put(_dir_encoded, key, (values, encoded))
+    return values, encoded
+
+
+def write_json(path: str, data: Any, pretty: bool = False) -> None:
+    """
+    Serialize data and write it to a JSON file.
+
+    Args:
+        path: Path to the JSON file (created or overwritten)
+        data: JSON-serializable value
+        pretty: Indent with 2 spaces instead of writing compact JSON
+    """
+    options = _PRETTY_FILE_OPTIONS if pretty else _FILE_OPTIONS
+    _write_bytes(path, orjson.dumps(data, option=options))
+    meta_cache.invalidate(path)
+
+
+def write_json_files(directory: str, files: Iterable[Tuple[str, Any]], pretty: bool = False) -> None:
+    """
+    Write several JSON files into one directory.
+    
+    The directory is opened once and each file is created relative to it
+    (openat/renameat), so its path is resolved once rather than per file.
+    Falls back to write_json() where directory descriptors are unsupported.
+    
+    Args:
+        directory: Existing directory to write into
+        files: (file name, JSON-serializable value) pairs
+        pretty: Indent with 2 spaces instead of writing compact JSON
+    """
+    if not _DIR_FD_SUPPORTED:
+        for name, data in files:
+            write_json(os.path.join(directory, name), data, pretty=pretty)
+        return
+    
+    options = _PRETTY_FILE_OPTIONS if pretty else _FILE_OPTIONS
+    dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        for name, data in files:
+            _write_bytes(name, orjson.dumps(data, option=options), dir_fd=dir_fd)
+            meta_cache.invalidate(os.path.join(directory, name))
+    finally:
+        os.close(dir_fd)
+
+
+def write_text(path: str, text: str) -> None:
+    """
+    Atomically write a UTF-8 text file.
+    
+    Encoded once and written with the same temp-file-and-rename path as
+    the JSON files, so a crash never leaves a truncated .txt behind.
+    
+    Args:
+        path: Path to the text file (created or overwritten)
+        text: File content
+    """
+    _write_bytes(path, text.encode('utf-8'))
+
+
+def remove_json(path: str) -> None:
+    """
+    Delete a JSON file and drop it from the metadata cache.
+
+    Args:
+        path: Path to the JSON file
+    """
+    os.remove(path)
+    meta_cache.invalidate(path)
+
+
+def to_json_bytes(data: Any, pretty: bool = False) -> bytes:
+    """
+    Serialize data to JSON bytes (for responses, streaming and uploads).
+
+    Args:
+        data: JSON-serializable value
+        pretty: Indent with 2 spaces instead of writing compact JSON
+
+    Returns:
+        bytes: UTF-8 encoded JSON
+    """
+    return orjson.dumps(data, option=_PRETTY_FILE_OPTIONS if pretty else _FILE_OPTIONS)
+
+
+def json_response(payload: Any, status: int = 200):
+    """
+    Build a JSON response without going through Flask's JSON provider.
+
+    Args:
+        payload: JSON-serializable response body
+        status: HTTP status code
+
+    Returns:
+        Response: Flask response with an application/json body
+    """
+    return current_app.response_class(
+        to_json_bytes(payload),
+        status=status,
+        mimetype='application/json'
+    )
+
+
+def files_response(files: List[Any], files_json: bytes):
+    """
+    Build a {"success": true, "files": [...], "count": n} listing response.
+    
+    The envelope is constant, so it is spliced around the pre-serialized
+    array as bytes; nothing is passed through orjson per call.
+    
+    Args:
+        files: The listed values (only counted)
+        files_json: The same values, already serialized as a JSON array
+    
+    Returns:
+        Response: Flask response with an application/json body
+    """
+    return current_app.response_class(
+        b''.join((_FILES_PREFIX, files_json, _FILES_COUNT, str(len(files)).encode(), b'}')),
+        mimetype='application/json'
+    )
+
+
+def not_modified(etag: Optional[str]):
+    """
+    Answer a conditional GET whose cached copy is still current.
+
+    Args:
+        etag: Signature of the current state, or None if not available
+
+    Returns:
+        Response: Empty 304 response if the request's If-None-Match
+        contains etag, otherwise None
+    """
+    if etag is None or etag not in request.if_none_match:
+        return None
+    response = current_app.response_class(status=304)
+    response.set_etag(etag)
+    return response
@@ -0,0 +1,92 @@
+"""
+=============================================================================
+Mozhii RAG Data Platform - Metadata Cache
+=============================================================================
+In-process cache of parsed JSON files (.meta.json metadata and chunk
+files), so repeated admin polls don't re-read and re-parse files that
+have not changed.
+
+Each entry is keyed by file path and validated against the file's
+(st_mtime_ns, st_size) on every lookup, so edits made outside the app are
+still picked up. Writes made through app.services.json_io invalidate
+their entry explicitly. The cache is bounded with LRU eviction.
+
+Cached values are shared between callers and must be treated as
+read-only; copy before modifying.
+=============================================================================
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable
+
+
+class MetaCache:
+    """
+    Thread-safe LRU cache of parsed files, validated by stat signature.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        """
+        Initialize an empty cache.
+
+        Args:
+            maxsize: Maximum number of files kept in memory
+        """
+        self.maxsize = maxsize
+        self._entries = OrderedDict()   # path -> ((mtime_ns, size), value)
+        self._lock = threading.Lock()
+
+    def get(self, path: str, loader: Callable[[str], Any]) -> Any:
+        """
+        Return the parsed contents of a file, loading it if needed.
+
+        Args:
+            path: Path to the file
+            loader: Function that reads and parses the file at path
+
+        Returns:
+            The cached or freshly loaded value
+
+        Raises:
+            OSError: If the file cannot be stat'ed or read
+        """
+        st = os.stat(path)
+        signature = (st.st_mtime_ns, st.st_size)
+
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry[0] == signature:
+                self._entries.move_to_end(path)
+                return entry[1]
+
+        # Load outside the lock so concurrent misses don't serialize on I/O
+        value = loader(path)
+
+        with self._lock:
+            self._entries[path] = (signature, value)
+            self._entries.move_to_end(path)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+        return value
+
+    def invalidate(self, path: str) -> None:
+        """
+        Drop a single file from the cache.
+
+        Args:
+            path: Path of the file that was written, moved or deleted
+        """
+        with self._lock:
+            self._entries.pop(path, None)
+
+    def clear(self) -> None:
+        """Drop every cached file."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Shared instance used by json_io
+meta_cache = MetaCache()
@@ -10,6 +10,10 @@ Responsibilities:
     - Backup and recovery
     - File validation
 
+Metadata is read through the shared metadata cache, so repeated
+listings of unchanged files skip the read and parse; writes and deletes
+go through app.services.json_io, which keeps the cache current.
+
 Directory Structure:
     data/
     ├── pending/
@@ -23,11 +27,37 @@ Directory Structure:
 =============================================================================
 """
 
+import logging
 import os
-import json
 import shutil
-from datetime import datetime
-from typing import Optional, List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Iterator, List, Dict, Any, Tuple
+
+from ..config import Config
+from ..models.schemas import now_iso
+from .dir_cache import dir_cache, list_dir
+from .json_io import (
+    read_json, read_json_cached, read_text, remove_json, write_json, write_json_files, write_text
+)
+
+log = logging.getLogger(__name__)
+
+# Data directories by '{status}_{stage}' key, built once from Config
+_DIRS = {
+    'pending_raw': Config.PENDING_RAW_DIR,
+    'pending_cleaned': Config.PENDING_CLEANED_DIR,
+    'pending_chunked': Config.PENDING_CHUNKED_DIR,
+    'approved_raw': Config.APPROVED_RAW_DIR,
+    'approved_cleaned': Config.APPROVED_CLEANED_DIR,
+    'approved_chunked': Config.APPROVED_CHUNKED_DIR
+}
+
+# Whether _DIRS have been created in this process
+_dirs_ready = False
+
+# Shared pool for get_stats() listings and bulk saves/approvals; threads
+# start on first use
+_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix='storage')
 
 
 class StorageService:
@@ -42,22 +72,14 @@ class StorageService:
         """
         Initialize the storage service.
         
-        Sets up paths and ensures all required directories exist.
+        Binds the shared directory table and ensures all required
+        directories exist (checked once per process, not per instance).
         """
-        from ..config import Config
-        
         # Store config reference
         self.config = Config
         
-        # Define all directories
-        self.dirs = {
-            'pending_raw': Config.PENDING_RAW_DIR,
-            'pending_cleaned': Config.PENDING_CLEANED_DIR,
-            'pending_chunked': Config.PENDING_CHUNKED_DIR,
-            'approved_raw': Config.APPROVED_RAW_DIR,
-            'approved_cleaned': Config.APPROVED_CLEANED_DIR,
-            'approved_chunked': Config.APPROVED_CHUNKED_DIR
-        }
+        # All directories, shared by every instance
+        self.dirs = _DIRS
         
         # Ensure all directories exist
         self._ensure_directories()
@@ -67,10 +89,15 @@ class StorageService:
         Create all required directories if they don't exist.
         
         This is called on initialization to ensure the storage
-        structure is always ready.
+        structure is always ready. Only the first call in a process
+        touches the filesystem.
         """
+        global _dirs_ready
+        if _dirs_ready:
+            return
         for dir_path in self.dirs.values():
             os.makedirs(dir_path, exist_ok=True)
+        _dirs_ready = True
     
     # -------------------------------------------------------------------------
     # File Read Operations
@@ -96,17 +123,13 @@ class StorageService:
         content_path = os.path.join(base_dir, f'{filename}.txt')
         meta_path = os.path.join(base_dir, f'{filename}.meta.json')
         
-        if not os.path.exists(content_path):
-            return None
-        
         try:
-            with open(content_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = read_text(content_path)
             
-            metadata = {}
-            if os.path.exists(meta_path):
-                with open(meta_path, 'r', encoding='utf-8') as f:
-                    metadata = json.load(f)
+            try:
+                metadata = dict(read_json_cached(meta_path))
+            except FileNotFoundError:
+                metadata = {}
             
             return {
                 'filename': filename,
@@ -116,10 +139,45 @@ class StorageService:
                 'status': status
             }
             
-        except Exception as e:
-            print(f'Error reading file {filename}: {e}')
+        except FileNotFoundError:
+            # No content file: the item does not exist
+            return None
+        except Exception:
+            log.exception('Error reading file %s', filename)
             return None
     
+    def stream_file(self, stage: str, status: str, filename: str, chunk_size: int = 1 << 16) -> Optional[Iterator[bytes]]:
+        """
+        Stream a file's content as bytes, without reading it whole.
+        
+        Memory use stays at one chunk however large the document is.
+        The HTTP routes serve content with send_from_directory() instead,
+        which lets the server use sendfile(); this is for in-process
+        consumers.
+        
+        Args:
+            stage: 'raw' or 'cleaned'
+            status: 'pending' or 'approved'
+            filename: Name of the file (without extension)
+            chunk_size: Maximum size of each yielded chunk in bytes
+        
+        Returns:
+            iterator: Consecutive chunks of UTF-8 content, or None if the
+            file does not exist
+        """
+        dir_key = f'{status}_{stage}'
+        if dir_key not in self.dirs:
+            return None
+        
+        # Opened up front so a missing file is reported before iterating.
+        # A file object (unbuffered) rather than a bare fd, so it is still
+        # closed if the iterator is dropped without being started.
+        try:
+            f = open(os.path.join(self.dirs[dir_key], f'{filename}.txt'), 'rb', buffering=0)
+        except FileNotFoundError:
+            return None
+        return _iter_file(f, chunk_size)
+    
     def list_files(self, stage: str, status: str) -> List[Dict[str, Any]]:
         """
         List all files in a specific stage and status.
@@ -138,31 +196,32 @@ class StorageService:
         base_dir = self.dirs[dir_key]
         files = []
         
-        if not os.path.exists(base_dir):
-            return files
+        # Listings come from the directory cache: one stat() per
+        # directory while unchanged (missing directories list as empty)
+        listing = list_dir(base_dir)
         
         if stage == 'chunked':
             # Chunked files are organized in folders
-            for folder_name in os.listdir(base_dir):
+            for folder_name in listing.dirs:
                 folder_path = os.path.join(base_dir, folder_name)
-                if os.path.isdir(folder_path):
-                    chunk_count = len([f for f in os.listdir(folder_path) if f.endswith('.json')])
-                    files.append({
-                        'filename': folder_name,
-                        'chunk_count': chunk_count,
-                        'status': status
-                    })
+                chunk_count = sum(1 for f in list_dir(folder_path).files if f.endswith('.json'))
+                files.append({
+                    'filename': folder_name,
+                    'chunk_count': chunk_count,
+                    'status': status
+                })
         else:
-            # Raw and cleaned files are single files
-            for filename in os.listdir(base_dir):
+            # Raw and cleaned files are single files; whether each has
+            # metadata is answered from the same listing, not a stat()
+            names = set(listing.files)
+            for filename in listing.files:
                 if filename.endswith('.txt'):
-                    base_name = filename.replace('.txt', '')
-                    meta_path = os.path.join(base_dir, f'{base_name}.meta.json')
+                    base_name = filename[:-4]
+                    meta_name = f'{base_name}.meta.json'
                     
                     metadata = {'filename': base_name}
-                    if os.path.exists(meta_path):
-                        with open(meta_path, 'r', encoding='utf-8') as f:
-                            metadata = json.load(f)
+                    if meta_name in names:
+                        metadata = dict(read_json_cached(os.path.join(base_dir, meta_name)))
                     
                     files.append(metadata)
         
@@ -194,18 +253,36 @@ class StorageService:
         meta_path = os.path.join(base_dir, f'{filename}.meta.json')
         
         try:
-            with open(content_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-            
-            with open(meta_path, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=2, ensure_ascii=False)
+            write_text(content_path, content)
+            write_json(meta_path, metadata, pretty=Config.PRETTY_JSON)
             
             return True
             
-        except Exception as e:
-            print(f'Error saving file {filename}: {e}')
+        except Exception:
+            log.exception('Error saving file %s', filename)
             return False
     
+    def save_files(self, stage: str, items: List[Tuple[str, str, Dict[str, Any]]]) -> Dict[str, bool]:
+        """
+        Save many files to the pending directory concurrently.
+        
+        Each file's content and metadata are written by one task on the
+        shared worker pool, so disk (or network filesystem) latency of
+        different files overlaps instead of adding up.
+        
+        Args:
+            stage: 'raw' or 'cleaned'
+            items: (filename, content, metadata) tuples
+        
+        Returns:
+            dict: Filename -> True if that file was saved
+        """
+        futures = {
+            filename: _POOL.submit(self.save_file, stage, filename, content, metadata)
+            for filename, content, metadata in items
+        }
+        return {filename: future.result() for filename, future in futures.items()}
+    
     def save_chunk(self, folder_name: str, chunk: Dict[str, Any]) -> bool:
         """
         Save a chunk to the pending chunked directory.
@@ -218,17 +295,44 @@ class StorageService:
             bool: True if successful
         """
         chunk_dir = os.path.join(self.dirs['pending_chunked'], folder_name)
-        os.makedirs(chunk_dir, exist_ok=True)
         
         chunk_index = chunk.get('chunk_index', 1)
         chunk_path = os.path.join(chunk_dir, f'chunk_{chunk_index:02d}.json')
         
         try:
-            with open(chunk_path, 'w', encoding='utf-8') as f:
-                json.dump(chunk, f, indent=2, ensure_ascii=False)
+            _write_chunk(chunk_path, chunk)
+            return True
+        except Exception:
+            log.exception('Error saving chunk %s', chunk_path)
+            return False
+    
+    def save_chunks(self, folder_name: str, chunks: List[Dict[str, Any]]) -> bool:
+        """
+        Save several chunks of one source file to the pending chunked directory.
+        
+        The folder is created once and every chunk file is written through
+        a single handle on it, instead of one save_chunk() call per chunk.
+        
+        Args:
+            folder_name: Name of the source file
+            chunks: Chunk dictionaries
+        
+        Returns:
+            bool: True if successful
+        """
+        chunk_dir = os.path.join(self.dirs['pending_chunked'], folder_name)
+        files = [
+            (f"chunk_{chunk.get('chunk_index', 1):02d}.json", chunk)
+            for chunk in chunks
+        ]
+        
+        try:
+            os.makedirs(chunk_dir, exist_ok=True)
+            write_json_files(chunk_dir, files, pretty=Config.PRETTY_JSON)
+            dir_cache.invalidate(chunk_dir)
             return True
-        except Exception as e:
-            print(f'Error saving chunk: {e}')
+        except Exception:
+            log.exception('Error saving chunks for %s', folder_name)
             return False
     
     # -------------------------------------------------------------------------
@@ -246,6 +350,32 @@ class StorageService:
         Returns:
             bool: True if successful
         """
+        return self._approve_file(stage, filename, now_iso())
+    
+    def approve_files(self, stage: str, filenames: List[str]) -> Dict[str, bool]:
+        """
+        Move many files from pending to approved.
+        
+        The files share one approval timestamp and are moved on the
+        shared worker pool, so slow storage is not waited on one file
+        at a time.
+        
+        Args:
+            stage: 'raw' or 'cleaned'
+            filenames: Names of the files
+        
+        Returns:
+            dict: Filename -> True if that file was approved
+        """
+        approved_at = now_iso()
+        futures = {
+            filename: _POOL.submit(self._approve_file, stage, filename, approved_at)
+            for filename in filenames
+        }
+        return {filename: future.result() for filename, future in futures.items()}
+    
+    def _approve_file(self, stage: str, filename: str, approved_at: str) -> bool:
+        """Approve one file with the given timestamp (see approve_file)."""
         pending_dir = self.dirs[f'pending_{stage}']
         approved_dir = self.dirs[f'approved_{stage}']
         
@@ -261,27 +391,26 @@ class StorageService:
             # Update metadata
             metadata = {}
             if os.path.exists(pending_meta):
-                with open(pending_meta, 'r', encoding='utf-8') as f:
-                    metadata = json.load(f)
+                metadata = read_json(pending_meta)
             
             metadata['status'] = 'approved'
-            metadata['approved_at'] = datetime.now().isoformat()
+            metadata['approved_at'] = approved_at
             
-            # Move content file
-            shutil.move(pending_content, approved_content)
+            # Move content file (one rename; both directories live under
+            # the same data directory, as in the admin approve route)
+            os.replace(pending_content, approved_content)
             
             # Save updated metadata
-            with open(approved_meta, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=2, ensure_ascii=False)
+            write_json(approved_meta, metadata, pretty=Config.PRETTY_JSON)
             
             # Remove old metadata
             if os.path.exists(pending_meta):
-                os.remove(pending_meta)
+                remove_json(pending_meta)
             
             return True
             
-        except Exception as e:
-            print(f'Error approving file {filename}: {e}')
+        except Exception:
+            log.exception('Error approving file %s', filename)
             return False
     
     def approve_chunk(self, folder_name: str, chunk_index: int) -> bool:
@@ -306,21 +435,17 @@ class StorageService:
             return False
         
         try:
-            os.makedirs(approved_dir, exist_ok=True)
-            
             # Read and update chunk
-            with open(pending_path, 'r', encoding='utf-8') as f:
-                chunk = json.load(f)
+            chunk = read_json(pending_path)
             
             chunk['status'] = 'approved'
-            chunk['approved_at'] = datetime.now().isoformat()
+            chunk['approved_at'] = now_iso()
             
             # Save to approved
-            with open(approved_path, 'w', encoding='utf-8') as f:
-                json.dump(chunk, f, indent=2, ensure_ascii=False)
+            _write_chunk(approved_path, chunk)
             
             # Remove pending
-            os.remove(pending_path)
+            remove_json(pending_path)
             
             # Clean up empty folder
             if not os.listdir(pending_dir):
@@ -328,8 +453,8 @@ class StorageService:
             
             return True
             
-        except Exception as e:
-            print(f'Error approving chunk: {e}')
+        except Exception:
+            log.exception('Error approving chunk %s', pending_path)
             return False
     
     # -------------------------------------------------------------------------
@@ -363,7 +488,7 @@ class StorageService:
                 os.remove(content_path)
                 deleted = True
             if os.path.exists(meta_path):
-                os.remove(meta_path)
+                remove_json(meta_path)
                 deleted = True
             
             return deleted
@@ -381,23 +506,63 @@ class StorageService:
         Returns:
             dict: Counts for each stage and status
         """
-        stats = {}
-        
-        for key, dir_path in self.dirs.items():
-            if not os.path.exists(dir_path):
-                stats[key] = 0
-                continue
-            
-            if 'chunked' in key:
-                # Count chunk folders
-                count = 0
-                for folder in os.listdir(dir_path):
-                    folder_path = os.path.join(dir_path, folder)
-                    if os.path.isdir(folder_path):
-                        count += len([f for f in os.listdir(folder_path) if f.endswith('.json')])
-                stats[key] = count
-            else:
-                # Count .txt files
-                stats[key] = len([f for f in os.listdir(dir_path) if f.endswith('.txt')])
-        
-        return stats
+        # The six directories are independent, so they are listed side by
+        # side; a cold scan costs the slowest directory, not the sum
+        futures = {
+            key: _POOL.submit(_count_dir, dir_path, 'chunked' in key)
+            for key, dir_path in self.dirs.items()
+        }
+        return {key: future.result() for key, future in futures.items()}
+
+
+def _iter_file(f, chunk_size: int) -> Iterator[bytes]:
+    """Yield an open binary file's bytes in chunks, then close it."""
+    with f:
+        while True:
+            data = f.read(chunk_size)
+            if not data:
+                break
+            yield data
+
+
+def _write_chunk(chunk_path: str, chunk: Dict[str, Any]) -> None:
+    """
+    Write a chunk file, creating its folder only if it is missing.
+    
+    Every chunk after a folder's first is written without a makedirs()
+    call; the folder is created (and the write retried) only when the
+    write fails because it does not exist yet.
+    
+    Args:
+        chunk_path: Path of the chunk file
+        chunk: Chunk dictionary
+    """
+    try:
+        write_json(chunk_path, chunk, pretty=Config.PRETTY_JSON)
+    except FileNotFoundError:
+        os.makedirs(os.path.dirname(chunk_path), exist_ok=True)
+        write_json(chunk_path, chunk, pretty=Config.PRETTY_JSON)
+
+
+def _count_dir(dir_path: str, chunked: bool) -> int:
+    """
+    Count the items of one data directory for get_stats().
+    
+    Args:
+        dir_path: Directory to count (missing directories count 0)
+        chunked: Count chunk files across sub-folders instead of .txt files
+    
+    Returns:
+        int: Number of items
+    """
+    listing = list_dir(dir_path)
+    
+    if chunked:
+        # Count chunk files across folders
+        return sum(
+            1
+            for folder in listing.dirs
+            for f in list_dir(os.path.join(dir_path, folder)).files if f.endswith('.json')
+        )
+    # Count .txt files
+    return sum(1 for f in listing.files if f.endswith('.txt'))
@@ -0,0 +1,45 @@
+"""
+=============================================================================
+Mozhii RAG Data Platform - Gunicorn Configuration
+=============================================================================
+Production server settings, picked up automatically when Gunicorn is
+started from the project root:
+
+    gunicorn run:app
+
+The application is imported once in the master and forked into the
+workers (preload), so configuration and module-level tables are loaded
+a single time. Per-process caches (directory listings, metadata) are
+filled independently by each worker.
+
+Environment overrides:
+    PORT               Port to bind (default 5000)
+    WEB_CONCURRENCY    Number of worker processes (default: CPU count)
+    GUNICORN_THREADS   Threads per worker (default 4)
+=============================================================================
+"""
+
+import os
+
+# -----------------------------------------------------------------------------
+# Server Socket
+# -----------------------------------------------------------------------------
+bind = f"0.0.0.0:{os.getenv('PORT', '5000')}"
+
+# -----------------------------------------------------------------------------
+# Workers
+# -----------------------------------------------------------------------------
+# Threaded workers: requests mostly wait on disk and HuggingFace I/O
+workers = int(os.getenv('WEB_CONCURRENCY', os.cpu_count() or 1))
+worker_class = 'gthread'
+threads = int(os.getenv('GUNICORN_THREADS', 4))
+
+# Import the app before forking workers
+preload_app = True
+
+# Keep worker heartbeat files off disk where /dev/shm is available
+if os.path.isdir('/dev/shm'):
+    worker_tmp_dir = '/dev/shm'
+
+# HuggingFace pushes of large folders can take a while
+timeout = 120
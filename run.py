@@ -6,7 +6,8 @@ This is the main entry point for the Flask application.
 Run this file to start the development server.
 
 Usage:
-    python run.py
+    python run.py          # development server
+    gunicorn run:app       # production (settings in gunicorn.conf.py)
 
 The server will start on http://localhost:5000 by default.
 =============================================================================
@@ -50,7 +51,7 @@ if __name__ == '__main__':
     print("=" * 60)
     
     # Start the Flask development server
-    # Note: In production, use a proper WSGI server like Gunicorn
+    # Note: In production, run `gunicorn run:app` (see gunicorn.conf.py)
     app.run(
         host='0.0.0.0',      # Allow external connections
         port=port,            # Port number
@@ -179,6 +179,21 @@ async function selectChunkingFile(filename) {
         item.classList.toggle('selected', item.dataset.filename === filename);
     });
     
+    // Fetch the file content on first selection (the list omits it)
+    if (file.content == null) {
+        try {
+            const response = await fetch(`/api/chunking/cleaned-files/${encodeURIComponent(filename)}/content`);
+            if (!response.ok) {
+                throw new Error(`HTTP error ${response.status}`);
+            }
+            file.content = await response.text();
+            file.content_length = file.content.length;
+        } catch (error) {
+            showToast('Error', `Failed to load file content: ${error.message}`, 'error');
+            return;
+        }
+    }
+    
     // Update source content display
     ChunkingElements.sourceContent.innerHTML = `
         <div class="tamil-text">${escapeHtml(file.content)}</div>
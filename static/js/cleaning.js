@@ -126,7 +126,7 @@ function renderCleaningFileList() {
             <span class="file-icon">📄</span>
             <div class="file-info">
                 <div class="file-name">${file.filename}</div>
-                <div class="file-meta">${file.language.toUpperCase()} • ${file.content_length.toLocaleString()} chars</div>
+                <div class="file-meta">${file.language.toUpperCase()} • ${file.content_length != null ? `${file.content_length.toLocaleString()} chars` : 'size unknown'}</div>
             </div>
             <span class="file-status ${file.cleaning_status}">${formatStatus(file.cleaning_status)}</span>
         </div>
@@ -167,6 +167,21 @@ async function selectCleaningFile(filename) {
         return;
     }
     
+    // Fetch the file content on first selection (the list omits it)
+    if (file.content == null) {
+        try {
+            const response = await fetch(`/api/cleaning/raw-files/${encodeURIComponent(filename)}/content`);
+            if (!response.ok) {
+                throw new Error(`HTTP error ${response.status}`);
+            }
+            file.content = await response.text();
+            file.content_length = file.content.length;
+        } catch (error) {
+            showToast('Error', `Failed to load file content: ${error.message}`, 'error');
+            return;
+        }
+    }
+    
     // Update state
     CleaningState.selectedFile = filename;
     CleaningState.selectedContent = file.content;